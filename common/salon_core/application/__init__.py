@@ -1,3 +1,11 @@
-﻿from salon_core.application.service import SalonAppService
+﻿from importlib import import_module
 
 __all__ = ["SalonAppService"]
+
+
+def __getattr__(name: str):
+    # Importing the package (e.g. for a repository) must not pull in the
+    # whole service and domain model; see lab1/benchmarks/startup.py.
+    if name == "SalonAppService":
+        return import_module("salon_core.application.service").SalonAppService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
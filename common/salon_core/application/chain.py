@@ -0,0 +1,151 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+from salon_core.application.errors.base import AppServiceError
+from salon_core.application.repositories.chain_repository import (
+    SalonChainRepository,
+    build_shard_repository,
+)
+from salon_core.application.service import SalonAppService
+from salon_core.utils.booking_status import BookingStatus
+
+DEFAULT_LOW_STOCK_THRESHOLD = 5
+
+
+@dataclass(frozen=True)
+class LowStockItem:
+    salon_id: str
+    item_name: str
+    amount: int
+
+
+@dataclass(frozen=True)
+class ChainReport:
+    salons: int
+    revenue: float
+    balance: float
+    bookings_by_status: dict[str, int]
+    low_stock: list[LowStockItem]
+    revenue_by_salon: dict[str, float]
+
+
+def shard_report(shard: tuple[str, str, str, str], low_stock_threshold: int) -> dict:
+    """
+    Partial report of one salon, run in a worker process. The shard is
+    (salon id, storage, path, name) so only that tuple is sent to the
+    worker and only the small aggregate dict comes back.
+    """
+    salon_id, storage, path, name = shard
+    salon = build_shard_repository(storage, path, name).load()
+    by_status = {status.value: 0 for status in BookingStatus}
+    revenue = 0.0
+    for booking in salon.get_all_bookings():
+        status = booking.get_status()
+        by_status[status.value] += 1
+        if status == BookingStatus.DONE:
+            revenue += booking.get_service().get_price()
+    return {
+        "salon_id": salon_id,
+        "revenue": revenue,
+        "balance": salon.check_balance(),
+        "bookings_by_status": by_status,
+        "low_stock": [
+            (salon_id, item.get_name(), item.get_amount())
+            for item in salon.get_inventory()
+            if item.get_amount() <= low_stock_threshold
+        ],
+    }
+
+
+def merge_shard_reports(partials: list[dict]) -> ChainReport:
+    by_status = {status.value: 0 for status in BookingStatus}
+    revenue_by_salon: dict[str, float] = {}
+    low_stock: list[LowStockItem] = []
+    balance = 0.0
+    for partial_report in partials:
+        revenue_by_salon[partial_report["salon_id"]] = partial_report["revenue"]
+        balance += partial_report["balance"]
+        for status, count in partial_report["bookings_by_status"].items():
+            by_status[status] += count
+        low_stock.extend(LowStockItem(*row) for row in partial_report["low_stock"])
+    low_stock.sort(key=lambda item: (item.amount, item.salon_id, item.item_name))
+    return ChainReport(
+        salons=len(partials),
+        revenue=sum(revenue_by_salon.values()),
+        balance=balance,
+        bookings_by_status=by_status,
+        low_stock=low_stock,
+        revenue_by_salon=revenue_by_salon,
+    )
+
+
+class SalonChain:
+    """
+    Application services for the salons of a chain, one shard each, and
+    chain-wide reports that fan out over the shards in a process pool.
+    """
+
+    def __init__(self, repository: SalonChainRepository) -> None:
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._services: dict[str, SalonAppService] = {}
+
+    def list_salons(self) -> list[dict]:
+        return [
+            {"id": entry["id"], "name": entry["name"], "storage": entry["storage"]}
+            for entry in self._repository.list_salons()
+        ]
+
+    def add_salon(self, salon_id: str, name: str, storage: str = "json") -> SalonAppService:
+        try:
+            self._repository.add_salon(salon_id, name, storage)
+        except ValueError as error:
+            raise AppServiceError(str(error)) from error
+        return self.service(salon_id)
+
+    def remove_salon(self, salon_id: str) -> None:
+        try:
+            self._repository.remove_salon(salon_id)
+        except KeyError:
+            raise AppServiceError(f"Unknown salon: {salon_id}") from None
+        with self._lock:
+            self._services.pop(salon_id, None)
+
+    def service(self, salon_id: str) -> SalonAppService:
+        with self._lock:
+            app_service = self._services.get(salon_id)
+            if app_service is None:
+                try:
+                    repository = self._repository.get(salon_id)
+                except KeyError:
+                    raise AppServiceError(f"Unknown salon: {salon_id}") from None
+                app_service = SalonAppService(repository)
+                self._services[salon_id] = app_service
+            return app_service
+
+    def report(
+        self,
+        low_stock_threshold: int = DEFAULT_LOW_STOCK_THRESHOLD,
+        max_workers: int | None = None,
+    ) -> ChainReport:
+        """
+        Revenue from done bookings, summed balances, bookings by status
+        and items at or below low_stock_threshold across all salons.
+        Each worker loads and aggregates its shards from disk, so saved
+        data is reported. max_workers=1 runs in this process.
+        """
+        shards = [
+            (entry["id"], entry["storage"], self._repository.shard_path(entry), entry["name"])
+            for entry in self._repository.list_salons()
+        ]
+        report_shard = partial(shard_report, low_stock_threshold=low_stock_threshold)
+        workers = min(max_workers or os.cpu_count() or 1, len(shards))
+        if workers <= 1:
+            return merge_shard_reports([report_shard(shard) for shard in shards])
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(shards) // (workers * 4))
+            partials = list(executor.map(report_shard, shards, chunksize=chunksize))
+        return merge_shard_reports(partials)
@@ -0,0 +1,106 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from salon_core.application.export import booking_to_row
+from salon_core.application.service import SalonAppService
+from salon_core.entities.salon import Salon
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    seq: int
+    stats: dict
+    new_bookings: list[dict]
+
+
+class SalonChangeFeed:
+    """
+    Fans committed salon changes out to waiting listeners.
+    Each save is diffed once against the previous state on the saving
+    thread; listeners only wait on the condition and read finished events.
+    """
+
+    def __init__(self, history: int = 256) -> None:
+        self._condition = threading.Condition()
+        self._events: deque[FeedEvent] = deque(maxlen=history)
+        self._seq = 0
+        self._stats: dict | None = None
+        self._bookings_count = 0
+        # Data version the stats were counted at; None once a save of this
+        # process moved them on, as publish() is not told the new version.
+        self._version: str | None = None
+        self._publishes = 0
+
+    def publish(self, salon: Salon) -> None:
+        stats = SalonAppService.dashboard_stats_for(salon)
+        bookings = salon.get_all_bookings()
+        with self._condition:
+            self._publishes += 1
+            self._version = None
+            if self._stats is None:
+                # Nobody has seen a state yet, so there is nothing to diff.
+                self._stats = stats
+                self._bookings_count = len(bookings)
+                return
+
+            changed = {
+                key: value
+                for key, value in stats.items()
+                if self._stats.get(key) != value
+            }
+            first_new = self._bookings_count
+            if len(bookings) < first_new:
+                first_new = 0
+            new_bookings = [booking_to_row(booking) for booking in bookings[first_new:]]
+            self._stats = stats
+            self._bookings_count = len(bookings)
+            if not changed and not new_bookings:
+                return
+
+            self._seq += 1
+            self._events.append(FeedEvent(self._seq, changed, new_bookings))
+            self._condition.notify_all()
+
+    def snapshot(self, app_service: SalonAppService) -> tuple[int, dict]:
+        """
+        Returns the current sequence and full stats for a new listener.
+        The stats are counted again unless they were taken at the stored
+        data version, so writes by other processes are not hidden.
+        """
+        version = app_service.get_data_version()
+        with self._condition:
+            if self._stats is not None and version is not None and version == self._version:
+                return self._seq, dict(self._stats)
+            publishes = self._publishes
+
+        stats = app_service.get_dashboard_stats()
+        bookings_count = len(app_service.list_bookings())
+        with self._condition:
+            if publishes == self._publishes:
+                # Otherwise a save published newer stats in the meantime.
+                self._stats = stats
+                self._bookings_count = bookings_count
+                self._version = version
+            return self._seq, dict(self._stats)
+
+    def wait_for_events(
+        self,
+        after_seq: int,
+        timeout: float,
+    ) -> list[FeedEvent] | None:
+        """
+        Blocks until there are events newer than after_seq or the timeout
+        passes. Returns None when after_seq can no longer be replayed and
+        the listener has to start from a fresh snapshot.
+        """
+        with self._condition:
+            if after_seq <= self._seq:
+                self._condition.wait_for(lambda: self._seq > after_seq, timeout)
+            if after_seq > self._seq:
+                return None
+            if after_seq == self._seq:
+                return []
+            if after_seq + 1 < self._events[0].seq:
+                return None
+            return [event for event in self._events if event.seq > after_seq]
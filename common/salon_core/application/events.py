@@ -0,0 +1,167 @@
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Base of the events SalonAppService publishes after a committed change."""
+
+
+@dataclass(frozen=True)
+class MasterHired(DomainEvent):
+    staff_index: int
+    name: str
+    age: int
+    specialization: str
+
+
+@dataclass(frozen=True)
+class MasterFired(DomainEvent):
+    staff_index: int
+    name: str
+    specialization: str
+
+
+@dataclass(frozen=True)
+class ProductSold(DomainEvent):
+    product_name: str
+    quantity: int
+    amount: float
+    remaining: int
+
+
+@dataclass(frozen=True)
+class ItemRestocked(DomainEvent):
+    name: str
+    amount: int
+    created: bool
+
+
+@dataclass(frozen=True)
+class ServiceAdded(DomainEvent):
+    service_index: int
+    name: str
+    price: float
+
+
+@dataclass(frozen=True)
+class ServiceRemoved(DomainEvent):
+    service_index: int
+    name: str
+
+
+@dataclass(frozen=True)
+class BookingCreated(DomainEvent):
+    booking_index: int
+    client_name: str
+    client_age: int
+    master_name: str
+    service_name: str
+    price: float
+    start: datetime | None
+    end: datetime | None
+
+
+@dataclass(frozen=True)
+class BookingCompleted(DomainEvent):
+    booking_index: int
+    client_name: str
+    master_name: str
+    service_name: str
+    price: float
+
+
+@dataclass(frozen=True)
+class BookingCancelled(DomainEvent):
+    booking_index: int
+    client_name: str
+    master_name: str
+    service_name: str
+
+
+@dataclass(frozen=True)
+class PaymentProcessed(DomainEvent):
+    amount: float
+    balance: float
+    source: str
+
+
+EventHandler = Callable[[DomainEvent], None]
+
+
+class DomainEventBus:
+    """
+    Hands published events to subscribers on the publishing thread, in
+    order. A failing subscriber is logged and does not stop the others,
+    because the change it reports is already saved.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: list[tuple[EventHandler, tuple[type, ...]]] = []
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        *event_types: type[DomainEvent],
+    ) -> Callable[[], None]:
+        """
+        Calls handler for every event, or only for the given types.
+        Returns a function that removes the subscription.
+        """
+        subscription = (handler, event_types or (DomainEvent,))
+        with self._lock:
+            self._subscribers.append(subscription)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+
+        return unsubscribe
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for handler, event_types in subscribers:
+                if not isinstance(event, event_types):
+                    continue
+                try:
+                    handler(event)
+                except Exception:
+                    logger.exception("Salon event handler failed on %r", event)
+
+    def deferred(self) -> "DeferredEventBus":
+        return DeferredEventBus(self)
+
+
+class DeferredEventBus(DomainEventBus):
+    """Holds published events until release() passes them to the parent bus."""
+
+    def __init__(self, parent: DomainEventBus) -> None:
+        super().__init__()
+        self._parent = parent
+        self._pending: list[DomainEvent] = []
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        *event_types: type[DomainEvent],
+    ) -> Callable[[], None]:
+        return self._parent.subscribe(handler, *event_types)
+
+    def publish(self, events: Iterable[DomainEvent]) -> None:
+        self._pending.extend(events)
+
+    def release(self) -> None:
+        events, self._pending = self._pending, []
+        self._parent.publish(events)
+
+    def discard(self) -> None:
+        self._pending = []
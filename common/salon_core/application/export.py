@@ -0,0 +1,69 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+from salon_core.entities.management.booking import Booking
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+BOOKING_EXPORT_FIELDS = (
+    "client_name",
+    "client_age",
+    "master_name",
+    "master_specialization",
+    "service_name",
+    "price",
+    "start",
+    "end",
+    "status",
+)
+
+
+class _LineBuffer:
+    """Pseudo-file for csv.writer: returns each row instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def booking_to_row(booking: Booking) -> dict:
+    client = booking.get_client()
+    master = booking.get_master()
+    service = booking.get_service()
+    start, end = booking.get_start(), booking.get_end()
+    return {
+        "client_name": client.get_name(),
+        "client_age": client.get_age(),
+        "master_name": master.get_name(),
+        "master_specialization": master.get_specialization().value,
+        "service_name": service.get_name(),
+        "price": service.get_price(),
+        "start": start.isoformat() if start else None,
+        "end": end.isoformat() if end else None,
+        "status": booking.get_status().value,
+    }
+
+
+def iter_booking_lines(
+    bookings: Iterable[Booking],
+    export_format: str,
+) -> Iterator[str]:
+    normalized = export_format.strip().lower()
+    if normalized == "csv":
+        return _iter_csv_lines(bookings)
+    if normalized == "jsonl":
+        return _iter_jsonl_lines(bookings)
+    raise ValueError(f"Unsupported export format: {export_format}")
+
+
+def _iter_csv_lines(bookings: Iterable[Booking]) -> Iterator[str]:
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(BOOKING_EXPORT_FIELDS)
+    for booking in bookings:
+        row = booking_to_row(booking)
+        yield writer.writerow([row[field] for field in BOOKING_EXPORT_FIELDS])
+
+
+def _iter_jsonl_lines(bookings: Iterable[Booking]) -> Iterator[str]:
+    for booking in bookings:
+        yield json.dumps(booking_to_row(booking), ensure_ascii=False) + "\n"
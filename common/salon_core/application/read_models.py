@@ -0,0 +1,77 @@
+import threading
+
+from salon_core.application.events import (
+    BookingCancelled,
+    BookingCompleted,
+    BookingCreated,
+    DomainEvent,
+    ItemRestocked,
+    MasterFired,
+    MasterHired,
+    PaymentProcessed,
+    ServiceAdded,
+    ServiceRemoved,
+)
+from salon_core.application.service import SalonAppService
+
+
+class DashboardCounters:
+    """
+    Dashboard stats kept up to date from domain events instead of being
+    recounted over every booking on each read. The counters are seeded
+    from a full count and counted again when the stored data version is
+    one no event led to, e.g. after a write by another process, and after
+    a master or service is removed, as its bookings are not kept on load.
+    """
+
+    def __init__(self, app_service: SalonAppService) -> None:
+        self._app_service = app_service
+        self._lock = threading.Lock()
+        self._stats: dict | None = None
+        self._version: str | None = None
+        self.unsubscribe = app_service.subscribe(self._apply)
+
+    def get(self, app_service: SalonAppService | None = None) -> dict:
+        """
+        Returns the stats. app_service may be a snapshot of the subscribed
+        service that the caller already reads from.
+        """
+        app_service = app_service or self._app_service
+        version = app_service.get_data_version()
+        with self._lock:
+            if self._stats is not None and version == self._version:
+                return dict(self._stats)
+
+        stats = app_service.get_dashboard_stats()
+        with self._lock:
+            self._stats = stats
+            self._version = version
+            return dict(stats)
+
+    def _apply(self, event: DomainEvent) -> None:
+        version = self._app_service.get_data_version()
+        with self._lock:
+            if self._stats is None:
+                return
+            stats = self._stats
+            if isinstance(event, (MasterFired, ServiceRemoved)):
+                self._stats = None
+                return
+            if isinstance(event, MasterHired):
+                stats["staff_count"] += 1
+            elif isinstance(event, ItemRestocked) and event.created:
+                stats["inventory_count"] += 1
+            elif isinstance(event, ServiceAdded):
+                stats["services_count"] += 1
+            elif isinstance(event, BookingCreated):
+                stats["bookings_total"] += 1
+                stats["bookings_confirmed"] += 1
+            elif isinstance(event, BookingCompleted):
+                stats["bookings_confirmed"] -= 1
+                stats["bookings_done"] += 1
+            elif isinstance(event, BookingCancelled):
+                stats["bookings_confirmed"] -= 1
+                stats["bookings_cancelled"] += 1
+            elif isinstance(event, PaymentProcessed):
+                stats["balance"] = event.balance
+            self._version = version
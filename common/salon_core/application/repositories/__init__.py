@@ -1,4 +1,22 @@
-﻿from salon_core.application.repositories.base import SalonRepository
-from salon_core.application.repositories.json_repository import JsonSalonRepository
+﻿from importlib import import_module
 
-__all__ = ["SalonRepository", "JsonSalonRepository"]
+_EXPORTS = {
+    "SalonRepository": "base",
+    "BatchSalonRepository": "batch_repository",
+    "CachedSalonRepository": "cached_repository",
+    "SalonChainRepository": "chain_repository",
+    "EventSourcedSalonRepository": "event_sourced_repository",
+    "JsonSalonRepository": "json_repository",
+    "NotifyingSalonRepository": "notifying_repository",
+    "ReplicaSalonRepository": "replica_repository",
+    "SnapshotSalonRepository": "snapshot_repository",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f"{__name__}.{_EXPORTS[name]}")
+    return getattr(module, name)
@@ -1,13 +1,41 @@
 ﻿from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING
 
-from salon_core.entities.salon import Salon
+if TYPE_CHECKING:
+    from salon_core.entities.salon import Salon
 
 
 class SalonRepository(ABC):
     @abstractmethod
-    def load(self) -> Salon:
+    def load(self) -> "Salon":
         pass
 
     @abstractmethod
-    def save(self, salon: Salon) -> None:
+    def save(self, salon: "Salon") -> None:
         pass
+
+    def load_name(self) -> str:
+        """Salon name only; storages may answer it without a full load."""
+        return self.load().get_name()
+
+    def load_for_update(self) -> "Salon":
+        """
+        Returns a salon the caller may mutate and pass to save(). The
+        update ends with save(), invalidate() or release().
+        """
+        return self.load()
+
+    def get_version(self) -> str | None:
+        """Token that changes whenever the stored salon changes."""
+        return None
+
+    def get_last_modified(self) -> datetime | None:
+        """Time of the last stored change, if the storage tracks it."""
+        return None
+
+    def release(self) -> None:
+        """Ends a load_for_update() that is not followed by save()."""
+
+    def invalidate(self) -> None:
+        """Drops any cached state after a failed mutation."""
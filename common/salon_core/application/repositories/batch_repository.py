@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from salon_core.application.errors.base import AppServiceError
+from salon_core.application.repositories.base import SalonRepository
+
+if TYPE_CHECKING:
+    from salon_core.entities.salon import Salon
+
+
+class BatchSalonRepository(SalonRepository):
+    """
+    Write-behind repository for one batch: the salon is loaded once, every
+    save only keeps it in memory and flush() writes it to the wrapped
+    repository a single time.
+    """
+
+    def __init__(self, repository: SalonRepository) -> None:
+        self._repository = repository
+        self._salon: "Salon | None" = None
+        self._dirty = False
+        self._aborted = False
+
+    def load(self) -> "Salon":
+        if self._aborted:
+            raise AppServiceError("Batch was aborted by an earlier error")
+        if self._salon is None:
+            self._salon = self._repository.load_for_update()
+        return self._salon
+
+    def load_name(self) -> str:
+        if self._salon is not None:
+            return self._salon.get_name()
+        return self._repository.load_name()
+
+    def load_for_update(self) -> "Salon":
+        return self.load()
+
+    def save(self, salon: "Salon") -> None:
+        self._salon = salon
+        self._dirty = True
+
+    def get_version(self) -> str | None:
+        return self._repository.get_version()
+
+    def get_last_modified(self) -> datetime | None:
+        return self._repository.get_last_modified()
+
+    def invalidate(self) -> None:
+        # A failed action may have half-applied changes to the shared salon,
+        # so the whole batch is unusable after it.
+        self.discard()
+        self._aborted = True
+
+    def discard(self) -> None:
+        self._salon = None
+        self._dirty = False
+
+    def flush(self) -> bool:
+        if self._aborted:
+            raise AppServiceError("Batch was aborted by an earlier error")
+        if not self._dirty:
+            if self._salon is not None:
+                self._repository.release()
+            return False
+        self._repository.save(self._salon)
+        self._dirty = False
+        return True
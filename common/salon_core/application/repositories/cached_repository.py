@@ -0,0 +1,56 @@
+import threading
+from datetime import datetime
+
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.entities.salon import Salon
+
+
+class CachedSalonRepository(SalonRepository):
+    """
+    Thread-safe, process-wide cache over another repository.
+    Readers share one loaded salon while its stored version is unchanged,
+    so external writers are noticed. Writers always get a private fresh
+    copy and publish it on save, so shared readers never see a
+    half-applied mutation.
+    """
+
+    def __init__(self, repository: SalonRepository) -> None:
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._salon: Salon | None = None
+        self._version: str | None = None
+
+    def load(self) -> Salon:
+        with self._lock:
+            version = self._repository.get_version()
+            if self._salon is None or version is None or version != self._version:
+                self._salon = self._repository.load()
+                self._version = version
+            return self._salon
+
+    def load_name(self) -> str:
+        return self._repository.load_name()
+
+    def load_for_update(self) -> Salon:
+        return self._repository.load_for_update()
+
+    def save(self, salon: Salon) -> None:
+        with self._lock:
+            self._repository.save(salon)
+            self._salon = salon
+            self._version = self._repository.get_version()
+
+    def get_version(self) -> str | None:
+        return self._repository.get_version()
+
+    def get_last_modified(self) -> datetime | None:
+        return self._repository.get_last_modified()
+
+    def release(self) -> None:
+        self._repository.release()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._salon = None
+            self._version = None
+        self._repository.invalidate()
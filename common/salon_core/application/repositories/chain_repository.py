@@ -0,0 +1,104 @@
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+
+REGISTRY_NAME = "registry.json"
+SHARD_STORAGES = ("json", "events")
+_SALON_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def build_shard_repository(storage: str, path: str, name: str) -> SalonRepository:
+    """Opens one salon's storage; also used by report worker processes."""
+    if storage == "json":
+        return JsonSalonRepository(path, default_salon_name=name)
+    if storage == "events":
+        from salon_core.application.repositories.event_sourced_repository import (
+            EventSourcedSalonRepository,
+        )
+
+        return EventSourcedSalonRepository(path, default_salon_name=name)
+    raise ValueError(f"Unknown shard storage: {storage}")
+
+
+class SalonChainRepository:
+    """
+    Registry of the salons of a chain, one shard per salon. registry.json
+    in the chain directory maps salon ids to a name, a storage kind and a
+    path relative to the directory: a JSON file or an event log directory.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self._directory = Path(directory)
+        self._registry_path = self._directory / REGISTRY_NAME
+        self._lock = threading.Lock()
+        self._repositories: dict[str, SalonRepository] = {}
+
+    def _read_registry(self) -> dict[str, dict]:
+        if not self._registry_path.exists():
+            return {}
+        with open(self._registry_path, encoding="utf-8") as registry_file:
+            return {entry["id"]: entry for entry in json.load(registry_file)["salons"]}
+
+    def _write_registry(self, entries: dict[str, dict]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self._registry_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as registry_file:
+            json.dump(
+                {"salons": list(entries.values())},
+                registry_file,
+                indent=4,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, self._registry_path)
+
+    def list_salons(self) -> list[dict]:
+        """Registry entries: id, name, storage and path."""
+        with self._lock:
+            return list(self._read_registry().values())
+
+    def shard_path(self, entry: dict) -> str:
+        return str(self._directory / entry["path"])
+
+    def add_salon(self, salon_id: str, name: str, storage: str = "json") -> SalonRepository:
+        if not _SALON_ID.fullmatch(salon_id):
+            raise ValueError("Salon id may only use letters, digits, '-' and '_'")
+        if storage not in SHARD_STORAGES:
+            raise ValueError(f"Unknown shard storage: {storage}")
+        with self._lock:
+            entries = self._read_registry()
+            if salon_id in entries:
+                raise ValueError(f"Salon {salon_id} already exists")
+            path = f"salons/{salon_id}.json" if storage == "json" else f"salons/{salon_id}"
+            entries[salon_id] = {"id": salon_id, "name": name, "storage": storage, "path": path}
+            self._write_registry(entries)
+        return self.get(salon_id)
+
+    def remove_salon(self, salon_id: str) -> None:
+        """Drops the salon from the registry; its data stays on disk."""
+        with self._lock:
+            entries = self._read_registry()
+            if salon_id not in entries:
+                raise KeyError(salon_id)
+            del entries[salon_id]
+            self._write_registry(entries)
+            self._repositories.pop(salon_id, None)
+
+    def get(self, salon_id: str) -> SalonRepository:
+        with self._lock:
+            repository = self._repositories.get(salon_id)
+            if repository is None:
+                entry = self._read_registry().get(salon_id)
+                if entry is None:
+                    raise KeyError(salon_id)
+                repository = build_shard_repository(
+                    entry["storage"],
+                    self.shard_path(entry),
+                    entry["name"],
+                )
+                self._repositories[salon_id] = repository
+            return repository
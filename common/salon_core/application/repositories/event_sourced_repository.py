@@ -0,0 +1,587 @@
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_core.entities.inventory.inventory_item import InventoryItem
+from salon_core.entities.management.booking import Booking
+from salon_core.entities.management.client import Client
+from salon_core.entities.management.master import Master
+from salon_core.entities.salon import Salon
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+from salon_core.entities.services.hair_service import HairService
+from salon_core.entities.services.service import Service
+from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.file_lock import FileLock
+from salon_core.utils.masters_specialization import MastersSpecialization
+
+LOG_NAME = "events.log"
+LOCK_NAME = "events.lock"
+SNAPSHOT_GLOB = "snapshot-*.json"
+COMPACT_JSON = {"separators": (",", ":"), "ensure_ascii": False}
+REPLAY_CHUNK_BYTES = 1 << 20
+STATUSES = {status.value: status for status in BookingStatus}
+
+
+def _iso(moment: datetime | None) -> str | None:
+    return moment.isoformat() if moment is not None else None
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+class SalonEventState:
+    """
+    A salon plus registries that give every master, item, service and
+    booking a stable number, so events can refer to them. apply() replays
+    one logged event; diff() turns the changes made to the salon since the
+    last call into events.
+
+    Events are lists: [seq, kind, *args]. The kinds are master, hire, fire,
+    item, amount, service, offer, withdraw, booking, status, balance and
+    reset, which carries a whole state from to_dict().
+    """
+
+    def __init__(self, name: str) -> None:
+        self._clear(Salon(name))
+        self._appliers = {
+            "master": self._apply_master,
+            "hire": self._apply_hire,
+            "fire": self._apply_fire,
+            "item": self._apply_item,
+            "amount": self._apply_amount,
+            "service": self._apply_service,
+            "offer": self._apply_offer,
+            "withdraw": self._apply_withdraw,
+            "booking": self._apply_booking,
+            "status": self._apply_status,
+            "balance": self._apply_balance,
+            "reset": self._apply_reset,
+        }
+
+    def _clear(self, salon: Salon) -> None:
+        self.salon = salon
+        self._masters: list[Master] = []
+        self._master_numbers: dict[int, int] = {}
+        self._staff: list[int] = []
+        self._items: list[InventoryItem] = []
+        self._amounts: list[int] = []
+        self._item_numbers: dict[int, int] = {}
+        self._services: list[Service] = []
+        self._service_numbers: dict[int, int] = {}
+        self._offered: list[int] = []
+        self._bookings: list[Booking] = []
+        # Positions of confirmed bookings, the only ones whose status can change.
+        self._open: set[int] = set()
+        self._balance = salon.check_balance()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SalonEventState":
+        state = cls(data["name"])
+        state._apply_reset(data)
+        return state
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.salon.get_name(),
+            "balance": self._balance,
+            "masters": [
+                [master.get_name(), master.get_age(), master.get_specialization().value]
+                for master in self._masters
+            ],
+            "staff": list(self._staff),
+            "items": [self._item_row(item) for item in self._items],
+            "services": [self._service_row(service) for service in self._services],
+            "offered": list(self._offered),
+            "bookings": [self._booking_row(booking) for booking in self._bookings],
+        }
+
+    def apply(self, event: list) -> None:
+        self._appliers[event[1]](*event[2:])
+
+    # Rows shared by events and snapshots.
+
+    def _item_row(self, item: InventoryItem) -> list:
+        if isinstance(item, Cosmetics):
+            kind, price = "cosmetics", item.get_price()
+        else:
+            kind, price = "equipment", None
+        return [kind, item.get_name(), item.get_description(), item.get_amount(), price]
+
+    def _service_row(self, service: Service) -> list:
+        kind = "hair" if isinstance(service, HairService) else "cosmetic"
+        resources = [
+            self._item_numbers[id(item)]
+            for item in service.get_equipment()
+            if id(item) in self._item_numbers
+        ]
+        return [kind, service.get_name(), service.get_price(), resources]
+
+    def _booking_row(self, booking: Booking) -> list:
+        client = booking.get_client()
+        return [
+            client.get_name(),
+            client.get_age(),
+            self._master_numbers[id(booking.get_master())],
+            self._service_numbers[id(booking.get_service())],
+            booking.get_status().value,
+            _iso(booking.get_start()),
+            _iso(booking.get_end()),
+        ]
+
+    # Registries. They hold the objects, so the ids used as keys stay unique.
+
+    def _remember_master(self, master: Master) -> None:
+        self._master_numbers[id(master)] = len(self._masters)
+        self._masters.append(master)
+
+    def _remember_item(self, item: InventoryItem) -> None:
+        self._item_numbers[id(item)] = len(self._items)
+        self._items.append(item)
+        self._amounts.append(item.get_amount())
+
+    def _remember_service(self, service: Service) -> None:
+        self._service_numbers[id(service)] = len(self._services)
+        self._services.append(service)
+
+    def _remember_booking(self, booking: Booking) -> None:
+        if booking.get_status() == BookingStatus.CONFIRMED:
+            self._open.add(len(self._bookings))
+        self._bookings.append(booking)
+
+    # Replay.
+
+    def _apply_master(self, name: str, age: int, specialization: str) -> None:
+        self._remember_master(Master(name, age, MastersSpecialization(specialization)))
+
+    def _apply_hire(self, number: int) -> None:
+        self.salon.hire_staff(self._masters[number])
+        self._staff.append(number)
+
+    def _apply_fire(self, number: int) -> None:
+        self.salon.fire_staff(self._masters[number])
+        self._staff.remove(number)
+
+    def _apply_item(
+        self,
+        kind: str,
+        name: str,
+        description: str,
+        amount: int,
+        price: float | None,
+    ) -> None:
+        if kind == "cosmetics":
+            item = Cosmetics(name, price, description, amount)
+        else:
+            item = HairdressingEquipment(name, description, amount)
+        self.salon.add_to_inventory(item)
+        self._remember_item(item)
+
+    def _apply_amount(self, position: int, amount: int) -> None:
+        self._items[position].set_amount(amount)
+        self._amounts[position] = amount
+
+    def _apply_service(
+        self,
+        kind: str,
+        name: str,
+        price: float,
+        resources: list[int],
+    ) -> None:
+        items = [self._items[number] for number in resources]
+        if kind == "hair":
+            service = HairService(name, price, items)
+        else:
+            service = CosmeticProcedure(name, price, items)
+        self._remember_service(service)
+
+    def _apply_offer(self, number: int) -> None:
+        self.salon.add_service(self._services[number])
+        self._offered.append(number)
+
+    def _apply_withdraw(self, number: int) -> None:
+        self.salon.remove_service(self._services[number])
+        self._offered.remove(number)
+
+    def _apply_booking(
+        self,
+        client_name: str,
+        client_age: int,
+        master: int,
+        service: int,
+        status: str,
+        start: str | None,
+        end: str | None,
+    ) -> None:
+        booking = Booking(
+            Client(client_name, client_age),
+            self._services[service],
+            self._masters[master],
+            STATUSES[status],
+            _parse_time(start),
+            _parse_time(end),
+        )
+        self.salon.get_reception().add_booking(booking)
+        self._remember_booking(booking)
+
+    def _apply_status(self, position: int, status: str) -> None:
+        booking = self._bookings[position]
+        new_status = STATUSES[status]
+        if new_status == BookingStatus.CANCELLED:
+            booking.get_master().get_schedule().remove(booking)
+        booking.set_status(new_status)
+        if new_status == BookingStatus.CONFIRMED:
+            self._open.add(position)
+        else:
+            self._open.discard(position)
+
+    def _apply_balance(self, balance: float) -> None:
+        self.salon.get_reception().set_balance(balance)
+        self._balance = balance
+
+    def _apply_reset(self, data: dict) -> None:
+        self._clear(Salon(data["name"]))
+        for row in data["masters"]:
+            self._apply_master(*row)
+        for number in data["staff"]:
+            self._apply_hire(number)
+        for row in data["items"]:
+            self._apply_item(*row)
+        for row in data["services"]:
+            self._apply_service(*row)
+        for number in data["offered"]:
+            self._apply_offer(number)
+        for row in data["bookings"]:
+            self._apply_booking(*row)
+        self._apply_balance(data["balance"])
+
+    # Diff.
+
+    def adopt(self, salon: Salon) -> list[list]:
+        """Takes over a salon this state did not build, as one reset event."""
+        self._clear(salon)
+        bookings = salon.get_all_bookings()
+        for master in salon.get_staff():
+            self._remember_master(master)
+        for booking in bookings:
+            if id(booking.get_master()) not in self._master_numbers:
+                self._remember_master(booking.get_master())
+        self._staff = list(range(len(salon.get_staff())))
+        for item in salon.get_inventory():
+            self._remember_item(item)
+        for service in salon.get_services():
+            self._remember_service(service)
+        for booking in bookings:
+            if id(booking.get_service()) not in self._service_numbers:
+                self._remember_service(booking.get_service())
+        self._offered = list(range(len(salon.get_services())))
+        for booking in bookings:
+            self._remember_booking(booking)
+        return [["reset", self.to_dict()]]
+
+    @staticmethod
+    def _sync(
+        current: list[int],
+        wanted: list[int],
+        add: str,
+        remove: str,
+        events: list[list],
+    ) -> None:
+        wanted_set = set(wanted)
+        kept = [number for number in current if number in wanted_set]
+        if wanted[: len(kept)] != kept:
+            kept = []
+        kept_set = set(kept)
+        events.extend([remove, number] for number in current if number not in kept_set)
+        events.extend([add, number] for number in wanted[len(kept):])
+        current[:] = wanted
+
+    def _note_master(self, master: Master, events: list[list]) -> int:
+        if id(master) not in self._master_numbers:
+            self._remember_master(master)
+            events.append(
+                ["master", master.get_name(), master.get_age(), master.get_specialization().value]
+            )
+        return self._master_numbers[id(master)]
+
+    def _note_service(self, service: Service, events: list[list]) -> int:
+        if id(service) not in self._service_numbers:
+            events.append(["service", *self._service_row(service)])
+            self._remember_service(service)
+        return self._service_numbers[id(service)]
+
+    def diff(self, salon: Salon) -> list[list]:
+        if salon is not self.salon:
+            return self.adopt(salon)
+
+        inventory = salon.get_inventory()
+        bookings = salon.get_all_bookings()
+        if (
+            len(inventory) < len(self._items)
+            or len(bookings) < len(self._bookings)
+            or any(item is not known for item, known in zip(inventory, self._items))
+        ):
+            # Only appends are expected; anything else is logged as a reset.
+            return self.adopt(salon)
+
+        events: list[list] = []
+        staff = [self._note_master(master, events) for master in salon.get_staff()]
+        self._sync(self._staff, staff, "hire", "fire", events)
+
+        for position, item in enumerate(inventory):
+            if position == len(self._items):
+                events.append(["item", *self._item_row(item)])
+                self._remember_item(item)
+            elif item.get_amount() != self._amounts[position]:
+                self._amounts[position] = item.get_amount()
+                events.append(["amount", position, item.get_amount()])
+
+        offered = [self._note_service(service, events) for service in salon.get_services()]
+        self._sync(self._offered, offered, "offer", "withdraw", events)
+
+        for position in sorted(self._open):
+            status = bookings[position].get_status()
+            if status != BookingStatus.CONFIRMED:
+                self._open.discard(position)
+                events.append(["status", position, status.value])
+        for booking in bookings[len(self._bookings):]:
+            self._note_master(booking.get_master(), events)
+            self._note_service(booking.get_service(), events)
+            events.append(["booking", *self._booking_row(booking)])
+            self._remember_booking(booking)
+
+        balance = salon.check_balance()
+        if balance != self._balance:
+            self._balance = balance
+            events.append(["balance", balance])
+        return events
+
+
+class EventSourcedSalonRepository(SalonRepository):
+    """
+    Keeps the salon as an append-only log of change events in a directory,
+    with a snapshot written every `snapshot_every` events. save() appends
+    only what changed since the last save; load() starts from the newest
+    snapshot and replays the rest of the log, and load_at() rebuilds the
+    salon as it was right after any logged event. Writers in several
+    processes share the log: load_for_update() locks it until save(), so
+    every change is diffed against the events other writers appended.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        snapshot_every: int = 1000,
+        default_salon_name: str = "New Salon",
+    ) -> None:
+        if snapshot_every <= 0:
+            raise ValueError("snapshot_every must be positive")
+        self._directory = Path(directory)
+        self._log_path = self._directory / LOG_NAME
+        self._snapshot_every = snapshot_every
+        self._default_salon_name = default_salon_name
+        self._write_lock = FileLock(str(self._directory / LOCK_NAME))
+        self._state: SalonEventState | None = None
+        self._seq = 0
+        self._offset = 0
+        self._snapshot_seq = 0
+
+    def _snapshots(self) -> list[tuple[int, Path]]:
+        snapshots = [
+            (int(path.stem.split("-")[1]), path)
+            for path in self._directory.glob(SNAPSHOT_GLOB)
+        ]
+        snapshots.sort()
+        return snapshots
+
+    def _log_size(self) -> int:
+        try:
+            return self._log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _restore(self, until: int | None = None) -> tuple[SalonEventState, int, int]:
+        state = SalonEventState(self._default_salon_name)
+        seq = offset = 0
+        for snapshot_seq, path in reversed(self._snapshots()):
+            if until is None or snapshot_seq <= until:
+                with open(path, encoding="utf-8") as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+                state = SalonEventState.from_dict(snapshot["state"])
+                seq, offset = snapshot["seq"], snapshot["offset"]
+                break
+        seq, offset = self._replay(state, seq, offset, until)
+        return state, seq, offset
+
+    def _replay(
+        self,
+        state: SalonEventState,
+        seq: int,
+        offset: int,
+        until: int | None = None,
+    ) -> tuple[int, int]:
+        if not self._log_path.exists():
+            return seq, offset
+        apply = state.apply
+        with open(self._log_path, "rb") as log_file:
+            log_file.seek(offset)
+            while lines := log_file.readlines(REPLAY_CHUNK_BYTES):
+                torn = not lines[-1].endswith(b"\n")
+                if torn:
+                    # A writer still appending, or one that crashed in the
+                    # middle of save(), leaves a torn last line.
+                    lines.pop()
+                # One json.loads() per chunk is several times cheaper than
+                # one per line.
+                events = json.loads(b"[" + b",".join(lines) + b"]")
+                for index, event in enumerate(events):
+                    if until is not None and event[0] > until:
+                        return seq, offset + sum(map(len, lines[:index]))
+                    if event[0] != seq + 1:
+                        raise ValueError(f"Event {seq + 1} is missing from {self._log_path}")
+                    apply(event)
+                    seq = event[0]
+                offset += sum(map(len, lines))
+                if torn:
+                    break
+        return seq, offset
+
+    def load(self) -> Salon:
+        if self._state is None:
+            self._state, self._seq, self._offset = self._restore()
+            snapshots = self._snapshots()
+            self._snapshot_seq = snapshots[-1][0] if snapshots else 0
+        elif self._log_size() != self._offset:
+            # Another writer appended to the log since our last look.
+            try:
+                self._seq, self._offset = self._replay(self._state, self._seq, self._offset)
+            except Exception:
+                self._state = None
+                raise
+        return self._state.salon
+
+    def load_for_update(self) -> Salon:
+        """
+        Locks the log, so no other writer appends until save(),
+        invalidate() or release(), and catches up with it.
+        """
+        if not self._write_lock.is_held():
+            self._write_lock.acquire()
+        try:
+            salon = self.load()
+            self._drop_torn_tail()
+        except BaseException:
+            self.invalidate()
+            raise
+        return salon
+
+    def _drop_torn_tail(self) -> None:
+        # Under the write lock nobody is appending, so bytes past the last
+        # whole event are left by a writer that crashed.
+        if self._log_size() > self._offset:
+            with open(self._log_path, "r+b") as log_file:
+                log_file.truncate(self._offset)
+
+    def load_name(self) -> str:
+        if self._state is not None:
+            return self._state.salon.get_name()
+        snapshots = self._snapshots()
+        if snapshots:
+            with open(snapshots[-1][1], encoding="utf-8") as snapshot_file:
+                return json.load(snapshot_file)["state"]["name"]
+        if self._log_path.exists():
+            with open(self._log_path, "rb") as log_file:
+                first = log_file.readline()
+            if first.endswith(b"\n"):
+                event = json.loads(first)
+                if event[1] == "reset":
+                    return event[2]["name"]
+            return self.load().get_name()
+        return self._default_salon_name
+
+    def load_at(self, seq: int) -> Salon:
+        """The salon as it was right after event `seq` (0 is before any)."""
+        if seq < 0:
+            raise ValueError("Event number cannot be negative")
+        state, last_seq, _ = self._restore(until=seq)
+        if last_seq < seq:
+            raise ValueError(f"The log has only {last_seq} events")
+        return state.salon
+
+    def get_event_count(self) -> int:
+        self.load()
+        return self._seq
+
+    def save(self, salon: Salon) -> None:
+        if not self._write_lock.is_held():
+            self._write_lock.acquire()
+        try:
+            if self._state is not None and self._log_size() != self._offset:
+                # Loaded without load_for_update() and another writer has
+                # appended since: the changes cannot be diffed against that
+                # tail, so the salon is stored whole.
+                self._state = None
+            self.load()
+            self._drop_torn_tail()
+            self._append(salon)
+        finally:
+            self._write_lock.release()
+
+    def _append(self, salon: Salon) -> None:
+        if self._seq == 0:
+            # The first event names the salon, so replays never depend on
+            # default_salon_name.
+            events = self._state.adopt(salon)
+        else:
+            events = self._state.diff(salon)
+        if not events:
+            return
+
+        lines = []
+        for event in events:
+            self._seq += 1
+            lines.append(json.dumps([self._seq, *event], **COMPACT_JSON) + "\n")
+        data = "".join(lines).encode("utf-8")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with open(self._log_path, "ab") as log_file:
+            log_file.write(data)
+            log_file.flush()
+            os.fsync(log_file.fileno())
+        self._offset += len(data)
+
+        if self._seq - self._snapshot_seq >= self._snapshot_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Writes a snapshot of the current state; load() starts from it."""
+        self.load()
+        snapshot = {"seq": self._seq, "offset": self._offset, "state": self._state.to_dict()}
+        path = self._directory / f"snapshot-{self._seq:012d}.json"
+        temp_path = path.with_suffix(".tmp")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump(snapshot, snapshot_file, **COMPACT_JSON)
+        os.replace(temp_path, path)
+        self._snapshot_seq = self._seq
+
+    def get_version(self) -> str | None:
+        size = self._log_size()
+        return f"es-{size:x}" if size else None
+
+    def get_last_modified(self) -> datetime | None:
+        try:
+            mtime = self._log_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        return datetime.fromtimestamp(mtime, tz=timezone.utc)
+
+    def release(self) -> None:
+        self._write_lock.release()
+
+    def invalidate(self) -> None:
+        self._state = None
+        self._write_lock.release()
@@ -1,25 +1,81 @@
-﻿from pathlib import Path
+﻿from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from salon_core.application.repositories.base import SalonRepository
-from salon_core.entities.salon import Salon
 from salon_core.utils.data_manager import SalonDataManager
 
+if TYPE_CHECKING:
+    from salon_core.entities.salon import Salon
+
 
 class JsonSalonRepository(SalonRepository):
+    """
+    Salon in one file. data_format picks how saves are written ("json",
+    "json-compact", "orjson" or "json-gzip"); loads accept any of them.
+    With replica_dir every save is also shipped there, on a background
+    thread, for read-only ReplicaSalonRepository readers.
+    """
+
     def __init__(
         self,
         file_path: str,
         default_salon_name: str = "New Salon",
+        data_format: str = "json",
+        replica_dir: str | None = None,
     ) -> None:
         self._path = Path(file_path)
         self._default_salon_name = default_salon_name
-        self._data_manager = SalonDataManager(str(self._path))
+        self._data_manager = SalonDataManager(str(self._path), data_format)
+        self._shipper = None
+        if replica_dir is not None:
+            from salon_core.application.repositories.replica_repository import (
+                ReplicaShipper,
+            )
+
+            self._shipper = ReplicaShipper(replica_dir)
 
-    def load(self) -> Salon:
+    def load(self) -> "Salon":
         if not self._path.exists():
+            from salon_core.entities.salon import Salon
+
             return Salon(self._default_salon_name)
         return self._data_manager.load()
 
-    def save(self, salon: Salon) -> None:
+    def load_name(self) -> str:
+        if not self._path.exists():
+            return self._default_salon_name
+        return self._data_manager.load_name()
+
+    def save(self, salon: "Salon") -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._data_manager.save(salon)
+        raw = self._data_manager.save(salon)
+        if self._shipper is not None:
+            self._shipper.submit(raw)
+
+    def wait_for_replica(self, timeout: float | None = None) -> bool:
+        """Waits until the saves so far were shipped to the replica."""
+        if self._shipper is None:
+            return True
+        return self._shipper.wait(timeout)
+
+    def get_version(self) -> str | None:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return None
+        version = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        # Two saves of the same size within one mtime tick only differ in
+        # content. The checksum is written after the data, so a version
+        # read in between is the old one and only costs a reload later.
+        digest = self._data_manager.saved_digest()
+        if digest is not None:
+            version = f"{version}-{digest[:16]}"
+        return version
+
+    def get_last_modified(self) -> datetime | None:
+        try:
+            mtime = self._path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        return datetime.fromtimestamp(mtime, tz=timezone.utc)
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Callable
+
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.entities.salon import Salon
+
+
+class NotifyingSalonRepository(SalonRepository):
+    """
+    Calls every listener with the salon after each successful save.
+    Listeners run on the saving thread, so they must be quick.
+    """
+
+    def __init__(self, repository: SalonRepository) -> None:
+        self._repository = repository
+        self._listeners: list[Callable[[Salon], None]] = []
+
+    def add_listener(self, listener: Callable[[Salon], None]) -> None:
+        self._listeners.append(listener)
+
+    def load(self) -> Salon:
+        return self._repository.load()
+
+    def load_name(self) -> str:
+        return self._repository.load_name()
+
+    def load_for_update(self) -> Salon:
+        return self._repository.load_for_update()
+
+    def save(self, salon: Salon) -> None:
+        self._repository.save(salon)
+        for listener in self._listeners:
+            listener(salon)
+
+    def get_version(self) -> str | None:
+        return self._repository.get_version()
+
+    def get_last_modified(self) -> datetime | None:
+        return self._repository.get_last_modified()
+
+    def release(self) -> None:
+        self._repository.release()
+
+    def invalidate(self) -> None:
+        self._repository.invalidate()
@@ -0,0 +1,201 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from salon_core.application.errors.base import AppServiceError
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.entities.salon import Salon
+from salon_core.utils.data_manager import SalonDataManager
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "MANIFEST.json"
+
+
+def _snapshot_name(seq: int) -> str:
+    return f"snapshot-{seq:012d}.salon"
+
+
+def read_manifest(directory: Path) -> dict | None:
+    try:
+        with open(directory / MANIFEST_NAME, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return None
+
+
+class ReplicaShipper:
+    """
+    Publishes committed salon files into a replica directory. Every
+    shipped save becomes a numbered snapshot file with its checksum;
+    MANIFEST.json is then replaced to point at it, so readers only ever
+    see complete snapshots. The newest `keep` snapshots are kept, which
+    gives readers still opening an older one time to finish.
+    """
+
+    def __init__(self, directory: str, keep: int = 3) -> None:
+        if keep < 2:
+            raise ValueError("A replica must keep at least two snapshots")
+        self._directory = Path(directory)
+        self._keep = keep
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._pending: bytes | None = None
+        self._worker: threading.Thread | None = None
+
+    def submit(self, raw: bytes) -> None:
+        """
+        Ships raw on a background thread and returns at once. A save that
+        arrives while another is shipped replaces any still waiting, so
+        only the newest is shipped next. Failures are logged, not raised:
+        replicas are allowed to lag.
+        """
+        with self._condition:
+            self._pending = raw
+            if self._worker is None:
+                # Not a daemon, so a CLI that exits right after saving
+                # still ships its last save.
+                self._worker = threading.Thread(
+                    target=self._ship_pending,
+                    name="salon-replica-shipper",
+                )
+                self._worker.start()
+
+    def _ship_pending(self) -> None:
+        while True:
+            with self._condition:
+                raw, self._pending = self._pending, None
+                if raw is None:
+                    self._worker = None
+                    self._condition.notify_all()
+                    return
+            try:
+                self.ship(raw)
+            except Exception:
+                logger.exception("Could not ship the salon to replica %s", self._directory)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Waits until every submitted save was shipped or failed."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._worker is None, timeout)
+
+    def ship(self, raw: bytes) -> int:
+        """Publishes raw, the bytes of one save(); returns its sequence number."""
+        with self._lock:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            manifest = read_manifest(self._directory)
+            seq = manifest["seq"] + 1 if manifest is not None else 1
+            while True:
+                try:
+                    # Claims the name, in case another process ships here too.
+                    with open(self._directory / _snapshot_name(seq), "xb"):
+                        break
+                except FileExistsError:
+                    seq += 1
+            SalonDataManager(str(self._directory / _snapshot_name(seq))).save_raw(raw)
+
+            current = read_manifest(self._directory)
+            if current is None or current["seq"] < seq:
+                temp_path = self._directory / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as manifest_file:
+                    json.dump({"seq": seq, "shipped_at": time.time()}, manifest_file)
+                os.replace(temp_path, self._directory / MANIFEST_NAME)
+            self._prune(seq)
+            return seq
+
+    def _prune(self, seq: int) -> None:
+        for path in self._directory.glob("snapshot-*.salon"):
+            if int(path.stem.split("-")[1]) <= seq - self._keep:
+                path.unlink(missing_ok=True)
+                Path(f"{path}.checksum").unlink(missing_ok=True)
+
+
+class ReplicaSalonRepository(SalonRepository):
+    """
+    Read-only salon served from a directory a ReplicaShipper fills.
+    The manifest is checked at most every max_staleness seconds, so reads
+    lag the last shipped save by about that much and the primary data
+    file is never touched. Readers share the loaded salon; saves fail.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_staleness: float = 5.0,
+        default_salon_name: str = "New Salon",
+    ) -> None:
+        if max_staleness < 0:
+            raise ValueError("max_staleness cannot be negative")
+        self._directory = Path(directory)
+        self._max_staleness = max_staleness
+        self._default_salon_name = default_salon_name
+        self._lock = threading.Lock()
+        self._manifest: dict | None = None
+        self._checked_at: float | None = None
+        self._salon: Salon | None = None
+        self._salon_seq: int | None = None
+
+    def _refresh(self) -> dict | None:
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self._max_staleness:
+            self._manifest = read_manifest(self._directory)
+            self._checked_at = now
+        return self._manifest
+
+    def _load_snapshot(self, manifest: dict) -> Salon:
+        path = self._directory / _snapshot_name(manifest["seq"])
+        # SalonDataManager reads a missing file as a new salon.
+        if not path.exists():
+            raise FileNotFoundError(path)
+        return SalonDataManager(str(path)).load()
+
+    def load(self) -> Salon:
+        with self._lock:
+            manifest = self._refresh()
+            if manifest is None:
+                return Salon(self._default_salon_name)
+            if self._salon_seq != manifest["seq"]:
+                try:
+                    self._salon = self._load_snapshot(manifest)
+                except FileNotFoundError:
+                    # Pruned after a slow reader saw the manifest; look again.
+                    self._checked_at = None
+                    manifest = self._refresh()
+                    self._salon = self._load_snapshot(manifest)
+                self._salon_seq = manifest["seq"]
+            return self._salon
+
+    def load_name(self) -> str:
+        with self._lock:
+            manifest = self._refresh()
+            if manifest is None:
+                return self._default_salon_name
+            if self._salon_seq == manifest["seq"]:
+                return self._salon.get_name()
+        return self.load().get_name()
+
+    def load_for_update(self) -> Salon:
+        raise AppServiceError("This salon is a read-only replica")
+
+    def save(self, salon: Salon) -> None:
+        raise AppServiceError("This salon is a read-only replica")
+
+    def get_version(self) -> str | None:
+        with self._lock:
+            manifest = self._refresh()
+        return f"replica-{manifest['seq']:x}" if manifest is not None else None
+
+    def get_last_modified(self) -> datetime | None:
+        with self._lock:
+            manifest = self._refresh()
+        if manifest is None:
+            return None
+        return datetime.fromtimestamp(manifest["shipped_at"], tz=timezone.utc)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._checked_at = None
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from salon_core.application.repositories.base import SalonRepository
+
+if TYPE_CHECKING:
+    from salon_core.entities.salon import Salon
+
+
+class SnapshotSalonRepository(SalonRepository):
+    """
+    Loads the salon from the wrapped repository once and serves every
+    following load from memory until the snapshot is invalidated.
+    """
+
+    def __init__(self, repository: SalonRepository) -> None:
+        self._repository = repository
+        self._salon: "Salon | None" = None
+
+    def load(self) -> "Salon":
+        if self._salon is None:
+            self._salon = self._repository.load()
+        return self._salon
+
+    def load_name(self) -> str:
+        if self._salon is not None:
+            return self._salon.get_name()
+        return self._repository.load_name()
+
+    def load_for_update(self) -> "Salon":
+        return self._repository.load_for_update()
+
+    def save(self, salon: "Salon") -> None:
+        self._repository.save(salon)
+        self._salon = salon
+
+    def get_version(self) -> str | None:
+        return self._repository.get_version()
+
+    def get_last_modified(self) -> datetime | None:
+        return self._repository.get_last_modified()
+
+    def release(self) -> None:
+        self._repository.release()
+
+    def invalidate(self) -> None:
+        self._salon = None
+        self._repository.invalidate()
@@ -0,0 +1,69 @@
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterator
+
+from salon_core.entities.management.master import Master
+from salon_core.entities.management.schedule import MasterSchedule
+
+DEFAULT_SLOT_DURATION = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class TimeSlot:
+    master_index: int
+    master: Master
+    start: datetime
+    end: datetime
+
+
+def iter_free_slots(
+    schedule: MasterSchedule,
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+) -> Iterator[tuple[datetime, datetime]]:
+    for gap_start, gap_end in schedule.free_intervals(window_start, window_end):
+        slot_start = gap_start
+        while slot_start + duration <= gap_end:
+            yield slot_start, slot_start + duration
+            slot_start += duration
+
+
+def _master_slots(
+    master_index: int,
+    master: Master,
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+) -> Iterator[tuple[datetime, int, datetime]]:
+    for start, end in iter_free_slots(
+        master.get_schedule(),
+        window_start,
+        window_end,
+        duration,
+    ):
+        yield start, master_index, end
+
+
+def earliest_slots(
+    masters: list[tuple[int, Master]],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+    count: int,
+) -> list[TimeSlot]:
+    """
+    Merges the lazily generated free slots of every master through a heap,
+    so only the first `count` slots are ever produced.
+    """
+    by_index = dict(masters)
+    streams = [
+        _master_slots(index, master, window_start, window_end, duration)
+        for index, master in masters
+    ]
+    return [
+        TimeSlot(index, by_index[index], start, end)
+        for start, index, end in islice(heapq.merge(*streams), count)
+    ]
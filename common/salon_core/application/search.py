@@ -0,0 +1,132 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Iterable
+
+from salon_core.application.events import BookingCreated, DomainEvent
+
+TRIGRAM = 3
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+class BookingSearchIndex:
+    """
+    Client name index over salon.get_all_bookings() positions.
+    Every word start of a name is kept in a sorted list for prefix lookups
+    ("jo", "smi", "john sm"); trigram postings answer substring queries of
+    three or more characters. The index remembers the data version and the
+    number of bookings it covers and is rebuilt when either stops matching.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self._names: list[str] = []
+        self._prefixes: list[tuple[str, int]] = []
+        self._trigrams: dict[str, set[int]] = {}
+
+    @staticmethod
+    def _word_starts(name: str) -> Iterable[int]:
+        return (
+            position
+            for position in range(len(name))
+            if position == 0 or name[position - 1] == " "
+        )
+
+    def _index_trigrams(self, booking_index: int, name: str) -> None:
+        for position in range(len(name) - TRIGRAM + 1):
+            self._trigrams.setdefault(name[position:position + TRIGRAM], set()).add(
+                booking_index
+            )
+
+    def is_current(self, version: str | None, booking_count: int) -> bool:
+        with self._lock:
+            return (
+                self._version is not None
+                and self._version == version
+                and len(self._names) == booking_count
+            )
+
+    def rebuild(self, client_names: Iterable[str], version: str | None) -> None:
+        names = [normalize_name(client_name) for client_name in client_names]
+        prefixes: list[tuple[str, int]] = []
+        with self._lock:
+            self._trigrams = {}
+            for booking_index, name in enumerate(names):
+                prefixes.extend(
+                    (name[position:], booking_index)
+                    for position in self._word_starts(name)
+                )
+                self._index_trigrams(booking_index, name)
+            prefixes.sort()
+            self._names = names
+            self._prefixes = prefixes
+            self._version = version
+
+    def apply(
+        self,
+        events: Iterable[DomainEvent],
+        previous_version: str | None,
+        version: str | None,
+    ) -> None:
+        """
+        Follows a committed mutation. Only booking creation changes client
+        names; if the index was not current before the change, or a booking
+        is not the next position, it stays stale until the next rebuild.
+        """
+        with self._lock:
+            if self._version is None or self._version != previous_version:
+                self._version = None
+                return
+            for event in events:
+                if not isinstance(event, BookingCreated):
+                    continue
+                if event.booking_index != len(self._names):
+                    self._version = None
+                    return
+                name = normalize_name(event.client_name)
+                self._names.append(name)
+                for position in self._word_starts(name):
+                    insort(self._prefixes, (name[position:], event.booking_index))
+                self._index_trigrams(event.booking_index, name)
+            self._version = version
+
+    def search(self, query: str, limit: int) -> list[int]:
+        """
+        Positions of bookings whose client has a name word starting with
+        the query, in name order, then of those containing it elsewhere,
+        in booking order.
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+        with self._lock:
+            found: list[int] = []
+            seen: set[int] = set()
+            position = bisect_left(self._prefixes, (query, -1))
+            while position < len(self._prefixes) and len(found) < limit:
+                key, booking_index = self._prefixes[position]
+                if not key.startswith(query):
+                    break
+                if booking_index not in seen:
+                    seen.add(booking_index)
+                    found.append(booking_index)
+                position += 1
+
+            if len(found) >= limit or len(query) < TRIGRAM:
+                return found
+            postings = sorted(
+                (
+                    self._trigrams.get(query[start:start + TRIGRAM], set())
+                    for start in range(len(query) - TRIGRAM + 1)
+                ),
+                key=len,
+            )
+            for booking_index in sorted(postings[0].intersection(*postings[1:]) - seen):
+                if query in self._names[booking_index]:
+                    found.append(booking_index)
+                    if len(found) >= limit:
+                        break
+            return found
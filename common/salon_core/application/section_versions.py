@@ -0,0 +1,46 @@
+import os
+import threading
+from typing import Iterable
+
+SALON_SECTIONS = ("staff", "inventory", "services", "bookings")
+
+
+class SectionVersions:
+    """
+    Per-section change counters for cache keys.
+    Mutations bump only the sections they touch. A data version that was
+    not produced by a bump means someone else wrote the data, so every
+    section moves to a new generation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._token = os.urandom(4).hex()
+        self._generation = 0
+        self._known_data_version: str | None = None
+        self._counters = dict.fromkeys(SALON_SECTIONS, 0)
+
+    def _sync(self, data_version: str | None) -> None:
+        if data_version != self._known_data_version:
+            self._generation += 1
+            self._known_data_version = data_version
+
+    def get(self, section: str, data_version: str | None) -> str:
+        if section not in self._counters:
+            raise ValueError(f"Unknown salon section: {section}")
+        with self._lock:
+            self._sync(data_version)
+            return f"{self._token}.{self._generation}.{self._counters[section]}"
+
+    def bump(
+        self,
+        sections: Iterable[str],
+        previous_data_version: str | None,
+        data_version: str | None,
+    ) -> None:
+        with self._lock:
+            # Changes saved before this mutation loaded its copy still count.
+            self._sync(previous_data_version)
+            for section in sections:
+                self._counters[section] += 1
+            self._known_data_version = data_version
@@ -1,17 +1,33 @@
-﻿from typing import Callable
+﻿import threading
+from contextlib import AbstractContextManager, contextmanager
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 
 from salon_core.application.errors.base import AppServiceError
+from salon_core.application.events import (
+    BookingCancelled,
+    BookingCompleted,
+    BookingCreated,
+    DomainEvent,
+    DomainEventBus,
+    ItemRestocked,
+    MasterFired,
+    MasterHired,
+    PaymentProcessed,
+    ProductSold,
+    ServiceAdded,
+    ServiceRemoved,
+)
 from salon_core.application.repositories.base import SalonRepository
-from salon_core.entities.inventory.cosmetics import Cosmetics
-from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
-from salon_core.entities.inventory.inventory_item import InventoryItem
-from salon_core.entities.management.booking import Booking
-from salon_core.entities.management.client import Client
-from salon_core.entities.management.master import Master
-from salon_core.entities.salon import Salon
-from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
-from salon_core.entities.services.hair_service import HairService
-from salon_core.entities.services.service import Service
+from salon_core.application.repositories.batch_repository import (
+    BatchSalonRepository,
+)
+from salon_core.application.repositories.snapshot_repository import (
+    SnapshotSalonRepository,
+)
+from salon_core.application.search import BookingSearchIndex
+from salon_core.application.section_versions import SectionVersions
+from salon_core.application.timing import timed
 from salon_core.exceptions.exceptions import (
     BookingStatusError,
     IncorrectAgeError,
@@ -21,12 +37,23 @@ from salon_core.exceptions.exceptions import (
     ItemNotForSaleError,
     MasterSpecializationError,
     PriceError,
+    ScheduleConflictError,
     ServiceError,
     StaffError,
 )
 from salon_core.utils.booking_status import BookingStatus
 from salon_core.utils.masters_specialization import MastersSpecialization
 
+# Entities are imported by the mutations that build them, so importing
+# the service does not load the whole model.
+if TYPE_CHECKING:
+    from salon_core.application.scheduling import TimeSlot
+    from salon_core.entities.inventory.inventory_item import InventoryItem
+    from salon_core.entities.management.booking import Booking
+    from salon_core.entities.management.master import Master
+    from salon_core.entities.salon import Salon
+    from salon_core.entities.services.service import Service
+
 
 class SalonAppService:
     _CONTROLLED_EXCEPTIONS = (
@@ -42,10 +69,22 @@ class SalonAppService:
         InventoryItemError,
         ItemNotForSaleError,
         ItemAmountError,
+        ScheduleConflictError,
     )
 
-    def __init__(self, repository: SalonRepository) -> None:
+    def __init__(
+        self,
+        repository: SalonRepository,
+        write_lock: AbstractContextManager | None = None,
+        section_versions: SectionVersions | None = None,
+        event_bus: DomainEventBus | None = None,
+        booking_search: BookingSearchIndex | None = None,
+    ) -> None:
         self._repository = repository
+        self._write_lock = write_lock or threading.RLock()
+        self._section_versions = section_versions or SectionVersions()
+        self._event_bus = event_bus or DomainEventBus()
+        self._booking_search = booking_search or BookingSearchIndex()
 
     @staticmethod
     def _to_app_error(error: Exception) -> AppServiceError:
@@ -53,21 +92,106 @@ class SalonAppService:
             return error
         return AppServiceError(str(error))
 
-    def _read(self, action: Callable[[Salon], object]) -> object:
+    def _read(self, action: Callable[["Salon"], object]) -> object:
         try:
-            salon = self._repository.load()
-            return action(salon)
+            with timed("service"):
+                with timed("load"):
+                    salon = self._repository.load()
+                with timed("action"):
+                    return action(salon)
         except self._CONTROLLED_EXCEPTIONS as error:
             raise self._to_app_error(error) from error
 
-    def _mutate(self, action: Callable[[Salon], object]) -> object:
-        try:
-            salon = self._repository.load()
-            result = action(salon)
-            self._repository.save(salon)
-            return result
-        except self._CONTROLLED_EXCEPTIONS as error:
-            raise self._to_app_error(error) from error
+    def _mutate(
+        self,
+        action: Callable[["Salon"], object],
+        sections: tuple[str, ...] = (),
+        events: list[DomainEvent] | None = None,
+    ) -> object:
+        """
+        Runs action on a loaded salon and saves it. Events the action
+        appended to `events` are published once the save succeeded.
+        """
+        with timed("service"), self._write_lock:
+            try:
+                previous_version = self._repository.get_version()
+                with timed("load"):
+                    salon = self._repository.load_for_update()
+                with timed("action"):
+                    result = action(salon)
+                with timed("save"):
+                    self._repository.save(salon)
+                version = self._repository.get_version()
+                self._section_versions.bump(sections, previous_version, version)
+                self._booking_search.apply(events or (), previous_version, version)
+                if events:
+                    self._event_bus.publish(events)
+                return result
+            except self._CONTROLLED_EXCEPTIONS as error:
+                self._repository.invalidate()
+                raise self._to_app_error(error) from error
+            except Exception:
+                self._repository.invalidate()
+                raise
+
+    @contextmanager
+    def snapshot(self) -> Iterator["SalonAppService"]:
+        """
+        Yields a service that loads the salon once and answers every read
+        inside the block from that copy; mutations still save through.
+        """
+        yield SalonAppService(
+            SnapshotSalonRepository(self._repository),
+            self._write_lock,
+            self._section_versions,
+            self._event_bus,
+            self._booking_search,
+        )
+
+    @contextmanager
+    def batch(self) -> Iterator["SalonAppService"]:
+        """
+        Yields a service whose mutations share one load and one save when
+        the block ends. Any exception discards the whole batch, and other
+        writers of this service wait until it is done. Events of the batch
+        are published only after that save.
+        """
+        with self._write_lock:
+            repository = BatchSalonRepository(self._repository)
+            event_bus = self._event_bus.deferred()
+            try:
+                yield SalonAppService(
+                    repository,
+                    self._write_lock,
+                    self._section_versions,
+                    event_bus,
+                    self._booking_search,
+                )
+            except BaseException:
+                repository.discard()
+                event_bus.discard()
+                self._repository.invalidate()
+                raise
+            try:
+                repository.flush()
+            except Exception:
+                event_bus.discard()
+                self._repository.invalidate()
+                raise
+            event_bus.release()
+
+    def subscribe(
+        self,
+        handler: Callable[[DomainEvent], None],
+        *event_types: type[DomainEvent],
+    ) -> Callable[[], None]:
+        """
+        Registers handler for events of committed mutations (all events, or
+        only the given types). Handlers run on the writing thread while it
+        still holds the write lock, so they see events in commit order and
+        must be quick. Returns a function that unsubscribes.
+        """
+        return self._event_bus.subscribe(handler, *event_types)
 
     @staticmethod
     def _get_by_index(items: list, index: int, label: str):
@@ -108,6 +232,59 @@ class SalonAppService:
             return "cosmetic"
         raise ValueError("Invalid service type.")
 
+    @staticmethod
+    def _parse_datetime(value) -> datetime | None:
+        if value is None or isinstance(value, datetime):
+            return value
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.strip())
+        raise TypeError("Invalid date and time value")
+
+    @staticmethod
+    def _parse_statuses(statuses) -> set[BookingStatus] | None:
+        if statuses is None:
+            return None
+        parsed = set()
+        for status in statuses:
+            if isinstance(status, BookingStatus):
+                parsed.add(status)
+            elif isinstance(status, str):
+                normalized = status.strip()
+                if normalized.upper() in BookingStatus.__members__:
+                    parsed.add(BookingStatus[normalized.upper()])
+                else:
+                    parsed.add(BookingStatus(normalized.capitalize()))
+            else:
+                raise TypeError("Invalid booking status value")
+        return parsed or None
+
+    @classmethod
+    def _filter_bookings(cls, salon: "Salon", statuses) -> Iterator["Booking"]:
+        wanted = cls._parse_statuses(statuses)
+        bookings = salon.get_all_bookings()
+        return (
+            booking
+            for booking in bookings
+            if wanted is None or booking.get_status() in wanted
+        )
+
+    @staticmethod
+    def _eligible_staff(
+        salon: "Salon",
+        service: "Service",
+        staff_positions: dict[int, int] | None = None,
+    ) -> list[tuple[int, "Master"]]:
+        if staff_positions is None:
+            staff_positions = {
+                id(master): index for index, master in enumerate(salon.get_staff())
+            }
+        eligible = [
+            (staff_positions[id(master)], master)
+            for master in salon.get_masters_for(service)
+        ]
+        eligible.sort(key=lambda pair: pair[0])
+        return eligible
+
     @staticmethod
     def _pick_by_indexes(items: list, indexes: list[int]) -> list:
         selected = []
@@ -116,33 +293,74 @@ class SalonAppService:
                 selected.append(items[index])
         return selected
 
+    def get_data_version(self) -> str | None:
+        return self._repository.get_version()
+
+    def get_last_modified(self) -> datetime | None:
+        return self._repository.get_last_modified()
+
+    def get_section_version(self, section: str) -> str:
+        """Cache key part that changes whenever the section's data may have."""
+        return self._section_versions.get(section, self.get_data_version())
+
     def get_salon_name(self) -> str:
-        return self._read(lambda salon: salon.get_name())
+        try:
+            with timed("service"), timed("load"):
+                return self._repository.load_name()
+        except self._CONTROLLED_EXCEPTIONS as error:
+            raise self._to_app_error(error) from error
 
-    def list_staff(self) -> list[Master]:
+    def list_staff(self) -> list["Master"]:
         return self._read(lambda salon: salon.get_staff())
 
     def hire_master(self, name: str, age: int, specialization) -> None:
+        from salon_core.entities.management.master import Master
+
         parsed_spec = self._parse_specialization(specialization)
+        events: list[DomainEvent] = []
 
-        def action(salon: Salon) -> None:
+        def action(salon: "Salon") -> None:
             salon.hire_staff(Master(name, age, parsed_spec))
+            events.append(
+                MasterHired(len(salon.get_staff()) - 1, name, age, parsed_spec.value)
+            )
 
-        self._mutate(action)
+        self._mutate(action, ("staff",), events)
 
     def fire_master(self, staff_index: int) -> None:
-        def action(salon: Salon) -> None:
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
             staff = salon.get_staff()
             target = self._get_by_index(staff, staff_index, "staff member")
             salon.fire_staff(target)
+            events.append(
+                MasterFired(
+                    staff_index,
+                    target.get_name(),
+                    target.get_specialization().value,
+                )
+            )
 
-        self._mutate(action)
+        # Bookings of a fired master are not kept on the next load.
+        self._mutate(action, ("staff", "bookings"), events)
 
-    def list_inventory(self) -> list[InventoryItem]:
+    def list_inventory(self) -> list["InventoryItem"]:
         return self._read(lambda salon: salon.get_inventory())
 
     def sell_product(self, product_name: str, quantity: int) -> None:
-        self._mutate(lambda salon: salon.sell_product(product_name, quantity))
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
+            balance_before = salon.check_balance()
+            salon.sell_product(product_name, quantity)
+            balance = salon.check_balance()
+            amount = balance - balance_before
+            remaining = salon.find_product(product_name).get_amount()
+            events.append(ProductSold(product_name, quantity, amount, remaining))
+            events.append(PaymentProcessed(amount, balance, "sale"))
+
+        self._mutate(action, ("inventory",), events)
 
     def restock_or_create_item(
         self,
@@ -153,12 +371,20 @@ class SalonAppService:
         initial_amount: int | None = None,
         price: float | None = None,
     ) -> None:
-        def action(salon: Salon) -> None:
+        from salon_core.entities.inventory.cosmetics import Cosmetics
+        from salon_core.entities.inventory.hairdressing_equipment import (
+            HairdressingEquipment,
+        )
+
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
             existing_item = salon.find_product(name)
             if existing_item is not None:
                 if refill_amount is None:
                     raise ValueError("Refill amount is required for restock")
                 existing_item.set_amount(existing_item.get_amount() + refill_amount)
+                events.append(ItemRestocked(name, existing_item.get_amount(), False))
                 return
 
             if category is None:
@@ -175,12 +401,40 @@ class SalonAppService:
                 salon.add_to_inventory(Cosmetics(name, price, desc, initial_amount))
             else:
                 salon.add_to_inventory(HairdressingEquipment(name, desc, initial_amount))
+            events.append(ItemRestocked(name, initial_amount, True))
 
-        self._mutate(action)
+        self._mutate(action, ("inventory",), events)
 
-    def list_services(self) -> list[Service]:
+    def list_services(self) -> list["Service"]:
         return self._read(lambda salon: salon.get_services())
 
+    def list_eligible_masters(self, service_index: int) -> list["Master"]:
+        def action(salon: "Salon") -> list["Master"]:
+            services = salon.get_services()
+            service = self._get_by_index(services, service_index, "service")
+            return salon.get_masters_for(service)
+
+        return self._read(action)
+
+    def get_eligible_staff_indexes(self) -> dict[int, list[int]]:
+        def action(salon: "Salon") -> dict[int, list[int]]:
+            staff_positions = {
+                id(master): index for index, master in enumerate(salon.get_staff())
+            }
+            return {
+                service_index: [
+                    index
+                    for index, _ in self._eligible_staff(
+                        salon,
+                        service,
+                        staff_positions,
+                    )
+                ]
+                for service_index, service in enumerate(salon.get_services())
+            }
+
+        return self._read(action)
+
     def add_service(
         self,
         name: str,
@@ -188,9 +442,17 @@ class SalonAppService:
         service_type: str,
         resource_indexes: list[int],
     ) -> None:
+        from salon_core.entities.inventory.cosmetics import Cosmetics
+        from salon_core.entities.inventory.hairdressing_equipment import (
+            HairdressingEquipment,
+        )
+        from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+        from salon_core.entities.services.hair_service import HairService
+
         parsed_service_type = self._parse_service_type(service_type)
+        events: list[DomainEvent] = []
 
-        def action(salon: Salon) -> None:
+        def action(salon: "Salon") -> None:
             inventory = salon.get_inventory()
             if parsed_service_type == "hair":
                 equipment = [
@@ -205,21 +467,28 @@ class SalonAppService:
                 selected = self._pick_by_indexes(cosmetics, resource_indexes)
                 service = CosmeticProcedure(name, price, selected)
             salon.add_service(service)
+            events.append(
+                ServiceAdded(len(salon.get_services()) - 1, name, service.get_price())
+            )
 
-        self._mutate(action)
+        self._mutate(action, ("services",), events)
 
     def remove_service(self, service_index: int) -> None:
-        def action(salon: Salon) -> None:
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
             services = salon.get_services()
             target = self._get_by_index(services, service_index, "service")
             salon.remove_service(target)
+            events.append(ServiceRemoved(service_index, target.get_name()))
 
-        self._mutate(action)
+        # Bookings of a removed service are not kept on the next load.
+        self._mutate(action, ("services", "bookings"), events)
 
-    def list_bookings(self) -> list[Booking]:
+    def list_bookings(self) -> list["Booking"]:
         return self._read(lambda salon: salon.get_all_bookings())
 
-    def list_confirmed_bookings(self) -> list[Booking]:
+    def list_confirmed_bookings(self) -> list["Booking"]:
         return self._read(
             lambda salon: [
                 booking
@@ -234,8 +503,14 @@ class SalonAppService:
         client_age: int,
         master_index: int,
         service_index: int,
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
     ) -> None:
-        def action(salon: Salon) -> None:
+        from salon_core.entities.management.client import Client
+
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
             staff = salon.get_staff()
             master = self._get_by_index(staff, master_index, "master")
 
@@ -243,12 +518,194 @@ class SalonAppService:
             service = self._get_by_index(services, service_index, "service")
 
             client = Client(client_name, client_age)
-            salon.make_booking(client, master, service)
+            booking = salon.make_booking(
+                client,
+                master,
+                service,
+                self._parse_datetime(start),
+                self._parse_datetime(end),
+            )
+            events.append(
+                BookingCreated(
+                    len(salon.get_all_bookings()) - 1,
+                    client.get_name(),
+                    client.get_age(),
+                    master.get_name(),
+                    service.get_name(),
+                    service.get_price(),
+                    booking.get_start(),
+                    booking.get_end(),
+                )
+            )
+
+        self._mutate(action, ("bookings",), events)
+
+    def import_bookings(self, rows: Iterable[dict]) -> tuple[int, list[dict]]:
+        """
+        Adds a booking for every row in the booking export format with one
+        load and one save. Masters are matched by name and specialization
+        and services by name on the loaded salon. Confirmed rows are booked
+        as usual; Done and Cancelled ones are added as history, with no
+        payment or stock change. Returns how many bookings were created and
+        the line and error of every row that was skipped.
+        """
+        rows = list(rows)
+        events: list[DomainEvent] = []
+        errors: list[dict] = []
+
+        def action(salon: "Salon") -> int:
+            masters = {
+                (master.get_name(), master.get_specialization().value): master
+                for master in salon.get_staff()
+            }
+            services = {service.get_name(): service for service in salon.get_services()}
+            created = 0
+            for line, row in enumerate(rows, start=1):
+                try:
+                    self._import_booking(salon, row, masters, services, events)
+                except (*self._CONTROLLED_EXCEPTIONS, KeyError) as error:
+                    errors.append({"line": line, "error": str(error)})
+                else:
+                    created += 1
+            return created
+
+        created = self._mutate(action, ("bookings",), events)
+        return created, errors
+
+    def _import_booking(
+        self,
+        salon: "Salon",
+        row: dict,
+        masters: dict[tuple[str, str], "Master"],
+        services: dict[str, "Service"],
+        events: list[DomainEvent],
+    ) -> None:
+        from salon_core.entities.management.booking import Booking
+        from salon_core.entities.management.client import Client
+
+        master_key = (row.get("master_name"), row.get("master_specialization"))
+        if master_key not in masters:
+            raise ValueError(f"Unknown master {master_key[0]}")
+        if row.get("service_name") not in services:
+            raise ValueError(f"Unknown service {row.get('service_name')}")
+        master = masters[master_key]
+        service = services[row["service_name"]]
+        client = Client(row["client_name"], int(row["client_age"]))
+        (status,) = self._parse_statuses([row.get("status") or BookingStatus.CONFIRMED])
+        start = self._parse_datetime(row.get("start") or None)
+        end = self._parse_datetime(row.get("end") or None)
+
+        if status == BookingStatus.CONFIRMED:
+            booking = salon.make_booking(client, master, service, start, end)
+        else:
+            booking = Booking(client, service, master, status, start, end)
+            salon.get_reception().add_booking(booking)
+        index = len(salon.get_all_bookings()) - 1
+        events.append(
+            BookingCreated(
+                index,
+                client.get_name(),
+                client.get_age(),
+                master.get_name(),
+                service.get_name(),
+                service.get_price(),
+                booking.get_start(),
+                booking.get_end(),
+            )
+        )
+        names = (client.get_name(), master.get_name(), service.get_name())
+        if status == BookingStatus.DONE:
+            events.append(BookingCompleted(index, *names, service.get_price()))
+        elif status == BookingStatus.CANCELLED:
+            events.append(BookingCancelled(index, *names))
+
+    def search_bookings(self, query: str, limit: int = 20) -> list["Booking"]:
+        """
+        Bookings whose client name has a word starting with query, then
+        those containing it, at most limit of them.
+        """
+        # Taken before the load: a write in between only makes the index
+        # look stale on the next search, never current with old names.
+        version = self._repository.get_version()
+
+        def action(salon: "Salon") -> list["Booking"]:
+            if limit <= 0:
+                raise ValueError("Search limit must be positive")
+            bookings = salon.get_all_bookings()
+            if not self._booking_search.is_current(version, len(bookings)):
+                self._booking_search.rebuild(
+                    (booking.get_client().get_name() for booking in bookings),
+                    version,
+                )
+            return [bookings[index] for index in self._booking_search.search(query, limit)]
 
-        self._mutate(action)
+        return self._read(action)
+
+    def list_master_bookings(
+        self,
+        master_index: int,
+        start: datetime | str,
+        end: datetime | str,
+    ) -> list["Booking"]:
+        def action(salon: "Salon") -> list["Booking"]:
+            master = self._get_by_index(salon.get_staff(), master_index, "master")
+            return master.get_schedule().bookings_between(
+                self._parse_datetime(start),
+                self._parse_datetime(end),
+            )
+
+        return self._read(action)
+
+    def find_slots(
+        self,
+        service_index: int,
+        window: tuple[datetime | str, datetime | str],
+        count: int = 5,
+        duration: timedelta | None = None,
+    ) -> list["TimeSlot"]:
+        # Imported here so that CLI start-up does not pay for it.
+        from salon_core.application.scheduling import (
+            DEFAULT_SLOT_DURATION,
+            earliest_slots,
+        )
+
+        if duration is None:
+            duration = DEFAULT_SLOT_DURATION
+
+        def action(salon: "Salon") -> list["TimeSlot"]:
+            window_start = self._parse_datetime(window[0])
+            window_end = self._parse_datetime(window[1])
+            if window_start is None or window_end is None:
+                raise ValueError("Search window needs start and end time")
+            if window_end <= window_start:
+                raise ValueError("Search window must end after it starts")
+            if count <= 0:
+                raise ValueError("Number of slots must be positive")
+            if duration <= timedelta(0):
+                raise ValueError("Slot duration must be positive")
+
+            service = self._get_by_index(
+                salon.get_services(),
+                service_index,
+                "service",
+            )
+            eligible = self._eligible_staff(salon, service)
+            return earliest_slots(eligible, window_start, window_end, duration, count)
+
+        return self._read(action)
+
+    @staticmethod
+    def _booking_index(salon: "Salon", booking: "Booking") -> int:
+        return next(
+            index
+            for index, candidate in enumerate(salon.get_all_bookings())
+            if candidate is booking
+        )
 
     def execute_booking(self, confirmed_booking_index: int) -> None:
-        def action(salon: Salon) -> None:
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
             confirmed_bookings = [
                 booking
                 for booking in salon.get_bookings()
@@ -260,11 +717,24 @@ class SalonAppService:
                 "booking",
             )
             salon.complete_booking(target)
+            price = target.get_service().get_price()
+            events.append(
+                BookingCompleted(
+                    self._booking_index(salon, target),
+                    target.get_client().get_name(),
+                    target.get_master().get_name(),
+                    target.get_service().get_name(),
+                    price,
+                )
+            )
+            events.append(PaymentProcessed(price, salon.check_balance(), "booking"))
 
-        self._mutate(action)
+        self._mutate(action, ("bookings", "inventory"), events)
 
     def cancel_booking(self, confirmed_booking_index: int) -> None:
-        def action(salon: Salon) -> None:
+        events: list[DomainEvent] = []
+
+        def action(salon: "Salon") -> None:
             confirmed_bookings = [
                 booking
                 for booking in salon.get_all_bookings()
@@ -275,14 +745,22 @@ class SalonAppService:
                 confirmed_booking_index,
                 "booking",
             )
-            target.set_status(BookingStatus.CANCELLED)
+            salon.cancel_booking(target)
+            events.append(
+                BookingCancelled(
+                    self._booking_index(salon, target),
+                    target.get_client().get_name(),
+                    target.get_master().get_name(),
+                    target.get_service().get_name(),
+                )
+            )
 
-        self._mutate(action)
+        self._mutate(action, ("bookings",), events)
 
     def get_balance(self) -> float:
         return self._read(lambda salon: salon.check_balance())
 
-    def get_booking_history(self) -> list[Booking]:
+    def get_booking_history(self) -> list["Booking"]:
         return self._read(
             lambda salon: [
                 booking
@@ -291,34 +769,55 @@ class SalonAppService:
             ]
         )
 
-    def get_dashboard_stats(self) -> dict:
-        def action(salon: Salon) -> dict:
-            all_bookings = salon.get_all_bookings()
-            confirmed = [
-                booking
-                for booking in all_bookings
-                if booking.get_status() == BookingStatus.CONFIRMED
-            ]
-            done = [
-                booking
-                for booking in all_bookings
-                if booking.get_status() == BookingStatus.DONE
-            ]
-            cancelled = [
-                booking
-                for booking in all_bookings
-                if booking.get_status() == BookingStatus.CANCELLED
-            ]
-            return {
-                "salon_name": salon.get_name(),
-                "balance": salon.check_balance(),
-                "staff_count": len(salon.get_staff()),
-                "inventory_count": len(salon.get_inventory()),
-                "services_count": len(salon.get_services()),
-                "bookings_total": len(all_bookings),
-                "bookings_confirmed": len(confirmed),
-                "bookings_done": len(done),
-                "bookings_cancelled": len(cancelled),
-            }
+    def iter_bookings(
+        self,
+        statuses: Iterable[BookingStatus | str] | None = None,
+    ) -> Iterator["Booking"]:
+        return self._read(lambda salon: self._filter_bookings(salon, statuses))
 
-        return self._read(action)
+    def export_bookings(
+        self,
+        export_format: str = "csv",
+        statuses: Iterable[BookingStatus | str] | None = None,
+    ) -> Iterator[str]:
+        from salon_core.application.export import iter_booking_lines
+
+        return self._read(
+            lambda salon: iter_booking_lines(
+                self._filter_bookings(salon, statuses),
+                export_format,
+            )
+        )
+
+    @staticmethod
+    def dashboard_stats_for(salon: "Salon") -> dict:
+        all_bookings = salon.get_all_bookings()
+        confirmed = [
+            booking
+            for booking in all_bookings
+            if booking.get_status() == BookingStatus.CONFIRMED
+        ]
+        done = [
+            booking
+            for booking in all_bookings
+            if booking.get_status() == BookingStatus.DONE
+        ]
+        cancelled = [
+            booking
+            for booking in all_bookings
+            if booking.get_status() == BookingStatus.CANCELLED
+        ]
+        return {
+            "salon_name": salon.get_name(),
+            "balance": salon.check_balance(),
+            "staff_count": len(salon.get_staff()),
+            "inventory_count": len(salon.get_inventory()),
+            "services_count": len(salon.get_services()),
+            "bookings_total": len(all_bookings),
+            "bookings_confirmed": len(confirmed),
+            "bookings_done": len(done),
+            "bookings_cancelled": len(cancelled),
+        }
+
+    def get_dashboard_stats(self) -> dict:
+        return self._read(self.dashboard_stats_for)
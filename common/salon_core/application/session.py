@@ -0,0 +1,468 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+from contextlib import AbstractContextManager
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from salon_core.application.errors.base import AppServiceError
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.application.repositories.batch_repository import (
+    BatchSalonRepository,
+)
+from salon_core.application.service import SalonAppService
+from salon_core.utils.booking_status import BookingStatus
+
+if TYPE_CHECKING:
+    from salon_core.entities.salon import Salon
+
+logger = logging.getLogger(__name__)
+
+JOURNALED_OPERATIONS = (
+    "hire_master",
+    "fire_master",
+    "sell_product",
+    "restock_or_create_item",
+    "add_service",
+    "remove_service",
+    "create_booking",
+    "execute_booking",
+    "cancel_booking",
+)
+
+
+# Arguments that pick an entity by its position in one of these lists.
+# The journal keeps what they pointed at, because another writer may
+# have moved the entities by the time the call is replayed.
+INDEX_ARGUMENTS = {
+    "fire_master": {"staff_index": "staff"},
+    "remove_service": {"service_index": "services"},
+    "create_booking": {"master_index": "staff", "service_index": "services"},
+    "execute_booking": {"confirmed_booking_index": "confirmed bookings"},
+    "cancel_booking": {"confirmed_booking_index": "confirmed bookings"},
+    "add_service": {"resource_indexes": "resources"},
+}
+
+
+def _identity(entity) -> list:
+    from salon_core.entities.management.booking import Booking
+    from salon_core.entities.management.master import Master
+
+    if isinstance(entity, Booking):
+        start = entity.get_start()
+        return [
+            entity.get_client().get_name(),
+            entity.get_master().get_name(),
+            entity.get_service().get_name(),
+            start.isoformat() if start is not None else None,
+        ]
+    if isinstance(entity, Master):
+        return [entity.get_name(), entity.get_specialization().value]
+    return [entity.get_name()]
+
+
+def _indexed_entities(salon: "Salon", kind: str, arguments: dict) -> list:
+    from salon_core.entities.inventory.cosmetics import Cosmetics
+    from salon_core.entities.inventory.hairdressing_equipment import (
+        HairdressingEquipment,
+    )
+
+    if kind == "staff":
+        return salon.get_staff()
+    if kind == "services":
+        return salon.get_services()
+    if kind == "confirmed bookings":
+        return [
+            booking
+            for booking in salon.get_all_bookings()
+            if booking.get_status() == BookingStatus.CONFIRMED
+        ]
+    # add_service resources are picked from one kind of inventory item.
+    hair = SalonAppService._parse_service_type(arguments["service_type"]) == "hair"
+    item_type = HairdressingEquipment if hair else Cosmetics
+    return [item for item in salon.get_inventory() if isinstance(item, item_type)]
+
+
+def _bind(operation: str, args, kwargs) -> inspect.BoundArguments:
+    method = getattr(SalonAppService, operation)
+    return inspect.signature(method).bind(None, *args, **kwargs)
+
+
+def _targets(salon: "Salon", operation: str, args: tuple, kwargs: dict) -> dict:
+    """Identities of the entities a call picks by index, before it runs."""
+    targets = {}
+    if operation not in INDEX_ARGUMENTS:
+        return targets
+    arguments = _bind(operation, args, kwargs).arguments
+    for name, kind in INDEX_ARGUMENTS[operation].items():
+        if name not in arguments:
+            continue
+        entities = _indexed_entities(salon, kind, arguments)
+        indexes = arguments[name]
+        if isinstance(indexes, int):
+            if 0 <= indexes < len(entities):
+                targets[name] = _identity(entities[indexes])
+        else:
+            targets[name] = [
+                _identity(entities[index])
+                for index in indexes
+                if 0 <= index < len(entities)
+            ]
+    return targets
+
+
+def _find(entities: list, kind: str, index: int | None, identity: list) -> int:
+    if index is not None and 0 <= index < len(entities):
+        if _identity(entities[index]) == identity:
+            return index
+    matches = [
+        position
+        for position, entity in enumerate(entities)
+        if _identity(entity) == identity
+    ]
+    if len(matches) != 1:
+        raise AppServiceError(
+            f"{' '.join(map(str, identity))} is no longer one of the {kind}: "
+            "another writer changed it"
+        )
+    return matches[0]
+
+
+def _retarget(salon: "Salon", entry: dict) -> tuple[list, dict]:
+    """Arguments of a journaled call, with indexes pointing where they did."""
+    targets = entry.get("targets")
+    if not targets:
+        return entry["args"], entry["kwargs"]
+    operation = entry["op"]
+    bound = _bind(operation, entry["args"], entry["kwargs"])
+    for name, identity in targets.items():
+        kind = INDEX_ARGUMENTS[operation][name]
+        entities = _indexed_entities(salon, kind, bound.arguments)
+        if kind == "resources":
+            bound.arguments[name] = [
+                _find(entities, kind, None, item) for item in identity
+            ]
+        else:
+            bound.arguments[name] = _find(entities, kind, bound.arguments[name], identity)
+    return list(bound.args[1:]), bound.kwargs
+
+
+def _encode(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot journal value of type {type(value).__name__}")
+
+
+class SalonJournal:
+    """
+    Append-only log of the service calls made since the last flush.
+    Every entry is fsynced before the call returns and carries the data
+    version of the stored salon it applies on top of, plus what the
+    call's index arguments pointed at. Flushes are marked
+    in it as well, so pending() can tell a salon this session saved from
+    one another writer saved.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = Path(path)
+
+    def _write(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False, default=_encode) + "\n"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a", encoding="utf-8") as journal_file:
+            journal_file.write(line)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def append(
+        self,
+        base_version: str | None,
+        operation: str,
+        args: tuple,
+        kwargs: dict,
+        targets: dict | None = None,
+    ) -> None:
+        entry = {
+            "base": base_version,
+            "op": operation,
+            "args": list(args),
+            "kwargs": kwargs,
+        }
+        if targets:
+            entry["targets"] = targets
+        self._write(entry)
+
+    def mark_flush_started(self, stored_version: str | None) -> None:
+        """Written before a flush overwrites the salon stored at stored_version."""
+        self._write({"flush": "started", "stored": stored_version})
+
+    def mark_flush_failed(self) -> None:
+        self._write({"flush": "failed"})
+
+    def mark_flushed(self) -> None:
+        self._write({"flush": "done"})
+
+    def read(self) -> list[dict]:
+        if not self._path.exists():
+            return []
+        entries = []
+        with open(self._path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A crash in the middle of append() leaves a torn last line.
+                    break
+        return entries
+
+    def pending(self, stored_version: str | None) -> list[dict]:
+        """
+        Calls that are not part of the salon stored at stored_version.
+        Calls before a finished flush are. A flush that only started was
+        cut short by a crash: its calls were saved if the stored salon
+        changed since it started.
+        """
+        calls: list[dict] = []
+        started: dict | None = None
+        for entry in self.read():
+            flush = entry.get("flush")
+            if flush is None:
+                calls.append(entry)
+            elif flush == "started":
+                started = entry
+            elif flush == "failed":
+                started = None
+            else:
+                calls, started = [], None
+        if started is not None and started["stored"] != stored_version:
+            return []
+        return calls
+
+    def clear(self) -> None:
+        self._path.unlink(missing_ok=True)
+
+
+class SessionSalonRepository(SalonRepository):
+    """
+    Write-behind repository for a long CLI session. The salon stays in
+    memory, save() only marks it dirty and flush() writes it through.
+    Loading replays journal entries that were not flushed before a crash.
+    When another writer saved the salon in the meantime, the journaled
+    calls are redone on top of its salon instead of overwriting it. They
+    act on the same masters, services and bookings as they did here; a
+    call whose entity was removed or became ambiguous fails the flush.
+    """
+
+    def __init__(self, repository: SalonRepository, journal: SalonJournal) -> None:
+        self._repository = repository
+        self._journal = journal
+        self._salon: "Salon | None" = None
+        self._base_version: str | None = None
+        self._dirty = False
+        self._changes = 0
+
+    def load(self) -> "Salon":
+        if self._salon is None:
+            self._salon = self._restore()
+        return self._salon
+
+    def load_name(self) -> str:
+        if self._salon is not None:
+            return self._salon.get_name()
+        return self._repository.load_name()
+
+    def load_for_update(self) -> "Salon":
+        return self.load()
+
+    def _replay(self, entries: list[dict]) -> "Salon":
+        """Freshly loaded salon with entries applied, loaded for update."""
+        base = BatchSalonRepository(self._repository)
+        replay = SalonAppService(base)
+        try:
+            salon = base.load()
+            for number, entry in enumerate(entries, start=1):
+                try:
+                    args, kwargs = _retarget(salon, entry)
+                    getattr(replay, entry["op"])(*args, **kwargs)
+                except AppServiceError as error:
+                    raise AppServiceError(
+                        f"Journal entry {number} could not be replayed: {error.message}"
+                    ) from error
+        except Exception:
+            self._repository.invalidate()
+            raise
+        return salon
+
+    def _restore(self) -> "Salon":
+        self._base_version = self._repository.get_version()
+        entries = self._journal.pending(self._base_version)
+        if not entries:
+            self._journal.clear()
+        salon = self._replay(entries)
+        # Nothing is saved until flush(), which loads for update again.
+        self._repository.release()
+        self._dirty = bool(entries)
+        return salon
+
+    def save(self, salon: "Salon") -> None:
+        self._salon = salon
+        self._dirty = True
+        self._changes += 1
+
+    def record(
+        self,
+        operation: str,
+        args: tuple,
+        kwargs: dict,
+        targets: dict | None = None,
+    ) -> None:
+        self._journal.append(self._base_version, operation, args, kwargs, targets)
+
+    def get_version(self) -> str | None:
+        return f"{self._repository.get_version()}+{self._changes}"
+
+    def get_last_modified(self) -> datetime | None:
+        return self._repository.get_last_modified()
+
+    def invalidate(self) -> None:
+        # The failed call was not journaled, so the stored salon plus the
+        # journal is the last good state.
+        self._salon = None
+        self._repository.invalidate()
+
+    def is_dirty(self) -> bool:
+        return self._dirty
+
+    def flush(self) -> bool:
+        if not self._dirty:
+            return False
+        stored_version = self._repository.get_version()
+        salon = self._salon
+        if stored_version != self._base_version:
+            # Saved by another writer since this session loaded it.
+            self._repository.invalidate()
+            salon = self._replay(self._journal.pending(self._base_version))
+        self._journal.mark_flush_started(stored_version)
+        try:
+            self._repository.save(salon)
+        except Exception:
+            self._journal.mark_flush_failed()
+            raise
+        self._salon = salon
+        self._base_version = self._repository.get_version()
+        self._journal.mark_flushed()
+        self._journal.clear()
+        self._dirty = False
+        return True
+
+
+def _journaled(operation: str):
+    method = getattr(SalonAppService, operation)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            targets = _targets(self._repository.load(), operation, args, kwargs)
+            result = method(self, *args, **kwargs)
+            self._repository.record(operation, args, kwargs, targets)
+        return result
+
+    return wrapper
+
+
+class JournaledSalonAppService(SalonAppService):
+    """SalonAppService that journals every successful mutation."""
+
+    def __init__(
+        self,
+        repository: SessionSalonRepository,
+        write_lock: AbstractContextManager | None = None,
+    ) -> None:
+        super().__init__(repository, write_lock)
+
+
+for _operation in JOURNALED_OPERATIONS:
+    setattr(JournaledSalonAppService, _operation, _journaled(_operation))
+
+
+class SalonSession:
+    """
+    Keeps one loaded salon for a whole CLI session and saves it on a timer,
+    on flush() and on close(). Calls made since the last save are kept in
+    a journal next to the data file, so a crash loses none of them. A
+    failed timer flush is logged and kept for take_flush_error().
+    """
+
+    def __init__(
+        self,
+        repository: SalonRepository,
+        journal_path: str,
+        flush_interval: float = 30.0,
+    ) -> None:
+        self._lock = threading.RLock()
+        self._repository = SessionSalonRepository(repository, SalonJournal(journal_path))
+        self._flush_interval = flush_interval
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._flush_error: Exception | None = None
+        self.service = JournaledSalonAppService(self._repository, self._lock)
+
+    def start(self) -> "SalonSession":
+        if self._flush_interval > 0 and self._thread is None:
+            self._thread = threading.Thread(
+                target=self._flush_periodically,
+                name="salon-session-flush",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception as error:
+                # Keep the journal and try again on the next tick.
+                logger.exception("Salon session flush failed, changes stay in the journal")
+                with self._lock:
+                    self._flush_error = error
+
+    def has_unsaved_changes(self) -> bool:
+        with self._lock:
+            return self._repository.is_dirty()
+
+    def flush(self) -> bool:
+        with self._lock:
+            flushed = self._repository.flush()
+            self._flush_error = None
+            return flushed
+
+    def take_flush_error(self) -> Exception | None:
+        """Why the last timer flush failed, unless a flush succeeded since."""
+        with self._lock:
+            error, self._flush_error = self._flush_error, None
+            return error
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "SalonSession":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,49 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+class TimingRecorder:
+    """Sums wall time per phase name; repeated phases accumulate."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+
+_current_recorder: ContextVar[TimingRecorder | None] = ContextVar(
+    "salon_timing_recorder",
+    default=None,
+)
+
+
+@contextmanager
+def recording() -> Iterator[TimingRecorder]:
+    """Collects every timed() phase run in this context, e.g. one request."""
+    recorder = TimingRecorder()
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    recorder = _current_recorder.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.measure(name):
+        yield
@@ -39,3 +39,11 @@ class Cosmetics(InventoryItem):
             amount=data["amount"]
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> Self:
+        item = cls.__new__(cls)
+        item._name = data["name"]
+        item._description = data["desc"]
+        item._amount = data["amount"]
+        item._price = data["price"]
+        return item
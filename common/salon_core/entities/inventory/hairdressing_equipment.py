@@ -28,3 +28,11 @@ class HairdressingEquipment(InventoryItem):
             description=data["desc"],
             amount=data["amount"]
         )
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> Self:
+        item = cls.__new__(cls)
+        item._name = data["name"]
+        item._description = data["desc"]
+        item._amount = data["amount"]
+        return item
@@ -2,8 +2,12 @@
 from salon_core.entities.services.service import Service
 from salon_core.utils.booking_status import BookingStatus
 from salon_core.entities.management.master import Master
+from datetime import datetime
 from typing import Self
 
+_STATUSES: dict[str, BookingStatus] = {status.value: status for status in BookingStatus}
+
+
 class Booking:
 
     def __init__(
@@ -12,11 +16,14 @@ class Booking:
             service: Service,
             master: Master,
             status: BookingStatus,
+            start: datetime | None = None,
+            end: datetime | None = None,
     ) -> None:
         self.set_client(client)
         self.set_service(service)
         self.set_master(master)
         self.set_status(status)
+        self.set_time(start, end)
 
     def get_client(self) -> Client:
         return self.__client
@@ -30,6 +37,15 @@ class Booking:
     def get_status(self) -> BookingStatus:
         return self.__status
 
+    def get_start(self) -> datetime | None:
+        return self.__start
+
+    def get_end(self) -> datetime | None:
+        return self.__end
+
+    def is_timed(self) -> bool:
+        return self.__start is not None
+
     def set_master(self, master: Master) -> None:
         self.__master = master
 
@@ -42,6 +58,21 @@ class Booking:
     def set_service(self, service: Service) -> None:
         self.__service = service
 
+    def set_time(
+            self,
+            start: datetime | None,
+            end: datetime | None,
+    ) -> None:
+        if (start is None) != (end is None):
+            raise ValueError("Booking needs both start and end time")
+        if start is not None:
+            if not isinstance(start, datetime) or not isinstance(end, datetime):
+                raise TypeError("Booking time must be a datetime")
+            if end <= start:
+                raise ValueError("Booking must end after it starts")
+        self.__start = start
+        self.__end = end
+
     def __str__(self) -> str:
         return (
             f"Booking for {self.__client.get_name()}:\n"
@@ -64,16 +95,35 @@ class Booking:
             "master_name": self.__master.get_name(),
             "master_spec": self.__master.get_specialization().value,
             "service_name": self.__service.get_name(),
-            "status": self.__status.value
+            "status": self.__status.value,
+            "start": self.__start.isoformat() if self.__start else None,
+            "end": self.__end.isoformat() if self.__end else None
         }
 
     @classmethod
     def from_dict(cls, data: dict, master, service) -> Self:
         client = Client.from_dict(data["client"])
+        start = data.get("start")
+        end = data.get("end")
         return cls(
             client=client,
             service=service,
             master=master,
-            status=BookingStatus(data["status"])
+            status=BookingStatus(data["status"]),
+            start=datetime.fromisoformat(start) if start else None,
+            end=datetime.fromisoformat(end) if end else None
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict, master, service) -> Self:
+        start = data.get("start")
+        end = data.get("end")
+        booking = cls.__new__(cls)
+        booking.__client = Client.from_trusted_dict(data["client"])
+        booking.__service = service
+        booking.__master = master
+        booking.__status = _STATUSES[data["status"]]
+        booking.__start = datetime.fromisoformat(start) if start else None
+        booking.__end = datetime.fromisoformat(end) if end else None
+        return booking
+
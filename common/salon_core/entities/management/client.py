@@ -31,3 +31,10 @@ class Client:
     def from_dict(cls, data: dict) -> Self:
         return cls(name=data["name"], age=data["age"])
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> Self:
+        client = cls.__new__(cls)
+        client.__name = data["name"]
+        client.__age = data["age"]
+        return client
+
@@ -1,4 +1,5 @@
-﻿from salon_core.utils.masters_specialization import MastersSpecialization
+﻿from salon_core.entities.management.schedule import MasterSchedule
+from salon_core.utils.masters_specialization import MastersSpecialization
 from salon_core.utils.validator import validate_name, validate_age
 from typing import Self
 
@@ -14,6 +15,10 @@ class Master:
         self.set_name(name)
         self.set_age(age)
         self.set_specialization(specialization)
+        self.__schedule = MasterSchedule()
+
+    def get_schedule(self) -> MasterSchedule:
+        return self.__schedule
 
     def get_specialization(self) -> MastersSpecialization:
         return self.__specialization
@@ -69,3 +74,12 @@ class Master:
             specialization=MastersSpecialization(data["spec"])
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> Self:
+        master = cls.__new__(cls)
+        master.__name = data["name"]
+        master.__age = data["age"]
+        master.__specialization = MastersSpecialization(data["spec"])
+        master.__schedule = MasterSchedule()
+        return master
+
@@ -1,4 +1,5 @@
 ﻿from salon_core.entities.management.booking import Booking
+from salon_core.utils.booking_status import BookingStatus
 
 
 class Reception:
@@ -18,13 +19,27 @@ class Reception:
     def add_booking(self, booking: Booking) -> None:
         if not isinstance(booking, Booking):
             raise TypeError("Expected a Booking instance")
+        if booking.is_timed() and booking.get_status() != BookingStatus.CANCELLED:
+            booking.get_master().get_schedule().add(booking)
         self.__bookings.append(booking)
 
     def add_bookings(self, bookings: list[Booking]) -> None:
         for booking in bookings:
             self.add_booking(booking)
 
+    def add_trusted_bookings(self, bookings: list[Booking]) -> None:
+        """Adds saved bookings without re-checking master schedules."""
+        timed_by_master: dict = {}
+        for booking in bookings:
+            if booking.is_timed() and booking.get_status() != BookingStatus.CANCELLED:
+                timed_by_master.setdefault(booking.get_master(), []).append(booking)
+        for master, timed in timed_by_master.items():
+            master.get_schedule().add_trusted(timed)
+        self.__bookings.extend(bookings)
+
     def clear_bookings(self) -> None:
+        for booking in self.__bookings:
+            booking.get_master().get_schedule().remove(booking)
         self.__bookings = []
 
     def process_payment(self, amount: float) -> None:
@@ -0,0 +1,90 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator
+
+from salon_core.exceptions.exceptions import ScheduleConflictError
+
+if TYPE_CHECKING:
+    from salon_core.entities.management.booking import Booking
+
+
+class MasterSchedule:
+    """
+    Index of a master's timed bookings.
+    Intervals never overlap, so both starts and ends stay sorted and every
+    lookup is a binary search.
+    """
+
+    def __init__(self) -> None:
+        self.__starts: list[datetime] = []
+        self.__ends: list[datetime] = []
+        self.__bookings: list["Booking"] = []
+
+    def __len__(self) -> int:
+        return len(self.__bookings)
+
+    def __first_ending_after(self, moment: datetime) -> int:
+        return bisect_right(self.__ends, moment)
+
+    def has_conflict(self, start: datetime, end: datetime) -> bool:
+        index = self.__first_ending_after(start)
+        return index < len(self.__starts) and self.__starts[index] < end
+
+    def add(self, booking: "Booking") -> None:
+        start, end = booking.get_start(), booking.get_end()
+        if start is None or end is None:
+            raise ValueError("Only timed bookings can be scheduled")
+
+        index = self.__first_ending_after(start)
+        if index < len(self.__starts) and self.__starts[index] < end:
+            raise ScheduleConflictError(
+                f"Master {booking.get_master().get_name()} is busy "
+                f"from {self.__starts[index]} to {self.__ends[index]}"
+            )
+        self.__starts.insert(index, start)
+        self.__ends.insert(index, end)
+        self.__bookings.insert(index, booking)
+
+    def add_trusted(self, bookings: list["Booking"]) -> None:
+        """Adds timed bookings known not to overlap, e.g. from a save."""
+        merged = sorted(
+            self.__bookings + bookings,
+            key=lambda booking: booking.get_start(),
+        )
+        self.__starts = [booking.get_start() for booking in merged]
+        self.__ends = [booking.get_end() for booking in merged]
+        self.__bookings = merged
+
+    def remove(self, booking: "Booking") -> None:
+        start = booking.get_start()
+        if start is None:
+            return
+        index = bisect_left(self.__starts, start)
+        if index < len(self.__bookings) and self.__bookings[index] is booking:
+            del self.__starts[index]
+            del self.__ends[index]
+            del self.__bookings[index]
+
+    def bookings_between(
+            self,
+            start: datetime,
+            end: datetime
+    ) -> list["Booking"]:
+        first = self.__first_ending_after(start)
+        last = bisect_left(self.__starts, end, lo=first)
+        return self.__bookings[first:last]
+
+    def free_intervals(
+            self,
+            start: datetime,
+            end: datetime
+    ) -> Iterator[tuple[datetime, datetime]]:
+        cursor = start
+        index = self.__first_ending_after(start)
+        while index < len(self.__starts) and self.__starts[index] < end:
+            if self.__starts[index] > cursor:
+                yield cursor, self.__starts[index]
+            cursor = max(cursor, self.__ends[index])
+            index += 1
+        if cursor < end:
+            yield cursor, end
@@ -15,6 +15,8 @@ from salon_core.exceptions.exceptions import (
     ItemAmountError
 )
 from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.masters_specialization import MastersSpecialization
+from datetime import datetime
 
 
 class Salon:
@@ -22,6 +24,9 @@ class Salon:
     def __init__(self, name: str) -> None:
         self.__name: str = name
         self.__staff: list[Master] = []
+        self.__staff_by_specialization: dict[
+            MastersSpecialization, list[Master]
+        ] = {specialization: [] for specialization in MastersSpecialization}
         self.__reception: Reception = Reception()
         self.__inventory: list[InventoryItem] = []
         self.__services: list[Service] = []
@@ -36,12 +41,30 @@ class Salon:
         if master in self.__staff:
             raise StaffError(f"Master {master.get_name()} already hired")
         self.__staff.append(master)
+        self.__staff_by_specialization[master.get_specialization()].append(
+            master
+        )
 
     def fire_staff(self, master: Master) -> None:
         try:
             self.__staff.remove(master)
         except ValueError:
             raise StaffError(f"Master {master.get_name()} is not in staff")
+        self.__staff_by_specialization[master.get_specialization()].remove(
+            master
+        )
+
+    def get_masters_by_specialization(
+            self,
+            specialization: MastersSpecialization
+    ) -> list[Master]:
+        return self.__staff_by_specialization[specialization].copy()
+
+    def get_masters_for(self, service: Service) -> list[Master]:
+        masters: list[Master] = []
+        for specialization in service.get_required_specializations():
+            masters.extend(self.__staff_by_specialization[specialization])
+        return masters
 
     def add_service(self, service: Service) -> None:
         self.__services.append(service)
@@ -92,6 +115,8 @@ class Salon:
             client: Client,
             master: Master,
             service: Service,
+            start: datetime | None = None,
+            end: datetime | None = None,
     ) -> Booking:
         """
         РћРїРµСЂР°С†РёСЏ Р·Р°РїРёСЃРё РЅР° СѓСЃР»СѓРіСѓ.
@@ -118,7 +143,9 @@ class Salon:
             client=client,
             service=service,
             master=master,
-            status=BookingStatus.CONFIRMED
+            status=BookingStatus.CONFIRMED,
+            start=start,
+            end=end
         )
 
         self.__reception.add_booking(new_booking)
@@ -158,6 +185,12 @@ class Salon:
         self.__reception.process_payment(service.get_price())
         booking.set_status(BookingStatus.DONE)
 
+    def cancel_booking(self, booking: Booking) -> None:
+        if booking.get_status() != BookingStatus.CONFIRMED:
+            raise BookingStatusError("Only confirmed bookings can be cancelled")
+        booking.set_status(BookingStatus.CANCELLED)
+        booking.get_master().get_schedule().remove(booking)
+
     def find_product(self, product_name: str) -> InventoryItem | None:
         for product in self.__inventory:
             if product.get_name() == product_name:
@@ -40,7 +40,15 @@ class CosmeticProcedure(Service):
                 real_cosmetic.reduce_amount(1)
 
     def can_perform_by(self, master: Master) -> bool:
-        return master.get_specialization() == MastersSpecialization.COSMETICS
+        return (
+            master.get_specialization()
+            in self.get_required_specializations()
+        )
+
+    def get_required_specializations(
+            self,
+    ) -> tuple[MastersSpecialization, ...]:
+        return (MastersSpecialization.COSMETICS,)
 
     def to_dict(self) -> dict:
         return {
@@ -58,3 +66,11 @@ class CosmeticProcedure(Service):
             cosmetics=resources
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict, resources: list) -> Self:
+        service = cls.__new__(cls)
+        service._name = data["name"]
+        service._price = data["price"]
+        service._required_cosmetics = resources
+        return service
+
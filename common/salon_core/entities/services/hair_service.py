@@ -55,7 +55,15 @@ class HairService(Service):
                 real_item.use_equipment()
 
     def can_perform_by(self, master: Master) -> bool:
-        return master.get_specialization() in (
+        return (
+            master.get_specialization()
+            in self.get_required_specializations()
+        )
+
+    def get_required_specializations(
+            self,
+    ) -> tuple[MastersSpecialization, ...]:
+        return (
             MastersSpecialization.HAIR_STYLING,
             MastersSpecialization.HAIR_CUTTING
         )
@@ -76,3 +84,11 @@ class HairService(Service):
             required_equipment=resources
         )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict, resources: list) -> Self:
+        service = cls.__new__(cls)
+        service._name = data["name"]
+        service._price = data["price"]
+        service.__required_equipment = resources
+        return service
+
@@ -1,5 +1,6 @@
 ﻿from salon_core.entities.inventory.inventory_item import InventoryItem
 from salon_core.entities.management.master import Master
+from salon_core.utils.masters_specialization import MastersSpecialization
 from salon_core.utils.validator import validate_name
 from abc import ABC, abstractmethod
 
@@ -32,6 +33,12 @@ class Service(ABC):
     def can_perform_by(self, master: Master) -> bool:
         pass
 
+    @abstractmethod
+    def get_required_specializations(
+            self,
+    ) -> tuple[MastersSpecialization, ...]:
+        pass
+
     @abstractmethod
     def get_equipment(self) -> list[InventoryItem]:
         pass
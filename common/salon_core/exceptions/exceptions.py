@@ -56,3 +56,9 @@ class ItemAmountError(Exception):
     def __init__(self, msg: str) -> None:
         super().__init__(msg)
         self.msg: str = msg
+
+
+class ScheduleConflictError(Exception):
+    def __init__(self, msg: str) -> None:
+        super().__init__(msg)
+        self.msg: str = msg
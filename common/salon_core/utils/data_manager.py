@@ -1,54 +1,161 @@
-﻿import json
+﻿import gc
+import hashlib
+import json
 import os
+import re
+from typing import TYPE_CHECKING
 
-from salon_core.entities.inventory.inventory_item import InventoryItem
-from salon_core.entities.salon import Salon
-from salon_core.entities.management.master import Master
-from salon_core.entities.inventory.cosmetics import Cosmetics
-from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
-from salon_core.entities.services.hair_service import HairService
-from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
-from salon_core.entities.management.booking import Booking
-from salon_core.entities.services.service import Service
+from salon_core.utils.serializers import detect_serializer, get_serializer
+
+# load_name() reads only the head of the file, so the entities are
+# imported by the methods that build or write a salon.
+if TYPE_CHECKING:
+    from salon_core.entities.salon import Salon
+
+_NAME_HEADER = re.compile(r'\s*\{\s*"name"\s*:\s*')
+
+SCHEMA_VERSION = 1
 
 
 class SalonDataManager:
-    def __init__(self, file_path: str = "salon.json") -> None:
+    """
+    Saves the salon in data_format (see serializers.SERIALIZERS) next to a
+    checksum file holding the schema version and SHA-256 of what save()
+    wrote. load() reads any of the formats, and rebuilds entities through
+    from_trusted_dict(), without re-running validation, only while the
+    checksum still matches the file; any other file is validated.
+    """
+
+    HEADER_SIZE = 4096
+
+    def __init__(self, file_path: str = "salon.json", data_format: str = "json") -> None:
         self.__file_path = file_path
+        self.__checksum_path = f"{file_path}.checksum"
+        self.__serializer = get_serializer(data_format)
+
+    @staticmethod
+    def __checksum(raw: bytes) -> str:
+        return f"{SCHEMA_VERSION} {hashlib.sha256(raw).hexdigest()}"
 
-    def save(self, salon: Salon) -> None:
+    def save(self, salon: "Salon") -> bytes:
+        """Writes the salon and returns the bytes written."""
         data = {
             "name": salon.get_name(),
+            "schema": SCHEMA_VERSION,
             "balance": salon.check_balance(),
             "staff": [m.to_dict() for m in salon.get_staff()],
             "inventory": [i.to_dict() for i in salon.get_inventory()],
             "services": [s.to_dict() for s in salon.get_services()],
             "bookings": [b.to_dict() for b in salon.get_all_bookings()]
         }
-        with open(self.__file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        raw: bytes = self.__serializer.dumps(data)
+        self.save_raw(raw)
+        return raw
+
+    def save_raw(self, raw: bytes) -> None:
+        """Writes bytes another save() produced, e.g. a copy for a replica."""
+        with open(self.__file_path, 'wb') as f:
+            f.write(raw)
+        # Written after the data: a crash in between leaves a stale
+        # checksum, which only sends the next load down the validated path.
+        with open(self.__checksum_path, 'w', encoding='utf-8') as f:
+            f.write(self.__checksum(raw))
+
+    def saved_digest(self) -> str | None:
+        """SHA-256 of what save() last wrote, or None without a checksum file."""
+        try:
+            with open(self.__checksum_path, 'r', encoding='utf-8') as f:
+                checksum: str = f.read()
+        except FileNotFoundError:
+            return None
+        _, _, digest = checksum.partition(" ")
+        return digest or None
+
+    def is_trusted(self, raw: bytes) -> bool:
+        """Whether raw is exactly what save() last wrote with this schema."""
+        try:
+            with open(self.__checksum_path, 'r', encoding='utf-8') as f:
+                checksum: str = f.read()
+        except FileNotFoundError:
+            return False
+        return checksum == self.__checksum(raw)
+
+    def load_name(self) -> str:
+        """Reads the name that save() writes first, without parsing the rest."""
+        if not os.path.exists(self.__file_path):
+            return "New Salon"
+
+        with open(self.__file_path, 'rb') as f:
+            start: bytes = f.read(self.HEADER_SIZE)
+
+        serializer = detect_serializer(start, self.__serializer)
+        head: str = serializer.head(start, self.HEADER_SIZE).decode('utf-8', errors='ignore')
+
+        match = _NAME_HEADER.match(head)
+        if match is not None:
+            try:
+                name, _ = json.JSONDecoder().raw_decode(head, match.end())
+            except json.JSONDecodeError:
+                name = None
+            if isinstance(name, str):
+                return name
+        return self.load().get_name()
+
+    def load(self) -> "Salon":
+        from salon_core.entities.salon import Salon
 
-    def load(self) -> Salon:
         if not os.path.exists(self.__file_path):
             return Salon("New Salon")
 
-        with open(self.__file_path, 'r', encoding='utf-8') as f:
-            data: dict = json.load(f)
+        with open(self.__file_path, 'rb') as f:
+            raw: bytes = f.read()
+
+        # Every object built here stays alive, so the collector's passes
+        # over the growing heap during a large load find nothing to free.
+        gc_was_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            data: dict = detect_serializer(raw, self.__serializer).loads(raw)
+            trusted: bool = data.get("schema") == SCHEMA_VERSION and self.is_trusted(raw)
+            return self.build(data, trusted)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @staticmethod
+    def build(data: dict, trusted: bool = False) -> "Salon":
+        """
+        Rebuilds a salon from saved data. trusted skips the entity checks
+        and must only be used for data save() wrote.
+        """
+        from salon_core.entities.inventory.cosmetics import Cosmetics
+        from salon_core.entities.inventory.hairdressing_equipment import (
+            HairdressingEquipment,
+        )
+        from salon_core.entities.inventory.inventory_item import InventoryItem
+        from salon_core.entities.management.booking import Booking
+        from salon_core.entities.management.master import Master
+        from salon_core.entities.salon import Salon
+        from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+        from salon_core.entities.services.hair_service import HairService
+        from salon_core.entities.services.service import Service
+
+        build = "from_trusted_dict" if trusted else "from_dict"
 
         salon = Salon(data["name"])
         salon.get_reception().set_balance(data.get("balance", 0.0))
 
         m_data: dict
         for m_data in data.get("staff", []):
-            salon.hire_staff(Master.from_dict(m_data))
+            salon.hire_staff(getattr(Master, build)(m_data))
 
         i_data: dict
         for i_data in data.get("inventory", []):
             if i_data["type"] == "Cosmetics":
-                salon.add_to_inventory(Cosmetics.from_dict(i_data))
+                salon.add_to_inventory(getattr(Cosmetics, build)(i_data))
             else:
                 salon.add_to_inventory(
-                    HairdressingEquipment.from_dict(i_data)
+                    getattr(HairdressingEquipment, build)(i_data)
                 )
 
         s_data: dict
@@ -59,29 +166,36 @@ class SalonDataManager:
             resources: list[InventoryItem] = [r for r in raw_resources if r is not None]
 
             if s_data["type"] == "HairService":
-                salon.add_service(HairService.from_dict(s_data, resources))
+                salon.add_service(getattr(HairService, build)(s_data, resources))
             else:
                 salon.add_service(
-                    CosmeticProcedure.from_dict(s_data, resources)
+                    getattr(CosmeticProcedure, build)(s_data, resources)
                 )
 
+        # First match wins, as the linear search over staff and services did.
+        masters: dict[tuple[str, str], Master] = {}
+        for master in reversed(salon.get_staff()):
+            masters[(master.get_name(), master.get_specialization().value)] = master
+        services: dict[str, Service] = {}
+        for service in reversed(salon.get_services()):
+            services[service.get_name()] = service
+
+        build_booking = getattr(Booking, build)
+        bookings: list[Booking] = []
         b_data: dict
         for b_data in data.get("bookings", []):
-            service: Service | None = salon.find_service_by_name(b_data["service_name"])
-
-            master: Master | None = next(
-                (
-                    m for m in salon.get_staff()
-                    if m.get_name() == b_data["master_name"] and
-                       m.get_specialization().value == b_data["master_spec"]
-                ),
-                None
+            service: Service | None = services.get(b_data["service_name"])
+            master: Master | None = masters.get(
+                (b_data["master_name"], b_data["master_spec"])
             )
 
             if master is not None and service is not None:
-                salon.get_reception().add_booking(
-                    Booking.from_dict(b_data, master, service)
-                )
+                bookings.append(build_booking(b_data, master, service))
+
+        if trusted:
+            salon.get_reception().add_trusted_bookings(bookings)
+        else:
+            salon.get_reception().add_bookings(bookings)
 
         return salon
 
@@ -0,0 +1,126 @@
+import gzip
+import json
+import zlib
+from abc import ABC, abstractmethod
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SalonSerializer(ABC):
+    """Turns the dict SalonDataManager saves into bytes and back."""
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, data: dict) -> bytes:
+        pass
+
+    def loads(self, raw: bytes) -> dict:
+        return json.loads(raw)
+
+    def head(self, start: bytes, size: int) -> bytes:
+        """Up to size bytes of serialized JSON from the start of a file."""
+        return start[:size]
+
+
+class JsonSerializer(SalonSerializer):
+    name = "json"
+
+    def dumps(self, data: dict) -> bytes:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+class CompactJsonSerializer(SalonSerializer):
+    name = "json-compact"
+
+    def dumps(self, data: dict) -> bytes:
+        return json.dumps(
+            data,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class OrjsonSerializer(SalonSerializer):
+    """Compact JSON through orjson; only available when it is installed."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: dict) -> bytes:
+        return self._orjson.dumps(data)
+
+    def loads(self, raw: bytes) -> dict:
+        return self._orjson.loads(raw)
+
+
+class GzipJsonSerializer(SalonSerializer):
+    name = "json-gzip"
+
+    def __init__(self, compresslevel: int = 6) -> None:
+        self._compresslevel = compresslevel
+        self._json = CompactJsonSerializer()
+
+    def dumps(self, data: dict) -> bytes:
+        return gzip.compress(self._json.dumps(data), self._compresslevel, mtime=0)
+
+    def loads(self, raw: bytes) -> dict:
+        return self._json.loads(gzip.decompress(raw))
+
+    def head(self, start: bytes, size: int) -> bytes:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            return decompressor.decompress(start, size)
+        except zlib.error:
+            return b""
+
+
+SERIALIZERS: dict[str, type[SalonSerializer]] = {
+    serializer.name: serializer
+    for serializer in (
+        JsonSerializer,
+        CompactJsonSerializer,
+        OrjsonSerializer,
+        GzipJsonSerializer,
+    )
+}
+
+
+def get_serializer(name: str) -> SalonSerializer:
+    if name not in SERIALIZERS:
+        raise ValueError(
+            f"Unknown salon data format: {name} "
+            f"(expected one of {', '.join(SERIALIZERS)})"
+        )
+    try:
+        return SERIALIZERS[name]()
+    except ImportError as error:
+        raise ValueError(f"Salon data format {name} needs {error.name}") from error
+
+
+def available_formats() -> list[str]:
+    formats = []
+    for name in SERIALIZERS:
+        try:
+            get_serializer(name)
+        except ValueError:
+            continue
+        formats.append(name)
+    return formats
+
+
+def detect_serializer(raw: bytes, preferred: SalonSerializer) -> SalonSerializer:
+    """
+    Serializer that can read raw whatever format it was saved in: gzip is
+    recognised by its magic bytes, and every other format is plain JSON,
+    read by preferred unless preferred is the gzip one.
+    """
+    if raw[:2] == GZIP_MAGIC:
+        return preferred if isinstance(preferred, GzipJsonSerializer) else GzipJsonSerializer()
+    if isinstance(preferred, GzipJsonSerializer):
+        return JsonSerializer()
+    return preferred
@@ -0,0 +1,80 @@
+"""
+Client name search benchmark for BookingSearchIndex.
+
+Indexes synthetic client names, then times prefix and substring lookups
+against a linear scan comparing every client name, as the service did
+before the index existed.
+
+    cd lab1
+    python benchmarks/booking_search.py --bookings 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+LAB_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(LAB_DIR), str(LAB_DIR.parent / "common")]
+
+from salon_core.application.search import BookingSearchIndex, normalize_name  # noqa: E402
+
+FIRST_NAMES = ["Anna", "John", "Mary", "Olga", "Ivan", "Kate", "Liz", "Pavel", "Nina", "Oleg"]
+SYLLABLES = ["ko", "va", "le", "ski", "nov", "ich", "ra", "mi", "chen", "son", "ber", "tus"]
+QUERIES = ["an", "ivan", "kovale", "nov", "mira", "ichson", "pavel ber", "zzz"]
+
+
+def client_names(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(FIRST_NAMES)} "
+        f"{''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()}"
+        for _ in range(count)
+    ]
+
+
+def _best_of(action, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bookings", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    names = client_names(args.bookings)
+    index = BookingSearchIndex()
+    started = time.perf_counter()
+    index.rebuild(names, "bench")
+    build_seconds = time.perf_counter() - started
+
+    def scan(query: str) -> list[int]:
+        query = normalize_name(query)
+        found = []
+        for booking_index, name in enumerate(names):
+            if query in normalize_name(name):
+                found.append(booking_index)
+                if len(found) >= args.limit:
+                    break
+        return found
+
+    print(f"{args.bookings} bookings, index built in {build_seconds:.2f} s")
+    print(f"{'query':<12}{'hits':>6}{'index ms':>12}{'scan ms':>12}")
+    for query in QUERIES:
+        hits = len(index.search(query, args.limit))
+        index_seconds = _best_of(lambda: index.search(query, args.limit), args.repeat)
+        scan_seconds = _best_of(lambda: scan(query), max(1, args.repeat // 10))
+        print(f"{query:<12}{hits:>6}{index_seconds * 1000:>12.3f}{scan_seconds * 1000:>12.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Replay benchmark for EventSourcedSalonRepository.
+
+Writes a synthetic log of bookings being created, completed or cancelled
+and paid, then measures a full replay, a checkpoint, a load from that
+snapshot plus a tail of new events, and a time-travel load_at() halfway
+through the log.
+
+    cd lab1
+    python benchmarks/event_replay.py --events 1000000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+LAB_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(LAB_DIR), str(LAB_DIR.parent / "common")]
+
+from salon_core.application.repositories.event_sourced_repository import (  # noqa: E402
+    COMPACT_JSON,
+    LOG_NAME,
+    EventSourcedSalonRepository,
+)
+
+START = datetime(2026, 1, 5, 9, 0)
+
+
+def _initial_state(stock: int) -> dict:
+    return {
+        "name": "Benchmark Salon",
+        "balance": 0.0,
+        "masters": [["Anna", 30, "Cosmetics master"], ["Olga", 35, "Hair cutting master"]],
+        "staff": [0, 1],
+        "items": [
+            ["cosmetics", "Serum", "Hydrating", stock, 20.0],
+            ["equipment", "Scissors", "Steel", 5, None],
+        ],
+        "services": [["cosmetic", "Facial", 30.0, [0]], ["hair", "Haircut", 15.0, [1]]],
+        "offered": [0, 1],
+        "bookings": [],
+    }
+
+
+def iter_events(first_seq: int, count: int, first_booking: int = 0):
+    """
+    Yields `count` events; each booking adds a booking event, then a done
+    or cancelled status and, for done cosmetic bookings, stock and balance.
+    """
+    seq = first_seq
+    last_seq = first_seq + count - 1
+    if seq == 1:
+        yield [seq, "reset", _initial_state(10 ** 9)]
+        seq += 1
+
+    booking = first_booking
+    stock = 10 ** 9
+    balance = 0.0
+    while seq <= last_seq:
+        master = booking % 2
+        start = START + timedelta(hours=booking)
+        end = start + timedelta(minutes=45)
+        pending = [
+            [
+                "booking",
+                f"Client {booking}",
+                18 + booking % 60,
+                master,
+                master,
+                "Confirmed",
+                start.isoformat(),
+                end.isoformat(),
+            ]
+        ]
+        if booking % 10 == 9:
+            pending.append(["status", booking, "Cancelled"])
+        else:
+            pending.append(["status", booking, "Done"])
+            if master == 0:
+                stock -= 1
+                pending.append(["amount", 0, stock])
+            balance += 30.0 if master == 0 else 15.0
+            pending.append(["balance", balance])
+        for event in pending:
+            if seq > last_seq:
+                break
+            yield [seq, *event]
+            seq += 1
+        booking += 1
+
+
+def write_events(path: Path, events) -> int:
+    written = 0
+    with open(path, "a", encoding="utf-8") as log_file:
+        for event in events:
+            log_file.write(json.dumps(event, **COMPACT_JSON) + "\n")
+            written += 1
+    return written
+
+
+def _timed(action):
+    started = time.perf_counter()
+    result = action()
+    return time.perf_counter() - started, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--tail", type=int, default=10_000, help="events appended after the snapshot")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="salon-events-") as temp_dir:
+        directory = Path(temp_dir)
+        log_path = directory / LOG_NAME
+        write_seconds, _ = _timed(lambda: write_events(log_path, iter_events(1, args.events)))
+        log_mb = log_path.stat().st_size / 2 ** 20
+
+        repository = EventSourcedSalonRepository(str(directory))
+        replay_seconds, salon = _timed(repository.load)
+        bookings = len(salon.get_all_bookings())
+        checkpoint_seconds, _ = _timed(repository.checkpoint)
+        snapshot_mb = sum(p.stat().st_size for p in directory.glob("snapshot-*.json")) / 2 ** 20
+
+        write_events(
+            log_path,
+            iter_events(args.events + 1, args.tail, first_booking=bookings),
+        )
+        tail_seconds, _ = _timed(EventSourcedSalonRepository(str(directory)).load)
+        travel_seconds, _ = _timed(
+            lambda: EventSourcedSalonRepository(str(directory)).load_at(args.events // 2)
+        )
+
+    rate = args.events / replay_seconds
+    print(f"log: {args.events} events, {bookings} bookings, {log_mb:.1f} MB (written in {write_seconds:.2f} s)")
+    print(f"{'full replay':<34}{replay_seconds:>8.2f} s  ({rate:,.0f} events/s)")
+    print(f"{'checkpoint':<34}{checkpoint_seconds:>8.2f} s  ({snapshot_mb:.1f} MB snapshot)")
+    print(f"{f'snapshot + {args.tail} tail events':<34}{tail_seconds:>8.2f} s")
+    print(f"{f'load_at({args.events // 2}) from the start':<34}{travel_seconds:>8.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Size, save and load benchmark for the SalonDataManager data formats.
+
+Saves the same synthetic salon in every format that can be used here
+(orjson only when it is installed) and reports the file size, save()
+and load() time, and how long load_name() takes on that file.
+
+    cd lab1
+    python benchmarks/serializers.py --bookings 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+LAB_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(LAB_DIR), str(LAB_DIR.parent / "common")]
+
+from salon_core.utils.data_manager import SalonDataManager  # noqa: E402
+from salon_core.utils.serializers import SERIALIZERS, available_formats  # noqa: E402
+from trusted_load import build_salon  # noqa: E402
+
+
+def _best_of(action, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bookings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    salon = build_salon(args.bookings)
+    formats = available_formats()
+    missing = [name for name in SERIALIZERS if name not in formats]
+
+    print(f"{args.bookings} bookings (best of {args.repeat})")
+    print(f"{'format':<14}{'size MB':>10}{'save ms':>10}{'load ms':>10}{'name ms':>10}")
+    with tempfile.TemporaryDirectory(prefix="salon-formats-") as temp_dir:
+        for data_format in formats:
+            data_manager = SalonDataManager(str(Path(temp_dir) / data_format), data_format)
+            save_seconds = _best_of(lambda: data_manager.save(salon), args.repeat)
+            size_mb = (Path(temp_dir) / data_format).stat().st_size / 2 ** 20
+            load_seconds = _best_of(data_manager.load, args.repeat)
+            name_seconds = _best_of(data_manager.load_name, args.repeat)
+            print(
+                f"{data_format:<14}{size_mb:>10.1f}{save_seconds * 1000:>10.1f}"
+                f"{load_seconds * 1000:>10.1f}{name_seconds * 1000:>10.3f}"
+            )
+    if missing:
+        print(f"not installed: {', '.join(missing)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Cold start benchmark for the lab1 CLI.
+
+Every measurement runs in a fresh interpreter. The report shows where
+`import src.main` spends its time (per package, from `python -X importtime`),
+how long the CLI takes from launch to its menu and exit, and how long a full
+salon load takes, which is what the welcome banner used to cost.
+
+    cd lab1
+    python benchmarks/startup.py --bookings 20000 --runs 7
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+LAB_DIR = Path(__file__).resolve().parent.parent
+COMMON_DIR = LAB_DIR.parent / "common"
+
+IMPORT_GROUPS = (
+    ("salon_core.entities", "salon_core.entities"),
+    ("salon_core.application", "salon_core.application"),
+    ("salon_core.utils", "salon_core (utils, exceptions)"),
+    ("salon_core.exceptions", "salon_core (utils, exceptions)"),
+    ("src", "src (lab1 interface)"),
+)
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(LAB_DIR), str(COMMON_DIR)])
+    return env
+
+
+def _run(args: list[str], stdin: str = "") -> tuple[float, str, str]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=LAB_DIR,
+        env=_env(),
+        check=True,
+    )
+    return time.perf_counter() - started, completed.stdout, completed.stderr
+
+
+def _group_of(module: str) -> str:
+    for prefix, label in IMPORT_GROUPS:
+        if module == prefix or module.startswith(prefix + "."):
+            return label
+    return "stdlib and third party"
+
+
+def import_profile(module: str) -> tuple[float, dict[str, float], dict[str, float]]:
+    """Returns total import time, self time per group and per module (ms)."""
+    _, _, stderr = _run(["-X", "importtime", "-c", f"import {module}"])
+    total = 0.0
+    groups: dict[str, float] = {}
+    modules: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        self_ms = int(self_us) / 1000
+        group = _group_of(name)
+        groups[group] = groups.get(group, 0.0) + self_ms
+        modules[name] = self_ms
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, groups, modules
+
+
+def write_salon(path: Path, bookings: int) -> None:
+    from salon_core.application.repositories.json_repository import (
+        JsonSalonRepository,
+    )
+    from salon_core.application.service import SalonAppService
+
+    service = SalonAppService(JsonSalonRepository(str(path), "Benchmark Salon"))
+    with service.batch() as batch:
+        batch.hire_master("Anna", 30, "COSMETICS")
+        batch.hire_master("Olga", 35, "HAIR_CUTTING")
+        batch.restock_or_create_item(
+            name="Serum",
+            category="cosmetics",
+            initial_amount=bookings + 10,
+            price=20.0,
+        )
+        batch.restock_or_create_item(
+            name="Scissors",
+            category="equipment",
+            initial_amount=5,
+        )
+        batch.add_service("Facial", 30.0, "cosmetic", [0])
+        batch.add_service("Haircut", 15.0, "hair", [0])
+        for number in range(bookings):
+            batch.create_booking(f"Client {number}", 20 + number % 50, number % 2, number % 2)
+
+
+def _median_ms(samples: list[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per measurement")
+    parser.add_argument("--bookings", type=int, default=10000, help="bookings in the test salon")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args(argv)
+
+    sys.path[:0] = [str(LAB_DIR), str(COMMON_DIR)]
+    with tempfile.TemporaryDirectory(prefix="salon-startup-") as temp_dir:
+        data_path = Path(temp_dir) / "salon.json"
+        write_salon(data_path, args.bookings)
+        size_kb = data_path.stat().st_size / 1024
+
+        interpreter = [_run(["-c", "pass"])[0] for _ in range(args.runs)]
+        to_menu = [
+            _run(["-m", "src.main", "--data", str(data_path)], stdin="0\n")[0]
+            for _ in range(args.runs)
+        ]
+        full_load_code = (
+            "import time;"
+            "from salon_core.application.repositories.json_repository "
+            "import JsonSalonRepository;"
+            "started = time.perf_counter();"
+            f"JsonSalonRepository({str(data_path)!r}).load();"
+            "print(time.perf_counter() - started)"
+        )
+        full_load = [float(_run(["-c", full_load_code])[1]) for _ in range(args.runs)]
+
+    profiles = [import_profile("src.main") for _ in range(args.runs)]
+    import_total = statistics.median(profile[0] for profile in profiles)
+    group_names = sorted({name for profile in profiles for name in profile[1]})
+    groups = {
+        name: statistics.median(profile[1].get(name, 0.0) for profile in profiles)
+        for name in group_names
+    }
+    module_names = {name for profile in profiles for name in profile[2]}
+    modules = {
+        name: statistics.median(profile[2].get(name, 0.0) for profile in profiles)
+        for name in module_names
+    }
+
+    print(f"Salon file: {args.bookings} bookings, {size_kb:.0f} KB; medians of {args.runs} runs")
+    print()
+    print(f"{'interpreter start (python -c pass)':<40}{_median_ms(interpreter):>10.1f} ms")
+    print(f"{'import src.main':<40}{import_total:>10.1f} ms")
+    print(f"{'CLI launch -> banner -> menu -> exit':<40}{_median_ms(to_menu):>10.1f} ms")
+    print(f"{'full salon load (deferred to 1st use)':<40}{_median_ms(full_load):>10.1f} ms")
+    print()
+    print("import src.main, self time by package:")
+    for name, ms in sorted(groups.items(), key=lambda pair: -pair[1]):
+        print(f"  {name:<38}{ms:>10.1f} ms")
+    print()
+    print(f"slowest {args.top} modules (self time):")
+    for name, ms in sorted(modules.items(), key=lambda pair: -pair[1])[: args.top]:
+        print(f"  {name:<38}{ms:>10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Load benchmark for SalonDataManager's trusted path.
+
+Saves a synthetic salon with many bookings, then times load() of the
+file as saved (checksum matches, entities built by from_trusted_dict)
+against load() after the checksum file is removed (every entity goes
+through its validating constructor). Parsing and hashing are timed
+separately, so the entity build time of each path can be told apart
+from the JSON parse both of them share.
+
+    cd lab1
+    python benchmarks/trusted_load.py --bookings 100000
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+LAB_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(LAB_DIR), str(LAB_DIR.parent / "common")]
+
+from salon_core.entities.inventory.cosmetics import Cosmetics  # noqa: E402
+from salon_core.entities.inventory.hairdressing_equipment import (  # noqa: E402
+    HairdressingEquipment,
+)
+from salon_core.entities.management.booking import Booking  # noqa: E402
+from salon_core.entities.management.client import Client  # noqa: E402
+from salon_core.entities.management.master import Master  # noqa: E402
+from salon_core.entities.salon import Salon  # noqa: E402
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure  # noqa: E402
+from salon_core.entities.services.hair_service import HairService  # noqa: E402
+from salon_core.utils.booking_status import BookingStatus  # noqa: E402
+from salon_core.utils.data_manager import SalonDataManager  # noqa: E402
+from salon_core.utils.masters_specialization import MastersSpecialization  # noqa: E402
+
+START = datetime(2026, 1, 5, 9, 0)
+MASTERS = 20
+
+
+def build_salon(bookings: int) -> Salon:
+    salon = Salon("Benchmark Salon")
+    serum = Cosmetics("Serum", 20.0, "Hydrating", 10 ** 9)
+    scissors = HairdressingEquipment("Scissors", "Steel", 10 ** 9)
+    salon.add_to_inventory(serum)
+    salon.add_to_inventory(scissors)
+    facial = CosmeticProcedure("Facial", 30.0, [serum])
+    haircut = HairService("Haircut", 15.0, [scissors])
+    salon.add_service(facial)
+    salon.add_service(haircut)
+
+    masters = []
+    for index in range(MASTERS):
+        specialization = (
+            MastersSpecialization.COSMETICS if index % 2 == 0
+            else MastersSpecialization.HAIR_CUTTING
+        )
+        master = Master(f"Master {index}", 30, specialization)
+        salon.hire_staff(master)
+        masters.append(master)
+
+    for index in range(bookings):
+        master = masters[index % MASTERS]
+        service = facial if index % 2 == 0 else haircut
+        start = START + timedelta(hours=index // MASTERS)
+        booking = Booking(
+            Client(f"Client {index}", 18 + index % 60),
+            service,
+            master,
+            BookingStatus.CONFIRMED,
+            start,
+            start + timedelta(minutes=45),
+        )
+        salon.get_reception().add_booking(booking)
+    return salon
+
+
+def _best_of(action, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bookings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="salon-load-") as temp_dir:
+        data_path = Path(temp_dir) / "salon.json"
+        checksum_path = Path(f"{data_path}.checksum")
+        data_manager = SalonDataManager(str(data_path))
+        data_manager.save(build_salon(args.bookings))
+        raw = data_path.read_bytes()
+
+        parse_seconds = _best_of(lambda: json.loads(raw), args.repeat)
+        hash_seconds = _best_of(lambda: hashlib.sha256(raw).hexdigest(), args.repeat)
+        trusted_seconds = _best_of(data_manager.load, args.repeat)
+        checksum = checksum_path.read_text(encoding="utf-8")
+        checksum_path.unlink()
+        validated_seconds = _best_of(data_manager.load, args.repeat)
+        checksum_path.write_text(checksum, encoding="utf-8")
+
+    size_mb = len(raw) / 2 ** 20
+    validated_build = validated_seconds - parse_seconds
+    trusted_build = trusted_seconds - parse_seconds - hash_seconds
+    print(f"{args.bookings} bookings, {size_mb:.1f} MB file (best of {args.repeat})")
+    print(f"{'json parse only':<28}{parse_seconds * 1000:>10.1f} ms")
+    print(f"{'sha256 of the file':<28}{hash_seconds * 1000:>10.1f} ms")
+    print(
+        f"{'validated load()':<28}{validated_seconds * 1000:>10.1f} ms"
+        f"  (entities {validated_build * 1000:.1f} ms)"
+    )
+    print(
+        f"{'trusted load()':<28}{trusted_seconds * 1000:>10.1f} ms"
+        f"  (entities {trusted_build * 1000:.1f} ms)"
+    )
+    saved = validated_seconds - trusted_seconds
+    print(f"saved {saved * 1000:.1f} ms per load ({saved / validated_seconds:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
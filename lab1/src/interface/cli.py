@@ -1,24 +1,32 @@
 ﻿import sys
-from typing import Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable
 
 from salon_core.application.errors import AppServiceError
-from salon_core.application.service import SalonAppService
-from salon_core.entities.inventory.cosmetics import Cosmetics
-from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
-from salon_core.entities.inventory.inventory_item import InventoryItem
-from salon_core.entities.management.booking import Booking
-from salon_core.entities.management.master import Master
-from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
-from salon_core.entities.services.hair_service import HairService
-from salon_core.entities.services.service import Service
-from salon_core.utils.booking_status import BookingStatus
 from salon_core.utils.masters_specialization import MastersSpecialization
 from salon_core.utils.validator import validate_age, validate_name
 
+# Entities are imported by the menus that use them, so the welcome banner
+# does not wait for the salon model to load (see tests/startup_test.py).
+if TYPE_CHECKING:
+    from salon_core.application.service import SalonAppService
+    from salon_core.application.session import SalonSession
+    from salon_core.entities.inventory.cosmetics import Cosmetics
+    from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+    from salon_core.entities.inventory.inventory_item import InventoryItem
+    from salon_core.entities.management.booking import Booking
+    from salon_core.entities.management.master import Master
+    from salon_core.entities.services.service import Service
+
 
 class SalonCLI:
-    def __init__(self, app_service: SalonAppService) -> None:
+    def __init__(
+        self,
+        app_service: "SalonAppService",
+        session: "SalonSession | None" = None,
+    ) -> None:
         self.__app_service = app_service
+        self.__session = session
         self.__is_running: bool = True
 
     def run(self) -> None:
@@ -28,18 +36,20 @@ class SalonCLI:
         )
 
         while self.__is_running:
+            self.__report_flush_error()
             self.__show_main_menu()
             choice: str = input("Select an option: ").strip()
             self.__handle_main_menu(choice)
 
-    @staticmethod
-    def __show_main_menu() -> None:
+    def __show_main_menu(self) -> None:
         print("\n--- MAIN MENU ---")
         print("1. Staff Management")
         print("2. Inventory & Sales")
         print("3. Booking Management")
         print("4. Service Management")
         print("5. Finance & History")
+        if self.__session is not None:
+            print("9. Save Now")
         print("0. Exit")
 
     def __handle_main_menu(self, choice: str) -> None:
@@ -53,11 +63,27 @@ class SalonCLI:
             self.__service_menu()
         elif choice == "5":
             self.__finance_menu()
+        elif choice == "9" and self.__session is not None:
+            self.__safe_execute(self.__handle_save_now)
         elif choice == "0":
             self.__exit_app()
         else:
             print("Invalid input. Please try again.")
 
+    def __report_flush_error(self) -> None:
+        error = self.__session.take_flush_error() if self.__session else None
+        if error is not None:
+            print(
+                f"\n[SALON ERROR]: Autosave failed: {error}\n"
+                "Your changes are kept in the session journal; use 9 to retry."
+            )
+
+    def __handle_save_now(self) -> None:
+        if self.__session.flush():
+            print("Salon data saved.")
+        else:
+            print("Nothing to save.")
+
     def __handle_hire_staff(self) -> None:
         name: str = input("Enter master's name: ")
         age = int(input("Enter master's age: "))
@@ -140,6 +166,11 @@ class SalonCLI:
                 break
 
     def __view_inventory(self) -> None:
+        from salon_core.entities.inventory.cosmetics import Cosmetics
+        from salon_core.entities.inventory.hairdressing_equipment import (
+            HairdressingEquipment,
+        )
+
         all_items: list[InventoryItem] = self.__app_service.list_inventory()
         if not all_items:
             print("\nInventory is empty.")
@@ -243,6 +274,9 @@ class SalonCLI:
                 print("Invalid input.")
 
     def __show_services(self) -> None:
+        from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+        from salon_core.entities.services.hair_service import HairService
+
         services: list[Service] = self.__app_service.list_services()
         if not services:
             print("\nNo services available.")
@@ -270,6 +304,11 @@ class SalonCLI:
             print(f"   Required {resource_label}: {resource_str}")
 
     def __handle_add_service(self) -> None:
+        from salon_core.entities.inventory.cosmetics import Cosmetics
+        from salon_core.entities.inventory.hairdressing_equipment import (
+            HairdressingEquipment,
+        )
+
         name = input("Service name: ")
         price = float(input("Service price: "))
         print("\nService Type: 1. Hair Service, 2. Cosmetic Procedure")
@@ -347,6 +386,8 @@ class SalonCLI:
             print("1. Create New Booking")
             print("2. Execute Booking (Hair/Cosmetic)")
             print("3. Cancel Booking")
+            print("4. Find Free Slots")
+            print("5. Search Bookings by Client")
             print("0. Back to Main Menu")
 
             choice = input("Select an action: ").strip()
@@ -357,6 +398,10 @@ class SalonCLI:
                 self.__safe_execute(self.__handle_execute_service)
             elif choice == "3":
                 self.__safe_execute(self.__handle_cancel_booking)
+            elif choice == "4":
+                self.__safe_execute(self.__handle_find_slots)
+            elif choice == "5":
+                self.__safe_execute(self.__handle_search_bookings)
             elif choice == "0":
                 break
             else:
@@ -384,9 +429,86 @@ class SalonCLI:
             print(f"{i}. {service.get_name()} ({service.get_price()}BYN)")
         s_idx = int(input("Choice: ")) - 1
 
-        self.__app_service.create_booking(client_name, client_age, m_idx, s_idx)
+        start: datetime | None = None
+        end: datetime | None = None
+        start_input: str = input(
+            "Start time (YYYY-MM-DD HH:MM, empty for no time): "
+        ).strip()
+        if start_input:
+            start = datetime.fromisoformat(start_input)
+            duration = int(input("Duration in minutes: "))
+            end = start + timedelta(minutes=duration)
+
+        self.__app_service.create_booking(
+            client_name,
+            client_age,
+            m_idx,
+            s_idx,
+            start,
+            end,
+        )
         print(f"Successfully booked {services[s_idx].get_name()} for {client_name}.")
 
+    def __handle_find_slots(self) -> None:
+        services: list[Service] = self.__app_service.list_services()
+        if not services:
+            raise ValueError("No services available.")
+        print("\nSelect Service:")
+        for i, service in enumerate(services, 1):
+            print(f"{i}. {service.get_name()} ({service.get_price()}BYN)")
+        s_idx = int(input("Choice: ")) - 1
+
+        window_start = datetime.fromisoformat(
+            input("Search from (YYYY-MM-DD HH:MM): ").strip()
+        )
+        window_end = datetime.fromisoformat(
+            input("Search until (YYYY-MM-DD HH:MM): ").strip()
+        )
+        duration = int(input("Duration in minutes: "))
+        count = int(input("How many slots to show? "))
+
+        slots = self.__app_service.find_slots(
+            s_idx,
+            (window_start, window_end),
+            count,
+            timedelta(minutes=duration),
+        )
+        if not slots:
+            print("\nNo free slots in this window.")
+            return
+
+        print("\n--- FREE SLOTS ---")
+        for slot in slots:
+            print(
+                f"{slot.start:%Y-%m-%d %H:%M} - {slot.end:%H:%M} | "
+                f"Master: {slot.master.get_name()}"
+            )
+
+    def __handle_search_bookings(self) -> None:
+        query: str = input("Client name or part of it: ").strip()
+        if not query:
+            raise ValueError("Search query is empty.")
+
+        bookings: list[Booking] = self.__app_service.search_bookings(query)
+        if not bookings:
+            print(f"\nNo bookings for '{query}'.")
+            return
+
+        print("\n--- FOUND BOOKINGS ---")
+        for booking in bookings:
+            time_range = (
+                f"{booking.get_start():%Y-%m-%d %H:%M} - {booking.get_end():%H:%M}"
+                if booking.is_timed()
+                else "-"
+            )
+            print(
+                f"Client: {booking.get_client().get_name()} | "
+                f"Service: {booking.get_service().get_name()} | "
+                f"Master: {booking.get_master().get_name()} | "
+                f"Time: {time_range} | "
+                f"Status: {booking.get_status().value}"
+            )
+
     def __handle_execute_service(self) -> None:
         confirmed_bookings: list[Booking] = self.__app_service.list_confirmed_bookings()
 
@@ -449,11 +571,14 @@ class SalonCLI:
             print("\n--- FINANCE & HISTORY ---")
             print(f"Current Balance: {self.__app_service.get_balance()}BYN")
             print("1. View Bookings History")
+            print("2. Export Bookings (CSV/JSONL)")
             print("0. Back to Main Menu")
 
             choice = input("Select an action: ").strip()
             if choice == "1":
                 self.__show_history()
+            elif choice == "2":
+                self.__safe_execute(self.__handle_export_bookings)
             elif choice == "0":
                 break
 
@@ -474,6 +599,23 @@ class SalonCLI:
                 f"Status: {booking.get_status().value}"
             )
 
+    def __handle_export_bookings(self) -> None:
+        export_format: str = input("Export format (csv/jsonl): ").strip() or "csv"
+        raw_statuses: str = input(
+            "Statuses to include (comma separated, empty for all): "
+        )
+        statuses: list[str] = [
+            status.strip() for status in raw_statuses.split(",") if status.strip()
+        ]
+        path: str = input("Output file path: ").strip()
+        if not path:
+            raise ValueError("Output file path cannot be empty")
+
+        lines = self.__app_service.export_bookings(export_format, statuses or None)
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.writelines(lines)
+        print(f"Bookings exported to {path}")
+
     @staticmethod
     def __safe_execute(action: Callable[[], None]) -> None:
         try:
@@ -482,6 +624,16 @@ class SalonCLI:
             print(f"\n[SALON ERROR]: {error}")
 
     def __exit_app(self) -> None:
-        print("Exiting... Have a nice day!")
         self.__is_running = False
+        if self.__session is not None:
+            try:
+                self.__session.close()
+            except Exception as error:
+                print(
+                    f"\n[SALON ERROR]: Could not save: {error}\n"
+                    "Your changes are kept in the session journal and restored "
+                    "on the next start."
+                )
+                sys.exit(1)
+        print("Exiting... Have a nice day!")
         sys.exit(0)
@@ -0,0 +1,168 @@
+import shlex
+import time
+from collections import Counter
+from typing import Callable, Iterable
+
+from salon_core.application.errors import AppServiceError
+from salon_core.application.service import SalonAppService
+
+
+class ScriptError(Exception):
+    def __init__(self, msg: str) -> None:
+        super().__init__(msg)
+        self.msg: str = msg
+
+
+def _int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ScriptError(f"Expected a whole number, got '{value}'")
+
+
+def _float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise ScriptError(f"Expected a number, got '{value}'")
+
+
+def _hire(service: SalonAppService, args: list[str]) -> None:
+    service.hire_master(args[0], _int(args[1]), args[2])
+
+
+def _fire(service: SalonAppService, args: list[str]) -> None:
+    service.fire_master(_int(args[0]))
+
+
+def _sell(service: SalonAppService, args: list[str]) -> None:
+    service.sell_product(args[0], _int(args[1]))
+
+
+def _restock(service: SalonAppService, args: list[str]) -> None:
+    service.restock_or_create_item(name=args[0], refill_amount=_int(args[1]))
+
+
+def _add_item(service: SalonAppService, args: list[str]) -> None:
+    service.restock_or_create_item(
+        name=args[0],
+        category=args[1],
+        initial_amount=_int(args[2]),
+        description=args[3] if len(args) > 3 else "",
+        price=_float(args[4]) if len(args) > 4 else None,
+    )
+
+
+def _add_service(service: SalonAppService, args: list[str]) -> None:
+    service.add_service(
+        args[0],
+        _float(args[1]),
+        args[2],
+        [_int(index) for index in args[3:]],
+    )
+
+
+def _remove_service(service: SalonAppService, args: list[str]) -> None:
+    service.remove_service(_int(args[0]))
+
+
+def _book(service: SalonAppService, args: list[str]) -> None:
+    if len(args) == 5:
+        raise ScriptError("A timed booking needs both START and END")
+    service.create_booking(
+        args[0],
+        _int(args[1]),
+        _int(args[2]),
+        _int(args[3]),
+        args[4] if len(args) > 4 else None,
+        args[5] if len(args) > 5 else None,
+    )
+
+
+def _execute(service: SalonAppService, args: list[str]) -> None:
+    service.execute_booking(_int(args[0]))
+
+
+def _cancel(service: SalonAppService, args: list[str]) -> None:
+    service.cancel_booking(_int(args[0]))
+
+
+# command -> (min args, max args or None, handler)
+SCRIPT_COMMANDS: dict[
+    str,
+    tuple[int, int | None, Callable[[SalonAppService, list[str]], None]],
+] = {
+    "hire": (3, 3, _hire),
+    "fire": (1, 1, _fire),
+    "sell": (2, 2, _sell),
+    "restock": (2, 2, _restock),
+    "add-item": (3, 5, _add_item),
+    "add-service": (3, None, _add_service),
+    "remove-service": (1, 1, _remove_service),
+    "book": (4, 6, _book),
+    "execute": (1, 1, _execute),
+    "cancel": (1, 1, _cancel),
+}
+
+
+class SalonScriptRunner:
+    """
+    Runs a command script inside one SalonAppService batch: the salon is
+    loaded and saved once, and the first failing line discards everything.
+    """
+
+    def __init__(self, app_service: SalonAppService) -> None:
+        self.__app_service = app_service
+
+    @staticmethod
+    def __parse(line: str) -> list[str]:
+        try:
+            tokens = shlex.split(line, comments=True)
+        except ValueError as error:
+            raise ScriptError(str(error))
+        if not tokens:
+            return tokens
+
+        command = tokens[0].lower()
+        if command not in SCRIPT_COMMANDS:
+            raise ScriptError(f"Unknown command '{tokens[0]}'")
+        min_args, max_args, _ = SCRIPT_COMMANDS[command]
+        arg_count = len(tokens) - 1
+        if arg_count < min_args or (max_args is not None and arg_count > max_args):
+            raise ScriptError(f"Wrong number of arguments for '{command}'")
+        return [command, *tokens[1:]]
+
+    def run(self, lines: Iterable[str]) -> dict:
+        started = time.perf_counter()
+        counts: Counter[str] = Counter()
+        failure = None
+        line_number = 0
+        try:
+            with self.__app_service.batch() as batch_service:
+                for line_number, line in enumerate(lines, start=1):
+                    try:
+                        tokens = self.__parse(line)
+                        if tokens:
+                            _, _, handler = SCRIPT_COMMANDS[tokens[0]]
+                            handler(batch_service, tokens[1:])
+                            counts[tokens[0]] += 1
+                    except (ScriptError, AppServiceError) as error:
+                        failure = {
+                            "line": line_number,
+                            "text": line.strip(),
+                            "error": error.msg if isinstance(error, ScriptError) else error.message,
+                        }
+                        raise
+        except (ScriptError, AppServiceError) as error:
+            if failure is None:
+                failure = {"line": line_number, "text": "", "error": str(error)}
+
+        return {
+            "ok": failure is None,
+            "committed": failure is None and sum(counts.values()) > 0,
+            "operations": sum(counts.values()),
+            "lines": line_number,
+            "counts": dict(counts),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "error": failure,
+        }
@@ -0,0 +1,17 @@
+# Kept free of imports: main.py shows it in --help before loading anything.
+
+SCRIPT_HELP = """\
+One command per line, arguments split like a shell (quote names with spaces).
+Indexes start at 0, as in SalonAppService. Lines starting with # are ignored.
+
+  hire NAME AGE SPECIALIZATION
+  fire STAFF_INDEX
+  sell PRODUCT QUANTITY
+  restock NAME AMOUNT
+  add-item NAME cosmetics|equipment AMOUNT [DESCRIPTION] [PRICE]
+  add-service NAME PRICE hair|cosmetic [RESOURCE_INDEX ...]
+  remove-service SERVICE_INDEX
+  book CLIENT_NAME CLIENT_AGE MASTER_INDEX SERVICE_INDEX [START END]
+  execute CONFIRMED_INDEX
+  cancel CONFIRMED_INDEX
+"""
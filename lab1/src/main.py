@@ -1,18 +1,142 @@
-﻿from pathlib import Path
+﻿import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from salon_core.application.repositories.json_repository import JsonSalonRepository
-from salon_core.application.service import SalonAppService
-from src.interface.cli import SalonCLI
+from salon_core.utils.serializers import SERIALIZERS
+from src.interface.script_help import SCRIPT_HELP
 
+# Everything else is imported by the mode that runs; tests/startup_test.py
+# keeps this module's own imports from growing back.
+if TYPE_CHECKING:
+    from salon_core.application.service import SalonAppService
 
-def main() -> None:
-    save_path = Path(__file__).resolve().parent / "salon_save.json"
-    repository = JsonSalonRepository(str(save_path), default_salon_name="BEST SALON")
-    app_service = SalonAppService(repository)
+DEFAULT_SAVE_PATH = Path(__file__).resolve().parent / "salon_save.json"
 
-    cli = SalonCLI(app_service)
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Salon management system.",
+        epilog=SCRIPT_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--data",
+        default=str(DEFAULT_SAVE_PATH),
+        metavar="PATH",
+        help="salon JSON file (default: src/salon_save.json)",
+    )
+    parser.add_argument(
+        "--format",
+        default="json",
+        choices=tuple(SERIALIZERS),
+        help="how the salon file is written (default: json); "
+        "any of them is read back",
+    )
+    parser.add_argument(
+        "--replica-dir",
+        metavar="DIR",
+        help="also ship every save of the JSON file to DIR for read-only "
+        "reporting replicas",
+    )
+    parser.add_argument(
+        "--event-log",
+        metavar="DIR",
+        help="keep the salon as an append-only event log with snapshots in DIR "
+        "instead of the JSON file",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="PATH",
+        help="run commands from a file ('-' for stdin) in one transaction "
+        "and print a JSON summary instead of starting the menu",
+    )
+    parser.add_argument(
+        "--session",
+        action="store_true",
+        help="keep the salon in memory and save it in the background, "
+        "on 'Save Now' and on exit; unsaved changes are journaled",
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=30.0,
+        metavar="SECONDS",
+        help="how often a session saves changed data (default: 30, 0 disables)",
+    )
+    return parser.parse_args(argv)
+
+
+def run_script(app_service: "SalonAppService", script: str) -> int:
+    from src.interface.script import SalonScriptRunner
+
+    runner = SalonScriptRunner(app_service)
+    # stdout carries only the JSON summary; what the salon itself prints
+    # while the script runs goes to stderr.
+    with contextlib.redirect_stdout(sys.stderr):
+        if script == "-":
+            summary = runner.run(sys.stdin)
+        else:
+            with open(script, encoding="utf-8-sig") as script_file:
+                summary = runner.run(script_file)
+    print(json.dumps(summary, ensure_ascii=False))
+    return 0 if summary["ok"] else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.event_log is not None:
+        from salon_core.application.repositories.event_sourced_repository import (
+            EventSourcedSalonRepository,
+        )
+
+        journal_path = Path(args.event_log) / "session.journal"
+        repository = EventSourcedSalonRepository(
+            args.event_log,
+            default_salon_name="BEST SALON",
+        )
+    else:
+        from salon_core.application.repositories.json_repository import (
+            JsonSalonRepository,
+        )
+
+        save_path = Path(args.data)
+        journal_path = save_path.with_suffix(".journal")
+        try:
+            repository = JsonSalonRepository(
+                str(save_path),
+                default_salon_name="BEST SALON",
+                data_format=args.format,
+                replica_dir=args.replica_dir,
+            )
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+
+    if args.script is not None:
+        from salon_core.application.service import SalonAppService
+
+        return run_script(SalonAppService(repository), args.script)
+
+    # Each mode imports only what it runs; the salon itself is loaded by
+    # the first command that needs more than its name.
+    from src.interface.cli import SalonCLI
+
+    if args.session:
+        from salon_core.application.session import SalonSession
+
+        with SalonSession(repository, str(journal_path), args.flush_interval) as session:
+            SalonCLI(session.service, session).run()
+        return 0
+
+    from salon_core.application.service import SalonAppService
+
+    cli = SalonCLI(SalonAppService(repository))
     cli.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
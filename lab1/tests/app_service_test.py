@@ -1,16 +1,24 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from unittest import mock
 from uuid import uuid4
 
 import pytest
 
 from salon_core.application.errors import AppServiceError
+from salon_core.application.repositories.cached_repository import CachedSalonRepository
 from salon_core.application.repositories.json_repository import JsonSalonRepository
 from salon_core.application.service import SalonAppService
+from salon_core.application.timing import recording
 from salon_core.entities.inventory.cosmetics import Cosmetics
 from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
 from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
 from salon_core.entities.services.hair_service import HairService
 from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.data_manager import SalonDataManager
 
 
 def _build_service(data_path: Path) -> SalonAppService:
@@ -141,3 +149,342 @@ def test_cosmetic_procedure_rejects_equipment_resources() -> None:
 
     with pytest.raises(TypeError):
         CosmeticProcedure("Facial", 25.0, [wrong_resource])  # type: ignore[list-item]
+
+
+def test_export_bookings_streams_rows_with_status_filter() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        app_service.hire_master("Jane", 27, "Cosmetics master")
+        app_service.restock_or_create_item(
+            name="Mask",
+            category="cosmetics",
+            description="Face mask",
+            initial_amount=4,
+            price=10.0,
+        )
+        app_service.add_service(
+            name="Facial",
+            price=35.0,
+            service_type="cosmetic",
+            resource_indexes=[0],
+        )
+        app_service.create_booking("Client A", 22, 0, 0)
+        app_service.create_booking("Client B", 23, 0, 0)
+        app_service.cancel_booking(0)
+
+        csv_lines = list(app_service.export_bookings("csv"))
+        assert csv_lines[0].startswith("client_name,client_age")
+        assert len(csv_lines) == 3
+
+        jsonl_lines = list(app_service.export_bookings("jsonl", ["cancelled"]))
+        assert len(jsonl_lines) == 1
+        assert json.loads(jsonl_lines[0])["client_name"] == "Client A"
+
+        confirmed = list(app_service.iter_bookings([BookingStatus.CONFIRMED]))
+        assert [b.get_client().get_name() for b in confirmed] == ["Client B"]
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_export_bookings_rejects_unknown_format_and_status() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    with pytest.raises(AppServiceError):
+        app_service.export_bookings("xml")
+
+    with pytest.raises(AppServiceError):
+        app_service.export_bookings("csv", ["Lost"])
+
+
+def test_timed_bookings_persist_and_block_double_booking() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        app_service.hire_master("John", 25, "Hair cutting master")
+        app_service.restock_or_create_item(
+            name="Scissors",
+            category="equipment",
+            description="For haircut",
+            initial_amount=3,
+        )
+        app_service.add_service("Haircut", 30.0, "hair", [0])
+
+        app_service.create_booking(
+            "Client A", 20, 0, 0, "2026-03-02T10:00", "2026-03-02T11:00"
+        )
+        with pytest.raises(AppServiceError):
+            app_service.create_booking(
+                "Client B", 21, 0, 0, "2026-03-02T10:30", "2026-03-02T11:30"
+            )
+
+        reloaded = _build_service(data_path)
+        found = reloaded.list_master_bookings(
+            0,
+            datetime(2026, 3, 2, 0, 0),
+            datetime(2026, 3, 3, 0, 0),
+        )
+        assert [booking.get_client().get_name() for booking in found] == ["Client A"]
+        assert found[0].get_start() == datetime(2026, 3, 2, 10, 0)
+
+        reloaded.cancel_booking(0)
+        reloaded.create_booking(
+            "Client B", 21, 0, 0, "2026-03-02T10:30", "2026-03-02T11:30"
+        )
+        assert len(reloaded.list_confirmed_bookings()) == 1
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_snapshot_loads_salon_once_and_writes_through() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+    app_service.hire_master("Kate", 30, "Cosmetics master")
+
+    class CountingRepository(JsonSalonRepository):
+        loads = 0
+
+        def load(self):
+            CountingRepository.loads += 1
+            return super().load()
+
+    try:
+        counting_service = SalonAppService(
+            CountingRepository(str(data_path), default_salon_name="Test Salon")
+        )
+        with counting_service.snapshot() as scoped:
+            assert len(scoped.list_staff()) == 1
+            assert scoped.get_balance() == 0
+            scoped.hire_master("John", 25, "Hair cutting master")
+            assert len(scoped.list_staff()) == 2
+            with pytest.raises(AppServiceError):
+                scoped.fire_master(5)
+            assert len(scoped.list_staff()) == 2
+
+        # one shared read, a fresh copy per mutation, one reload after failure
+        assert CountingRepository.loads == 4
+        assert len(app_service.list_staff()) == 2
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_cached_repository_shares_reads_and_serializes_writes() -> None:
+    data_path = _new_temp_data_path()
+    repository = CachedSalonRepository(
+        JsonSalonRepository(str(data_path), default_salon_name="Test Salon")
+    )
+    app_service = SalonAppService(repository)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        first_read = repository.load()
+        assert repository.load() is first_read
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda i: app_service.hire_master(f"Master {i}", 30, "Cosmetics master"),
+                    range(20),
+                )
+            )
+
+        assert len(first_read.get_staff()) == 1
+        assert len(app_service.list_staff()) == 21
+        assert len(_build_service(data_path).list_staff()) == 21
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_cached_repository_sees_same_size_saves_in_one_mtime_tick() -> None:
+    data_path = _new_temp_data_path()
+    writer = _build_service(data_path)
+    reader = CachedSalonRepository(JsonSalonRepository(str(data_path)))
+
+    try:
+        writer.restock_or_create_item(
+            name="Serum",
+            category="cosmetics",
+            description="Hydrating",
+            initial_amount=5,
+            price=20.0,
+        )
+        assert reader.load().find_product("Serum").get_amount() == 5
+
+        stat = data_path.stat()
+        writer.restock_or_create_item(name="Serum", refill_amount=1)
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert data_path.stat().st_size == stat.st_size
+
+        assert reader.load().find_product("Serum").get_amount() == 6
+    finally:
+        for path in (data_path, Path(f"{data_path}.checksum")):
+            if path.exists():
+                path.unlink()
+
+
+def test_section_versions_follow_touched_sections_and_external_writes() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        staff_version = app_service.get_section_version("staff")
+        inventory_version = app_service.get_section_version("inventory")
+
+        app_service.hire_master("Olga", 28, "Cosmetics master")
+        assert app_service.get_section_version("staff") != staff_version
+        assert app_service.get_section_version("inventory") == inventory_version
+
+        app_service.add_service("Facial", 30.0, "cosmetic", [])
+        app_service.create_booking("John", 30, 1, 0)
+        bookings_version = app_service.get_section_version("bookings")
+        app_service.fire_master(1)
+        assert app_service.get_section_version("bookings") != bookings_version
+        bookings_version = app_service.get_section_version("bookings")
+        app_service.remove_service(0)
+        assert app_service.get_section_version("bookings") != bookings_version
+        inventory_version = app_service.get_section_version("inventory")
+
+        _build_service(data_path).restock_or_create_item(
+            name="Serum",
+            category="cosmetics",
+            description="Hydrating",
+            initial_amount=5,
+            price=20.0,
+        )
+        assert app_service.get_section_version("inventory") != inventory_version
+
+        with pytest.raises(ValueError):
+            app_service.get_section_version("finance")
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_service_phases_are_timed_inside_recording() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        with recording() as recorder:
+            app_service.hire_master("Olga", 28, "Cosmetics master")
+            app_service.list_staff()
+        assert {"service", "load", "action", "save"} == set(recorder.durations)
+        assert recorder.durations["service"] >= recorder.durations["save"]
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_batch_saves_once_and_discards_on_error() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        with mock.patch.object(
+            SalonDataManager,
+            "save",
+            autospec=True,
+            side_effect=SalonDataManager.save,
+        ) as save_mock:
+            with app_service.batch() as batch_service:
+                for i in range(20):
+                    batch_service.hire_master(f"Master {i}", 30, "Cosmetics master")
+                assert not data_path.exists()
+        assert save_mock.call_count == 1
+        assert len(app_service.list_staff()) == 20
+
+        with pytest.raises(AppServiceError):
+            with app_service.batch() as batch_service:
+                batch_service.hire_master("Kept?", 30, "Cosmetics master")
+                batch_service.fire_master(99)
+        assert len(app_service.list_staff()) == 20
+
+        with pytest.raises(AppServiceError):
+            with app_service.batch() as batch_service:
+                try:
+                    batch_service.fire_master(99)
+                except AppServiceError:
+                    pass
+                batch_service.hire_master("Late", 30, "Cosmetics master")
+        assert len(app_service.list_staff()) == 20
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_salon_name_is_read_without_full_load() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        assert app_service.get_salon_name() == "Test Salon"
+        app_service.hire_master("Kate", 28, "Cosmetics master")
+
+        with mock.patch.object(SalonDataManager, "load", autospec=True) as load_mock:
+            assert app_service.get_salon_name() == "Test Salon"
+        assert load_mock.call_count == 0
+
+        # Files that do not start with the name fall back to a full load.
+        data_path.write_text('{"balance": 0, "name": "Moved"}', encoding="utf-8")
+        assert app_service.get_salon_name() == "Moved"
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_search_bookings_follows_new_bookings_and_external_writes() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+
+    try:
+        app_service.hire_master("Kate", 28, "Cosmetics master")
+        app_service.add_service("Facial", 30.0, "cosmetic", [0])
+        for client_name in ("Anna Smith", "John Smithson", "Joanna Blacksmith"):
+            app_service.create_booking(client_name, 30, 0, 0)
+
+        def names(query: str, limit: int = 20) -> list[str]:
+            return [
+                booking.get_client().get_name()
+                for booking in app_service.search_bookings(query, limit)
+            ]
+
+        # Word prefixes come first in name order, then other substrings.
+        assert names("smith") == ["Anna Smith", "John Smithson", "Joanna Blacksmith"]
+        assert names("JO") == ["Joanna Blacksmith", "John Smithson"]
+        assert names("john  sm") == ["John Smithson"]
+        assert names("smith", limit=1) == ["Anna Smith"]
+        assert names("zz") == []
+
+        with mock.patch(
+            "salon_core.application.search.BookingSearchIndex.rebuild",
+            autospec=True,
+        ) as rebuild_mock:
+            app_service.create_booking("Mary Jones", 25, 0, 0)
+            app_service.execute_booking(0)
+            assert names("jones") == ["Mary Jones"]
+        assert rebuild_mock.call_count == 0
+
+        _build_service(data_path).create_booking("Mark Jonas", 40, 0, 0)
+        assert names("jon") == ["Mark Jonas", "Mary Jones"]
+
+        with app_service.batch() as batch_service:
+            batch_service.create_booking("Jon Snow", 20, 0, 0)
+            assert [b.get_client().get_name() for b in batch_service.search_bookings("snow")] == [
+                "Jon Snow"
+            ]
+        assert names("jon") == ["Jon Snow", "Mark Jonas", "Mary Jones"]
+
+        with pytest.raises(AppServiceError):
+            app_service.search_bookings("anna", limit=0)
+    finally:
+        if data_path.exists():
+            data_path.unlink()
@@ -0,0 +1,93 @@
+import shutil
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from salon_core.application.chain import LowStockItem, SalonChain
+from salon_core.application.errors.base import AppServiceError
+from salon_core.application.repositories.chain_repository import SalonChainRepository
+
+
+def _new_temp_dir() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp" / f"chain_{uuid4().hex}"
+    temp_dir.mkdir(parents=True)
+    return temp_dir
+
+
+def _fill(chain: SalonChain) -> None:
+    north = chain.add_salon("north", "North Salon")
+    north.hire_master("Kate", 28, "Cosmetics master")
+    north.restock_or_create_item(
+        name="Serum",
+        category="cosmetics",
+        initial_amount=4,
+        price=20.0,
+        description="Hydrating",
+    )
+    north.add_service("Facial", 30.0, "cosmetic", [0])
+    north.create_booking("John", 30, 0, 0)
+    north.create_booking("Mary", 25, 0, 0)
+    north.execute_booking(0)
+
+    south = chain.add_salon("south", "South Salon", storage="events")
+    south.hire_master("Olga", 35, "Hair cutting master")
+    south.restock_or_create_item(name="Scissors", category="equipment", initial_amount=2)
+    south.add_service("Haircut", 15.0, "hair", [])
+    south.create_booking("Ann", 40, 0, 0)
+    south.create_booking("Bob", 50, 0, 0)
+    south.execute_booking(0)
+    south.cancel_booking(0)
+
+
+def test_shards_keep_salons_apart_and_survive_reopening() -> None:
+    directory = _new_temp_dir()
+
+    try:
+        chain = SalonChain(SalonChainRepository(str(directory)))
+        _fill(chain)
+
+        reopened = SalonChain(SalonChainRepository(str(directory)))
+        assert reopened.list_salons() == [
+            {"id": "north", "name": "North Salon", "storage": "json"},
+            {"id": "south", "name": "South Salon", "storage": "events"},
+        ]
+        assert reopened.service("north").get_salon_name() == "North Salon"
+        assert [m.get_name() for m in reopened.service("north").list_staff()] == ["Kate"]
+        assert [m.get_name() for m in reopened.service("south").list_staff()] == ["Olga"]
+        assert (directory / "salons" / "north.json").is_file()
+        assert (directory / "salons" / "south").is_dir()
+
+        with pytest.raises(AppServiceError):
+            reopened.add_salon("north", "Again")
+        with pytest.raises(AppServiceError):
+            reopened.add_salon("../west", "West")
+        reopened.remove_salon("north")
+        with pytest.raises(AppServiceError):
+            reopened.service("north")
+    finally:
+        shutil.rmtree(directory)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_report_merges_partial_results_of_every_shard(max_workers: int) -> None:
+    directory = _new_temp_dir()
+
+    try:
+        chain = SalonChain(SalonChainRepository(str(directory)))
+        _fill(chain)
+
+        report = chain.report(low_stock_threshold=3, max_workers=max_workers)
+
+        assert report.salons == 2
+        assert report.revenue_by_salon == {"north": 30.0, "south": 15.0}
+        assert report.revenue == 45.0
+        assert report.balance == 45.0
+        assert report.bookings_by_status == {"Done": 2, "Confirmed": 1, "Cancelled": 1}
+        # Executing the facial used one of the four serums.
+        assert report.low_stock == [
+            LowStockItem("south", "Scissors", 2),
+            LowStockItem("north", "Serum", 3),
+        ]
+    finally:
+        shutil.rmtree(directory)
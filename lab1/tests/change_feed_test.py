@@ -0,0 +1,108 @@
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+from salon_core.application.change_feed import SalonChangeFeed
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.repositories.notifying_repository import (
+    NotifyingSalonRepository,
+)
+from salon_core.application.service import SalonAppService
+
+
+def _new_temp_data_path() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"salon_{uuid4().hex}.json"
+
+
+def _build_live_service(data_path: Path, feed: SalonChangeFeed) -> SalonAppService:
+    repository = NotifyingSalonRepository(
+        JsonSalonRepository(file_path=str(data_path), default_salon_name="Test Salon")
+    )
+    repository.add_listener(feed.publish)
+    return SalonAppService(repository)
+
+
+def test_change_feed_publishes_only_changed_stats_and_new_bookings() -> None:
+    data_path = _new_temp_data_path()
+    feed = SalonChangeFeed()
+    app_service = _build_live_service(data_path, feed)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        app_service.restock_or_create_item(
+            name="Serum",
+            category="cosmetics",
+            description="Hydrating",
+            initial_amount=5,
+            price=20.0,
+        )
+        app_service.add_service("Facial", 30.0, "cosmetic", [0])
+        seq, stats = feed.snapshot(app_service)
+        assert stats["staff_count"] == 1
+        assert stats["services_count"] == 1
+
+        app_service.create_booking("Anna", 25, 0, 0)
+        events = feed.wait_for_events(seq, timeout=0)
+        assert len(events) == 1
+        assert events[0].stats == {"bookings_total": 1, "bookings_confirmed": 1}
+        assert [row["client_name"] for row in events[0].new_bookings] == ["Anna"]
+
+        app_service.cancel_booking(0)
+        events = feed.wait_for_events(events[0].seq, timeout=0)
+        assert events[0].stats == {"bookings_confirmed": 0, "bookings_cancelled": 1}
+        assert events[0].new_bookings == []
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_change_feed_wakes_waiters_and_drops_stale_listeners() -> None:
+    data_path = _new_temp_data_path()
+    feed = SalonChangeFeed(history=2)
+    app_service = _build_live_service(data_path, feed)
+
+    try:
+        seq, _ = feed.snapshot(app_service)
+        received = []
+        waiter = threading.Thread(
+            target=lambda: received.append(feed.wait_for_events(seq, timeout=5))
+        )
+        waiter.start()
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        waiter.join(timeout=5)
+        assert received[0][0].stats == {"staff_count": 1}
+
+        for name in ("Olga", "Ivan"):
+            app_service.hire_master(name, 30, "Hair cutting master")
+        assert feed.wait_for_events(seq, timeout=0) is None
+        assert feed.wait_for_events(99, timeout=0) is None
+        assert feed.wait_for_events(3, timeout=0) == []
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_change_feed_snapshot_counts_again_after_external_writes() -> None:
+    data_path = _new_temp_data_path()
+    feed = SalonChangeFeed()
+    app_service = _build_live_service(data_path, feed)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        _, stats = feed.snapshot(app_service)
+        assert stats["staff_count"] == 1
+
+        other_writer = SalonAppService(JsonSalonRepository(str(data_path)))
+        other_writer.hire_master("Olga", 35, "Hair cutting master")
+        _, stats = feed.snapshot(app_service)
+        assert stats["staff_count"] == 2
+
+        app_service.hire_master("Ivan", 30, "Hair cutting master")
+        events = feed.wait_for_events(0, timeout=0)
+        assert events[-1].stats == {"staff_count": 3}
+        assert feed.snapshot(app_service)[1] == app_service.get_dashboard_stats()
+    finally:
+        if data_path.exists():
+            data_path.unlink()
@@ -0,0 +1,161 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_core.entities.management.client import Client
+from salon_core.entities.management.master import Master
+from salon_core.entities.salon import Salon
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+from salon_core.entities.services.hair_service import HairService
+from salon_core.exceptions.exceptions import IncorrectAgeError
+from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.data_manager import SalonDataManager
+from salon_core.utils.masters_specialization import MastersSpecialization
+from salon_core.utils.serializers import available_formats
+
+
+def _new_temp_data_path() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"salon_{uuid4().hex}.json"
+
+
+def _cleanup(data_path: Path) -> None:
+    for path in (data_path, Path(f"{data_path}.checksum")):
+        if path.exists():
+            path.unlink()
+
+
+def _build_salon() -> Salon:
+    salon = Salon("Trusted Salon")
+    salon.get_reception().set_balance(120.0)
+    kate = Master("Kate", 28, MastersSpecialization.COSMETICS)
+    olga = Master("Olga", 35, MastersSpecialization.HAIR_CUTTING)
+    salon.hire_staff(kate)
+    salon.hire_staff(olga)
+    serum = Cosmetics("Serum", 20.0, "Hydrating", 5)
+    scissors = HairdressingEquipment("Scissors", "Steel", 3)
+    salon.add_to_inventory(serum)
+    salon.add_to_inventory(scissors)
+    facial = CosmeticProcedure("Facial", 30.0, [serum])
+    haircut = HairService("Haircut", 15.0, [scissors])
+    salon.add_service(facial)
+    salon.add_service(haircut)
+    salon.make_booking(
+        Client("John", 30),
+        kate,
+        facial,
+        datetime(2026, 3, 2, 10, 0),
+        datetime(2026, 3, 2, 11, 0),
+    )
+    cancelled = salon.make_booking(Client("Mary", 25), olga, haircut)
+    salon.cancel_booking(cancelled)
+    return salon
+
+
+def _describe(salon: Salon) -> dict:
+    return {
+        "name": salon.get_name(),
+        "balance": salon.check_balance(),
+        "staff": [master.to_dict() for master in salon.get_staff()],
+        "inventory": [item.to_dict() for item in salon.get_inventory()],
+        "services": [service.to_dict() for service in salon.get_services()],
+        "bookings": [booking.to_dict() for booking in salon.get_all_bookings()],
+        "scheduled": [len(master.get_schedule()) for master in salon.get_staff()],
+    }
+
+
+def test_saved_file_loads_without_validation() -> None:
+    data_path = _new_temp_data_path()
+    data_manager = SalonDataManager(str(data_path))
+
+    try:
+        expected = _build_salon()
+        data_manager.save(expected)
+
+        with mock.patch.object(Client, "from_dict", autospec=True) as validated_mock:
+            loaded = data_manager.load()
+        assert validated_mock.call_count == 0
+        assert _describe(loaded) == _describe(expected)
+        assert loaded.get_all_bookings()[1].get_status() == BookingStatus.CANCELLED
+        assert isinstance(loaded.get_services()[1], HairService)
+        assert loaded.get_services()[1].get_equipment() == [loaded.get_inventory()[1]]
+
+        trusted_load = data_manager.load()
+        data = json.loads(data_path.read_text(encoding="utf-8"))
+        assert _describe(SalonDataManager.build(data)) == _describe(trusted_load)
+    finally:
+        _cleanup(data_path)
+
+
+def test_changed_or_unsigned_file_is_validated() -> None:
+    data_path = _new_temp_data_path()
+    data_manager = SalonDataManager(str(data_path))
+
+    try:
+        data_manager.save(_build_salon())
+        data = json.loads(data_path.read_text(encoding="utf-8"))
+        data["bookings"][0]["client"]["age"] = -5
+        data_path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+
+        with pytest.raises(IncorrectAgeError):
+            data_manager.load()
+
+        data["bookings"][0]["client"]["age"] = 31
+        del data["schema"]
+        data_path.write_text(json.dumps(data, indent=4), encoding="utf-8")
+        Path(f"{data_path}.checksum").unlink()
+        with mock.patch.object(
+            Client,
+            "from_dict",
+            autospec=True,
+            side_effect=Client.from_dict,
+        ) as validated_mock:
+            loaded = data_manager.load()
+        assert validated_mock.call_count == 2
+        assert loaded.get_all_bookings()[0].get_client().get_age() == 31
+    finally:
+        _cleanup(data_path)
+
+
+@pytest.mark.parametrize("data_format", available_formats())
+def test_every_format_round_trips_and_is_detected_on_load(data_format: str) -> None:
+    data_path = _new_temp_data_path()
+
+    try:
+        expected = _describe(_build_salon())
+        SalonDataManager(str(data_path), data_format).save(_build_salon())
+
+        for reader_format in ("json", "json-gzip"):
+            reader = SalonDataManager(str(data_path), reader_format)
+            with mock.patch.object(Client, "from_dict", autospec=True) as validated_mock:
+                assert _describe(reader.load()) == expected
+            assert validated_mock.call_count == 0
+            with mock.patch.object(SalonDataManager, "load", autospec=True) as load_mock:
+                assert reader.load_name() == "Trusted Salon"
+            assert load_mock.call_count == 0
+    finally:
+        _cleanup(data_path)
+
+
+def test_compact_and_gzip_formats_are_smaller() -> None:
+    data_path = _new_temp_data_path()
+
+    try:
+        sizes = {}
+        for data_format in ("json", "json-compact", "json-gzip"):
+            SalonDataManager(str(data_path), data_format).save(_build_salon())
+            sizes[data_format] = data_path.stat().st_size
+        assert sizes["json-gzip"] < sizes["json-compact"] < sizes["json"]
+        assert data_path.read_bytes()[:2] == b"\x1f\x8b"
+
+        with pytest.raises(ValueError):
+            SalonDataManager(str(data_path), "yaml")
+    finally:
+        _cleanup(data_path)
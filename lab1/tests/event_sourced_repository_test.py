@@ -0,0 +1,206 @@
+import shutil
+import threading
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from salon_core.application.repositories.event_sourced_repository import (
+    EventSourcedSalonRepository,
+)
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.service import SalonAppService
+from salon_core.entities.management.master import Master
+from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.masters_specialization import MastersSpecialization
+
+
+def _new_temp_dir() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp" / f"events_{uuid4().hex}"
+    temp_dir.mkdir(parents=True)
+    return temp_dir
+
+
+def _fill(app_service: SalonAppService) -> None:
+    app_service.hire_master("Kate", 28, "Cosmetics master")
+    app_service.hire_master("Olga", 35, "Hair cutting master")
+    app_service.restock_or_create_item(
+        name="Serum",
+        category="cosmetics",
+        initial_amount=10,
+        price=20.0,
+        description="Hydrating",
+    )
+    app_service.restock_or_create_item(name="Scissors", category="equipment", initial_amount=3)
+    app_service.add_service("Facial", 30.0, "cosmetic", [0])
+    app_service.add_service("Haircut", 15.0, "hair", [0])
+    app_service.create_booking("John", 30, 0, 0, "2026-03-02T10:00", "2026-03-02T11:00")
+    app_service.create_booking("Mary", 25, 1, 1)
+    app_service.create_booking("Ann", 40, 0, 0, "2026-03-02T12:00", "2026-03-02T13:00")
+    app_service.execute_booking(0)
+    app_service.cancel_booking(1)
+    app_service.sell_product("Serum", 2)
+    app_service.remove_service(1)
+    app_service.fire_master(1)
+
+
+def _describe(app_service: SalonAppService) -> dict:
+    return {
+        "name": app_service.get_salon_name(),
+        "stats": app_service.get_dashboard_stats(),
+        "staff": [master.get_name() for master in app_service.list_staff()],
+        "inventory": [(i.get_name(), i.get_amount()) for i in app_service.list_inventory()],
+        "services": [service.get_name() for service in app_service.list_services()],
+        "bookings": list(app_service.export_bookings("jsonl")),
+    }
+
+
+def test_log_replays_to_the_same_salon_from_snapshots() -> None:
+    directory = _new_temp_dir()
+
+    try:
+        repository = EventSourcedSalonRepository(str(directory), snapshot_every=5)
+        app_service = SalonAppService(repository)
+        _fill(app_service)
+        expected = _describe(app_service)
+
+        assert expected["staff"] == ["Kate"]
+        # The fired master's booking is kept in the log.
+        assert expected["stats"]["bookings_total"] == 3
+        assert len(list(directory.glob("snapshot-*.json"))) >= 2
+
+        reopened = EventSourcedSalonRepository(str(directory), default_salon_name="Other")
+        assert reopened.load_name() == "New Salon"
+        assert _describe(SalonAppService(reopened)) == expected
+
+        for snapshot in directory.glob("snapshot-*.json"):
+            snapshot.unlink()
+        from_log_only = EventSourcedSalonRepository(str(directory))
+        assert _describe(SalonAppService(from_log_only)) == expected
+        assert from_log_only.get_event_count() == repository.get_event_count()
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_load_at_rebuilds_past_states() -> None:
+    directory = _new_temp_dir()
+
+    try:
+        repository = EventSourcedSalonRepository(str(directory), snapshot_every=4)
+        app_service = SalonAppService(repository)
+        app_service.restock_or_create_item(name="Gel", category="equipment", initial_amount=1)
+        after_restock = repository.get_event_count()
+        _fill(app_service)
+
+        assert repository.load_at(0).get_inventory() == []
+        past = repository.load_at(after_restock)
+        assert [item.get_name() for item in past.get_inventory()] == ["Gel"]
+        assert past.get_staff() == []
+
+        latest = repository.load_at(repository.get_event_count())
+        statuses = [booking.get_status() for booking in latest.get_all_bookings()]
+        assert statuses == [
+            BookingStatus.DONE,
+            BookingStatus.CONFIRMED,
+            BookingStatus.CANCELLED,
+        ]
+        with pytest.raises(ValueError):
+            repository.load_at(repository.get_event_count() + 1)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_torn_tail_is_dropped_and_other_writers_are_picked_up() -> None:
+    directory = _new_temp_dir()
+
+    try:
+        first = SalonAppService(EventSourcedSalonRepository(str(directory)))
+        first.hire_master("Kate", 28, "Cosmetics master")
+        with open(directory / "events.log", "ab") as log_file:
+            log_file.write(b'[99,"hire"')
+
+        second = SalonAppService(EventSourcedSalonRepository(str(directory)))
+        second.hire_master("Olga", 35, "Cosmetics master")
+        assert [m.get_name() for m in first.list_staff()] == ["Kate", "Olga"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def _staff_names(repository: EventSourcedSalonRepository) -> list[str]:
+    return [master.get_name() for master in repository.load().get_staff()]
+
+
+def test_writers_in_two_repositories_take_turns_on_the_log() -> None:
+    directory = _new_temp_dir()
+
+    try:
+        first = EventSourcedSalonRepository(str(directory))
+        second = SalonAppService(EventSourcedSalonRepository(str(directory)))
+        SalonAppService(first).hire_master("Kate", 28, "Cosmetics master")
+        assert second.list_staff()[0].get_name() == "Kate"
+
+        salon = first.load_for_update()
+        salon.hire_staff(Master("Olga", 35, MastersSpecialization.COSMETICS))
+        writer = threading.Thread(target=second.hire_master, args=("Anna", 30, "Cosmetics master"))
+        writer.start()
+        writer.join(0.2)
+        assert writer.is_alive()
+        first.save(salon)
+        writer.join(5)
+        assert not writer.is_alive()
+
+        assert _staff_names(EventSourcedSalonRepository(str(directory))) == [
+            "Kate",
+            "Olga",
+            "Anna",
+        ]
+
+        # A read-only batch gives the lock back.
+        with SalonAppService(first).batch() as batch:
+            batch.list_staff()
+        writer = threading.Thread(target=second.fire_master, args=(2,))
+        writer.start()
+        writer.join(5)
+        assert not writer.is_alive()
+        assert _staff_names(first) == ["Kate", "Olga"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_save_after_a_plain_load_never_breaks_the_log() -> None:
+    directory = _new_temp_dir()
+
+    try:
+        first = EventSourcedSalonRepository(str(directory))
+        second = SalonAppService(EventSourcedSalonRepository(str(directory)))
+        SalonAppService(first).hire_master("Kate", 28, "Cosmetics master")
+
+        salon = first.load()
+        second.hire_master("Anna", 30, "Cosmetics master")
+        salon.hire_staff(Master("Olga", 35, MastersSpecialization.COSMETICS))
+        first.save(salon)
+
+        reopened = EventSourcedSalonRepository(str(directory))
+        assert _staff_names(reopened) == ["Kate", "Olga"]
+        assert reopened.get_event_count() == first.get_event_count()
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_existing_salon_is_imported_as_a_reset_event() -> None:
+    directory = _new_temp_dir()
+    json_path = directory / "salon.json"
+
+    try:
+        json_service = SalonAppService(JsonSalonRepository(str(json_path), "Imported"))
+        _fill(json_service)
+        salon = JsonSalonRepository(str(json_path)).load()
+
+        repository = EventSourcedSalonRepository(str(directory / "log"))
+        repository.save(salon)
+        assert repository.get_event_count() == 1
+
+        reopened = SalonAppService(EventSourcedSalonRepository(str(directory / "log")))
+        assert _describe(reopened) == _describe(json_service)
+    finally:
+        shutil.rmtree(directory)
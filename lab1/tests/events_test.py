@@ -0,0 +1,169 @@
+from pathlib import Path
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from salon_core.application.errors import AppServiceError
+from salon_core.application.events import (
+    BookingCancelled,
+    BookingCompleted,
+    BookingCreated,
+    ItemRestocked,
+    MasterHired,
+    PaymentProcessed,
+    ProductSold,
+    ServiceAdded,
+)
+from salon_core.application.read_models import DashboardCounters
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.service import SalonAppService
+
+
+def _new_temp_data_path() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"salon_{uuid4().hex}.json"
+
+
+def _build_service(data_path: Path) -> SalonAppService:
+    return SalonAppService(JsonSalonRepository(str(data_path), "Test Salon"))
+
+
+def _stock_salon(app_service: SalonAppService) -> None:
+    app_service.hire_master("Kate", 28, "Cosmetics master")
+    app_service.restock_or_create_item(
+        name="Serum",
+        category="cosmetics",
+        initial_amount=10,
+        price=20.0,
+    )
+    app_service.add_service("Facial", 30.0, "cosmetic", [0])
+
+
+def test_mutations_publish_typed_events_in_order() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+    events = []
+    app_service.subscribe(events.append)
+
+    try:
+        _stock_salon(app_service)
+        app_service.create_booking("John", 30, 0, 0, "2026-03-02T10:00", "2026-03-02T11:00")
+        app_service.create_booking("Mary", 25, 0, 0)
+        app_service.execute_booking(0)
+        app_service.cancel_booking(0)
+        app_service.sell_product("Serum", 2)
+
+        assert events == [
+            MasterHired(0, "Kate", 28, "Cosmetics master"),
+            ItemRestocked("Serum", 10, True),
+            ServiceAdded(0, "Facial", 30.0),
+            BookingCreated(
+                0,
+                "John",
+                30,
+                "Kate",
+                "Facial",
+                30.0,
+                events[3].start,
+                events[3].end,
+            ),
+            BookingCreated(1, "Mary", 25, "Kate", "Facial", 30.0, None, None),
+            BookingCompleted(0, "John", "Kate", "Facial", 30.0),
+            PaymentProcessed(30.0, 30.0, "booking"),
+            BookingCancelled(1, "Mary", "Kate", "Facial"),
+            ProductSold("Serum", 2, 40.0, 7),
+            PaymentProcessed(40.0, 70.0, "sale"),
+        ]
+        assert events[3].start.hour == 10
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_failed_mutations_and_filters_and_unsubscribe() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+    payments = []
+    unsubscribe = app_service.subscribe(payments.append, PaymentProcessed)
+    app_service.subscribe(mock.Mock(side_effect=RuntimeError("broken read model")))
+
+    try:
+        _stock_salon(app_service)
+        with pytest.raises(AppServiceError):
+            app_service.sell_product("Serum", 99)
+        assert payments == []
+
+        app_service.sell_product("Serum", 1)
+        unsubscribe()
+        app_service.sell_product("Serum", 1)
+        assert payments == [PaymentProcessed(20.0, 20.0, "sale")]
+        assert app_service.get_balance() == 40.0
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_batch_publishes_after_flush_only() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+    events = []
+    app_service.subscribe(events.append)
+
+    try:
+        with app_service.batch() as batch_service:
+            _stock_salon(batch_service)
+            assert events == []
+        assert [type(event) for event in events] == [MasterHired, ItemRestocked, ServiceAdded]
+
+        with pytest.raises(AppServiceError):
+            with app_service.batch() as batch_service:
+                batch_service.hire_master("Olga", 35, "Cosmetics master")
+                batch_service.fire_master(9)
+        assert len(events) == 3
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_dashboard_counters_follow_events_without_recounting() -> None:
+    data_path = _new_temp_data_path()
+    app_service = _build_service(data_path)
+    counters = DashboardCounters(app_service)
+
+    try:
+        _stock_salon(app_service)
+        app_service.hire_master("Olga", 35, "Hair cutting master")
+        assert counters.get() == app_service.get_dashboard_stats()
+
+        with mock.patch.object(
+            SalonAppService,
+            "dashboard_stats_for",
+            side_effect=AssertionError("recounted"),
+        ):
+            app_service.create_booking("John", 30, 0, 0)
+            app_service.create_booking("Mary", 25, 0, 0)
+            app_service.execute_booking(0)
+            app_service.cancel_booking(0)
+            stats = counters.get()
+
+        assert stats == app_service.get_dashboard_stats()
+        assert stats["bookings_done"] == 1
+        assert stats["bookings_cancelled"] == 1
+        assert stats["balance"] == 30.0
+
+        # Bookings of a fired master are dropped on load, so it is recounted.
+        app_service.create_booking("Ann", 40, 0, 0)
+        app_service.fire_master(0)
+        stats = counters.get()
+        assert stats == app_service.get_dashboard_stats()
+        assert stats["staff_count"] == 1
+        assert stats["bookings_total"] == 0
+
+        other_writer = _build_service(data_path)
+        other_writer.hire_master("Anna", 30, "Cosmetics master")
+        assert counters.get()["staff_count"] == 2
+    finally:
+        if data_path.exists():
+            data_path.unlink()
@@ -0,0 +1,77 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from salon_core.application.forecast import forecast_depletion
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+from salon_core.entities.services.hair_service import HairService
+
+
+def _build_inventory() -> tuple[list, list]:
+    serum = Cosmetics("Serum", 20.0, "Hydrating", 30)
+    mask = Cosmetics("Mask", 10.0, "Face mask", 5)
+    scissors = HairdressingEquipment("Scissors", "Steel", 6)
+    dryer = HairdressingEquipment("Dryer", "Hot air", 2)
+    services = [
+        CosmeticProcedure("Facial", 30.0, [serum]),
+        HairService("Haircut", 15.0, [scissors]),
+    ]
+    return [serum, mask, scissors, dryer], services
+
+
+def test_unused_items_never_deplete() -> None:
+    inventory, services = _build_inventory()
+    forecasts = forecast_depletion(inventory, services, {"Facial": 2.0}, seed=1)
+    by_name = {forecast.item_name: forecast for forecast in forecasts}
+
+    for name in ("Mask", "Dryer"):
+        assert by_name[name].depletion_probability == 0.0
+        assert by_name[name].mean_days is None
+        assert by_name[name].percentile_days == {10: None, 50: None, 90: None}
+
+
+def test_consumption_matches_booking_rate() -> None:
+    inventory, services = _build_inventory()
+    forecasts = forecast_depletion(
+        inventory,
+        services,
+        {"Facial": 3.0, "Haircut": 3.0},
+        days=120,
+        runs=4000,
+        seed=7,
+    )
+    by_name = {forecast.item_name: forecast for forecast in forecasts}
+
+    serum = by_name["Serum"]
+    assert serum.item_type == "Cosmetics"
+    assert serum.depletion_probability == 1.0
+    assert 8 <= serum.percentile_days[50] <= 12
+
+    scissors = by_name["Scissors"]
+    assert scissors.item_type == "Equipment"
+    assert scissors.daily_loss_rate == pytest.approx(0.3)
+    assert scissors.percentile_days[50] > serum.percentile_days[50]
+    assert scissors.percentile_days[10] <= scissors.percentile_days[90]
+
+
+def test_seed_makes_forecast_reproducible() -> None:
+    inventory, services = _build_inventory()
+    mix = {"Haircut": 1.5}
+
+    first = forecast_depletion(inventory, services, mix, seed=42)
+    second = forecast_depletion(inventory, services, mix, seed=42)
+
+    assert first == second
+
+
+def test_rejects_unknown_service_and_bad_arguments() -> None:
+    inventory, services = _build_inventory()
+
+    with pytest.raises(ValueError):
+        forecast_depletion(inventory, services, {"Massage": 1.0})
+    with pytest.raises(ValueError):
+        forecast_depletion(inventory, services, {"Facial": -1.0})
+    with pytest.raises(ValueError):
+        forecast_depletion(inventory, services, {"Facial": 1.0}, days=0)
@@ -0,0 +1,178 @@
+import shutil
+import threading
+from pathlib import Path
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from salon_core.application.errors.base import AppServiceError
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.repositories.replica_repository import (
+    ReplicaSalonRepository,
+    ReplicaShipper,
+)
+from salon_core.application.service import SalonAppService
+from salon_core.entities.management.client import Client
+
+
+def _new_temp_dir() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp" / f"replica_{uuid4().hex}"
+    temp_dir.mkdir(parents=True)
+    return temp_dir
+
+
+def _staff(app_service: SalonAppService) -> list[str]:
+    return [master.get_name() for master in app_service.list_staff()]
+
+
+def test_replica_serves_shipped_saves_read_only() -> None:
+    directory = _new_temp_dir()
+    data_path = directory / "salon.json"
+    replica_dir = directory / "replica"
+
+    try:
+        primary_repository = JsonSalonRepository(
+            str(data_path),
+            default_salon_name="Primary",
+            replica_dir=str(replica_dir),
+        )
+        primary = SalonAppService(primary_repository)
+        replica = SalonAppService(
+            ReplicaSalonRepository(str(replica_dir), max_staleness=0, default_salon_name="Empty")
+        )
+        assert replica.get_salon_name() == "Empty"
+        assert replica.get_data_version() is None
+
+        primary.hire_master("Kate", 28, "Cosmetics master")
+        primary.add_service("Facial", 30.0, "cosmetic", [])
+        primary.create_booking("John", 30, 0, 0)
+        assert primary_repository.wait_for_replica(timeout=10)
+
+        with mock.patch.object(Client, "from_dict", autospec=True) as validated_mock:
+            assert [b.get_client().get_name() for b in replica.list_bookings()] == ["John"]
+        assert validated_mock.call_count == 0
+        assert replica.get_salon_name() == "Primary"
+        assert replica.get_last_modified() is not None
+
+        with pytest.raises(AppServiceError):
+            replica.hire_master("Olga", 35, "Hair cutting master")
+
+        # Replicas never read the primary file.
+        data_path.unlink()
+        assert _staff(replica) == ["Kate"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_replica_staleness_is_bounded_by_manifest_checks() -> None:
+    directory = _new_temp_dir()
+    replica_dir = directory / "replica"
+
+    try:
+        primary_repository = JsonSalonRepository(
+            str(directory / "salon.json"),
+            replica_dir=str(replica_dir),
+        )
+        primary = SalonAppService(primary_repository)
+        primary.hire_master("Kate", 28, "Cosmetics master")
+        assert primary_repository.wait_for_replica(timeout=10)
+
+        clock = [1000.0]
+        with mock.patch(
+            "salon_core.application.repositories.replica_repository.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            replica = SalonAppService(ReplicaSalonRepository(str(replica_dir), max_staleness=5))
+            assert _staff(replica) == ["Kate"]
+
+            primary.hire_master("Olga", 35, "Hair cutting master")
+            assert primary_repository.wait_for_replica(timeout=10)
+            clock[0] += 4.9
+            assert _staff(replica) == ["Kate"]
+            clock[0] += 0.1
+            assert _staff(replica) == ["Kate", "Olga"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_shipper_prunes_old_snapshots_under_slow_readers() -> None:
+    directory = _new_temp_dir()
+    replica_dir = directory / "replica"
+
+    try:
+        primary_repository = JsonSalonRepository(
+            str(directory / "salon.json"),
+            replica_dir=str(replica_dir),
+        )
+        primary = SalonAppService(primary_repository)
+        primary.hire_master("Kate", 28, "Cosmetics master")
+        assert primary_repository.wait_for_replica(timeout=10)
+
+        replica_repository = ReplicaSalonRepository(str(replica_dir), max_staleness=3600)
+        assert replica_repository.get_version() == "replica-1"
+
+        for name in ("Olga", "Anna", "Mary"):
+            primary.hire_master(name, 30, "Cosmetics master")
+            assert primary_repository.wait_for_replica(timeout=10)
+        snapshots = sorted(path.name for path in replica_dir.glob("snapshot-*.salon"))
+        assert snapshots == [f"snapshot-{seq:012d}.salon" for seq in (2, 3, 4)]
+
+        # The manifest it saw points at a pruned snapshot: it looks again.
+        assert len(replica_repository.load().get_staff()) == 4
+        assert replica_repository.get_version() == "replica-4"
+
+        with pytest.raises(ValueError):
+            ReplicaShipper(str(replica_dir), keep=1)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_shipping_failure_does_not_fail_the_save(caplog) -> None:
+    directory = _new_temp_dir()
+    data_path = directory / "salon.json"
+
+    try:
+        primary_repository = JsonSalonRepository(
+            str(data_path),
+            replica_dir=str(directory / "replica"),
+        )
+        primary = SalonAppService(primary_repository)
+        with mock.patch.object(ReplicaShipper, "ship", side_effect=OSError("disk full")):
+            primary.hire_master("Kate", 28, "Cosmetics master")
+            assert primary_repository.wait_for_replica(timeout=10)
+
+        assert "Could not ship the salon to replica" in caplog.text
+        assert _staff(SalonAppService(JsonSalonRepository(str(data_path)))) == ["Kate"]
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_shipper_ships_only_the_newest_waiting_save() -> None:
+    directory = _new_temp_dir()
+    replica_dir = directory / "replica"
+
+    try:
+        shipper = ReplicaShipper(str(replica_dir))
+        started = threading.Event()
+        release = threading.Event()
+        shipped = []
+        real_ship = ReplicaShipper.ship
+
+        def slow_ship(self, raw: bytes) -> int:
+            started.set()
+            release.wait(10)
+            shipped.append(raw)
+            return real_ship(self, raw)
+
+        with mock.patch.object(ReplicaShipper, "ship", autospec=True, side_effect=slow_ship):
+            shipper.submit(b"first")
+            assert started.wait(10)
+            shipper.submit(b"second")
+            shipper.submit(b"third")
+            release.set()
+            assert shipper.wait(timeout=10)
+
+        assert shipped == [b"first", b"third"]
+    finally:
+        shutil.rmtree(directory)
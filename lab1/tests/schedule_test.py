@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.management.booking import Booking
+from salon_core.entities.management.client import Client
+from salon_core.entities.management.master import Master
+from salon_core.entities.salon import Salon
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+from salon_core.exceptions.exceptions import ScheduleConflictError
+from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.masters_specialization import MastersSpecialization
+
+DAY = datetime(2026, 3, 2, 9, 0)
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return DAY.replace(hour=hour, minute=minute)
+
+
+@pytest.fixture
+def salon_setup() -> tuple[Salon, Master, CosmeticProcedure]:
+    salon = Salon("Test Salon")
+    master = Master("Kate", 30, MastersSpecialization.COSMETICS)
+    serum = Cosmetics("Serum", 20.0, "Hydrating", 10)
+    service = CosmeticProcedure("Facial", 30.0, [serum])
+    salon.hire_staff(master)
+    salon.add_to_inventory(serum)
+    salon.add_service(service)
+    return salon, master, service
+
+
+def test_booking_time_validation(salon_setup) -> None:
+    _, master, service = salon_setup
+    client = Client("Anna", 25)
+
+    with pytest.raises(ValueError):
+        Booking(client, service, master, BookingStatus.CONFIRMED, _at(10), None)
+    with pytest.raises(ValueError):
+        Booking(client, service, master, BookingStatus.CONFIRMED, _at(10), _at(9))
+
+    booking = Booking(client, service, master, BookingStatus.CONFIRMED)
+    assert not booking.is_timed()
+    assert booking.to_dict()["start"] is None
+
+
+def test_make_booking_rejects_overlapping_interval(salon_setup) -> None:
+    salon, master, service = salon_setup
+    salon.make_booking(Client("Anna", 25), master, service, _at(10), _at(11))
+
+    with pytest.raises(ScheduleConflictError):
+        salon.make_booking(Client("Bob", 30), master, service, _at(10, 30), _at(11, 30))
+    with pytest.raises(ScheduleConflictError):
+        salon.make_booking(Client("Bob", 30), master, service, _at(9), _at(12))
+
+    salon.make_booking(Client("Bob", 30), master, service, _at(11), _at(12))
+    salon.make_booking(Client("Eve", 22), master, service, _at(9), _at(10))
+    assert len(master.get_schedule()) == 3
+
+
+def test_untimed_bookings_are_not_indexed(salon_setup) -> None:
+    salon, master, service = salon_setup
+    salon.make_booking(Client("Anna", 25), master, service)
+    salon.make_booking(Client("Bob", 30), master, service)
+
+    assert len(master.get_schedule()) == 0
+    assert len(salon.get_all_bookings()) == 2
+
+
+def test_bookings_between_returns_overlapping_in_order(salon_setup) -> None:
+    salon, master, service = salon_setup
+    for hour in (15, 9, 12, 10):
+        salon.make_booking(Client("Anna", 25), master, service, _at(hour), _at(hour, 45))
+
+    schedule = master.get_schedule()
+    found = schedule.bookings_between(_at(9, 30), _at(12, 10))
+    assert [booking.get_start().hour for booking in found] == [9, 10, 12]
+    assert schedule.bookings_between(_at(13), _at(14)) == []
+    assert schedule.has_conflict(_at(15, 30), _at(16))
+    assert not schedule.has_conflict(_at(9, 45), _at(10))
+
+
+def test_cancel_booking_frees_the_slot(salon_setup) -> None:
+    salon, master, service = salon_setup
+    booking = salon.make_booking(Client("Anna", 25), master, service, _at(10), _at(11))
+
+    salon.cancel_booking(booking)
+
+    assert booking.get_status() == BookingStatus.CANCELLED
+    assert not master.get_schedule().has_conflict(_at(10), _at(11))
+    salon.make_booking(Client("Bob", 30), master, service, _at(10), _at(11) - timedelta(minutes=1))
+
+
+def test_free_intervals_cover_gaps_inside_window(salon_setup) -> None:
+    salon, master, service = salon_setup
+    salon.make_booking(Client("Anna", 25), master, service, _at(8), _at(10))
+    salon.make_booking(Client("Bob", 30), master, service, _at(11), _at(12))
+
+    gaps = list(master.get_schedule().free_intervals(_at(9), _at(14)))
+
+    assert gaps == [(_at(10), _at(11)), (_at(12), _at(14))]
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from salon_core.application.errors import AppServiceError
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.scheduling import earliest_slots
+from salon_core.application.service import SalonAppService
+from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_core.entities.management.client import Client
+from salon_core.entities.management.master import Master
+from salon_core.entities.salon import Salon
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+from salon_core.entities.services.hair_service import HairService
+from salon_core.utils.masters_specialization import MastersSpecialization
+
+WINDOW = (datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 18, 0))
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return WINDOW[0].replace(hour=hour, minute=minute)
+
+
+def _new_temp_data_path() -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"salon_{uuid4().hex}.json"
+
+
+def test_earliest_slots_merges_masters_in_time_order() -> None:
+    salon = Salon("Test Salon")
+    scissors = HairdressingEquipment("Scissors", "Steel", 3)
+    haircut = HairService("Haircut", 15.0, [scissors])
+    first = Master("Alex", 28, MastersSpecialization.HAIR_CUTTING)
+    second = Master("Olga", 35, MastersSpecialization.HAIR_STYLING)
+    for master in (first, second):
+        salon.hire_staff(master)
+    salon.add_to_inventory(scissors)
+    salon.add_service(haircut)
+
+    salon.make_booking(Client("Anna", 25), first, haircut, _at(9), _at(11))
+    salon.make_booking(Client("Bob", 30), second, haircut, _at(9), _at(10))
+
+    slots = earliest_slots(
+        [(0, first), (1, second)],
+        WINDOW[0],
+        WINDOW[1],
+        timedelta(hours=1),
+        4,
+    )
+
+    assert [(slot.master_index, slot.start.hour) for slot in slots] == [
+        (1, 10),
+        (0, 11),
+        (1, 11),
+        (0, 12),
+    ]
+    assert all(slot.end - slot.start == timedelta(hours=1) for slot in slots)
+
+
+def test_find_slots_only_uses_eligible_masters() -> None:
+    data_path = _new_temp_data_path()
+    repository = JsonSalonRepository(str(data_path), default_salon_name="Test Salon")
+    app_service = SalonAppService(repository)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        app_service.hire_master("John", 25, "Hair cutting master")
+        app_service.restock_or_create_item(
+            name="Scissors",
+            category="equipment",
+            description="For haircut",
+            initial_amount=3,
+        )
+        app_service.add_service("Haircut", 30.0, "hair", [0])
+        app_service.create_booking("Client A", 20, 1, 0, _at(9), _at(9, 30))
+
+        slots = app_service.find_slots(
+            0,
+            ("2026-03-02T09:00", "2026-03-02T11:00"),
+            3,
+            timedelta(minutes=30),
+        )
+
+        assert [slot.master.get_name() for slot in slots] == ["John"] * 3
+        assert [slot.start for slot in slots] == [_at(9, 30), _at(10), _at(10, 30)]
+        assert {slot.master_index for slot in slots} == {1}
+
+        with pytest.raises(AppServiceError):
+            app_service.find_slots(0, (WINDOW[1], WINDOW[0]))
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_specialization_index_follows_hiring_and_firing() -> None:
+    salon = Salon("Test Salon")
+    cutter = Master("Alex", 28, MastersSpecialization.HAIR_CUTTING)
+    stylist = Master("Olga", 35, MastersSpecialization.HAIR_STYLING)
+    cosmetologist = Master("Kate", 30, MastersSpecialization.COSMETICS)
+    for master in (cutter, stylist, cosmetologist):
+        salon.hire_staff(master)
+
+    haircut = HairService("Haircut", 15.0, [])
+    facial = CosmeticProcedure("Facial", 30.0, [Cosmetics("Serum", 20.0, "", 1)])
+
+    assert salon.get_masters_for(haircut) == [stylist, cutter]
+    assert salon.get_masters_for(facial) == [cosmetologist]
+
+    salon.fire_staff(stylist)
+
+    assert salon.get_masters_for(haircut) == [cutter]
+    assert salon.get_masters_by_specialization(
+        MastersSpecialization.HAIR_STYLING
+    ) == []
+
+
+def test_eligible_staff_indexes_per_service() -> None:
+    data_path = _new_temp_data_path()
+    repository = JsonSalonRepository(str(data_path), default_salon_name="Test Salon")
+    app_service = SalonAppService(repository)
+
+    try:
+        app_service.hire_master("Kate", 30, "Cosmetics master")
+        app_service.hire_master("John", 25, "Hair cutting master")
+        app_service.hire_master("Olga", 35, "Hair styling master")
+        app_service.add_service("Haircut", 30.0, "hair", [])
+        app_service.add_service("Facial", 40.0, "cosmetic", [])
+
+        assert app_service.get_eligible_staff_indexes() == {0: [1, 2], 1: [0]}
+        assert [m.get_name() for m in app_service.list_eligible_masters(1)] == ["Kate"]
+    finally:
+        if data_path.exists():
+            data_path.unlink()
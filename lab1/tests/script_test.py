@@ -0,0 +1,113 @@
+import io
+import json
+from pathlib import Path
+from uuid import uuid4
+
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.service import SalonAppService
+from src.interface.script import SalonScriptRunner
+from src.main import main
+
+SCRIPT = """\
+# staff and stock
+hire "Anna Smith" 30 "Hair cutting master"
+hire Kate 28 COSMETICS
+add-item Scissors equipment 5 "Steel scissors"
+add-item Serum cosmetics 10 Hydrating 20.5
+add-service Haircut 15 hair 0
+add-service Facial 30 cosmetic 0
+book "John Doe" 35 0 0 2026-03-02T10:00 2026-03-02T11:00
+book Mary 22 1 1
+execute 1
+restock Serum 3
+"""
+
+
+def _new_temp_path(suffix: str = ".json") -> Path:
+    temp_dir = Path(__file__).resolve().parent / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    return temp_dir / f"salon_{uuid4().hex}{suffix}"
+
+
+def _build_service(data_path: Path) -> SalonAppService:
+    return SalonAppService(JsonSalonRepository(str(data_path)))
+
+
+def test_script_runs_all_commands_in_one_batch() -> None:
+    data_path = _new_temp_path()
+    app_service = _build_service(data_path)
+
+    try:
+        summary = SalonScriptRunner(app_service).run(SCRIPT.splitlines())
+
+        assert summary["ok"] is True
+        assert summary["committed"] is True
+        assert summary["operations"] == 10
+        assert summary["counts"]["book"] == 2
+        assert [m.get_name() for m in app_service.list_staff()] == ["Anna Smith", "Kate"]
+        serum = app_service.list_inventory()[1]
+        assert serum.get_amount() == 12
+        assert app_service.list_bookings()[0].get_start().hour == 10
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_script_failure_reports_line_and_writes_nothing() -> None:
+    data_path = _new_temp_path()
+    app_service = _build_service(data_path)
+
+    try:
+        summary = SalonScriptRunner(app_service).run(
+            ["hire Kate 28 COSMETICS", "", "fire 5", "hire Olga 30 COSMETICS"]
+        )
+        assert summary["ok"] is False
+        assert summary["committed"] is False
+        assert summary["error"]["line"] == 3
+        assert summary["error"]["text"] == "fire 5"
+        assert not data_path.exists()
+
+        summary = SalonScriptRunner(app_service).run(["hire Kate twenty COSMETICS"])
+        assert "whole number" in summary["error"]["error"]
+        summary = SalonScriptRunner(app_service).run(["dance 1"])
+        assert "Unknown command" in summary["error"]["error"]
+        summary = SalonScriptRunner(app_service).run(["book Mary 22 1 1 2026-03-02T10:00"])
+        assert "START and END" in summary["error"]["error"]
+    finally:
+        if data_path.exists():
+            data_path.unlink()
+
+
+def test_main_script_option_prints_json_summary(capsys, monkeypatch) -> None:
+    script_path = _new_temp_path(".txt")
+    script_path.write_text("dance\n", encoding="utf-8")
+
+    try:
+        exit_code = main(["--script", str(script_path)])
+    finally:
+        script_path.unlink()
+
+    summary = json.loads(capsys.readouterr().out)
+    assert exit_code == 1
+    assert summary["error"]["line"] == 1
+
+
+def test_main_script_summary_stays_parseable_when_the_salon_prints(
+    capsys, monkeypatch
+) -> None:
+    data_path = _new_temp_path()
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO('add-item Serum cosmetics 10 "Face" 20\nsell Serum 2\n'),
+    )
+
+    try:
+        exit_code = main(["--data", str(data_path), "--script", "-"])
+    finally:
+        data_path.unlink(missing_ok=True)
+
+    captured = capsys.readouterr()
+    summary = json.loads(captured.out)
+    assert exit_code == 0
+    assert summary["ok"] is True
+    assert "Sold Serum" in captured.err
@@ -0,0 +1,214 @@
+import time
+from pathlib import Path
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from salon_core.application.errors import AppServiceError
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.service import SalonAppService
+from salon_core.application.session import SalonJournal, SalonSession
+from salon_core.utils.data_manager import SalonDataManager
+from salon_core.utils.masters_specialization import MastersSpecialization
+from src.interface.cli import SalonCLI
+
+
+def _new_temp_paths() -> tuple[Path, Path]:
+    temp_dir = Path(__file__).resolve().parent / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    name = f"salon_{uuid4().hex}"
+    return temp_dir / f"{name}.json", temp_dir / f"{name}.journal"
+
+
+def _cleanup(*paths: Path) -> None:
+    for path in paths:
+        if path.exists():
+            path.unlink()
+
+
+def test_session_saves_only_on_flush_and_close() -> None:
+    data_path, journal_path = _new_temp_paths()
+    session = SalonSession(JsonSalonRepository(str(data_path)), str(journal_path), 0)
+
+    try:
+        with mock.patch.object(
+            SalonDataManager,
+            "save",
+            autospec=True,
+            side_effect=SalonDataManager.save,
+        ) as save:
+            with session:
+                session.service.hire_master("Kate", 28, MastersSpecialization.COSMETICS)
+                session.service.restock_or_create_item(
+                    name="Serum",
+                    category="cosmetics",
+                    initial_amount=5,
+                    price=20.0,
+                )
+                assert save.call_count == 0
+                assert not data_path.exists()
+                assert journal_path.exists()
+
+                assert session.flush() is True
+                assert session.flush() is False
+                assert not journal_path.exists()
+
+                session.service.sell_product("Serum", 2)
+            assert save.call_count == 2
+
+        stored = JsonSalonRepository(str(data_path)).load()
+        assert stored.get_staff()[0].get_name() == "Kate"
+        assert stored.find_product("Serum").get_amount() == 3
+    finally:
+        _cleanup(data_path, journal_path)
+
+
+def test_session_replays_journal_after_crash() -> None:
+    data_path, journal_path = _new_temp_paths()
+    repository = JsonSalonRepository(str(data_path))
+
+    try:
+        crashed = SalonSession(repository, str(journal_path), 0).start()
+        crashed.service.hire_master("Kate", 28, MastersSpecialization.COSMETICS)
+        crashed.flush()
+        crashed.service.hire_master("Olga", 35, "Hair cutting master")
+        crashed.service.fire_master(0)
+        with pytest.raises(AppServiceError):
+            crashed.service.fire_master(5)
+        # The process dies here without close().
+
+        with SalonSession(repository, str(journal_path), 0) as recovered:
+            staff = recovered.service.list_staff()
+            assert [master.get_name() for master in staff] == ["Olga"]
+            assert recovered.has_unsaved_changes()
+
+        assert [m.get_name() for m in repository.load().get_staff()] == ["Olga"]
+        assert not journal_path.exists()
+    finally:
+        _cleanup(data_path, journal_path)
+
+
+@pytest.mark.parametrize("crash_after", ["save", "mark_flushed"])
+def test_session_ignores_journal_already_saved(crash_after: str) -> None:
+    data_path, journal_path = _new_temp_paths()
+    repository = JsonSalonRepository(str(data_path))
+
+    try:
+        session = SalonSession(repository, str(journal_path), 0).start()
+        session.service.hire_master("Kate", 28, MastersSpecialization.COSMETICS)
+        # Crash after saving the salon, before the journal is removed.
+        with mock.patch.object(SalonJournal, "clear"):
+            if crash_after == "save":
+                with mock.patch.object(SalonJournal, "mark_flushed"):
+                    session.close()
+            else:
+                session.close()
+        with open(journal_path, "ab") as journal_file:
+            journal_file.write(b'{"base": "torn')
+
+        with SalonSession(repository, str(journal_path), 0) as recovered:
+            assert len(recovered.service.list_staff()) == 1
+            assert not recovered.has_unsaved_changes()
+        assert not journal_path.exists()
+    finally:
+        _cleanup(data_path, journal_path)
+
+
+def test_session_keeps_its_calls_when_another_writer_saves() -> None:
+    data_path, journal_path = _new_temp_paths()
+    repository = JsonSalonRepository(str(data_path))
+    web = SalonAppService(JsonSalonRepository(str(data_path)))
+
+    try:
+        web.hire_master("Kate", 28, MastersSpecialization.COSMETICS)
+        crashed = SalonSession(repository, str(journal_path), 0).start()
+        crashed.service.hire_master("Olga", 35, "Hair cutting master")
+        # The process dies here without close(), then the web app saves.
+        web.hire_master("Anna", 30, "Cosmetics master")
+
+        with SalonSession(repository, str(journal_path), 0) as recovered:
+            recovered.service.hire_master("Mary", 25, "Cosmetics master")
+            web.fire_master(0)
+        assert [m.get_name() for m in repository.load().get_staff()] == [
+            "Anna",
+            "Olga",
+            "Mary",
+        ]
+        assert not journal_path.exists()
+    finally:
+        _cleanup(data_path, journal_path)
+
+
+def test_session_replays_index_calls_on_the_same_entities() -> None:
+    data_path, journal_path = _new_temp_paths()
+    repository = JsonSalonRepository(str(data_path))
+    web = SalonAppService(JsonSalonRepository(str(data_path)))
+
+    try:
+        for name in ("Anna", "Bella", "Carla"):
+            web.hire_master(name, 30, "Cosmetics master")
+        web.add_service("Facial", 30.0, "cosmetic", [])
+        with SalonSession(repository, str(journal_path), 0) as session:
+            session.service.fire_master(1)
+            session.service.create_booking("John", 30, 1, 0)
+            web.fire_master(0)
+        staff = repository.load().get_staff()
+        assert [master.get_name() for master in staff] == ["Carla"]
+        bookings = repository.load().get_all_bookings()
+        assert [booking.get_master().get_name() for booking in bookings] == ["Carla"]
+    finally:
+        _cleanup(data_path, journal_path)
+
+
+def test_session_refuses_to_flush_calls_on_removed_entities() -> None:
+    data_path, journal_path = _new_temp_paths()
+    repository = JsonSalonRepository(str(data_path))
+    web = SalonAppService(JsonSalonRepository(str(data_path)))
+
+    try:
+        for name in ("Anna", "Bella"):
+            web.hire_master(name, 30, "Cosmetics master")
+        session = SalonSession(repository, str(journal_path), 0).start()
+        session.service.fire_master(1)
+        web.fire_master(1)
+        web.hire_master("Bella", 30, "Hair cutting master")
+
+        with pytest.raises(AppServiceError, match="another writer"):
+            session.flush()
+        assert journal_path.exists()
+        staff = repository.load().get_staff()
+        assert [master.get_name() for master in staff] == ["Anna", "Bella"]
+    finally:
+        _cleanup(data_path, journal_path)
+
+
+def test_session_keeps_failed_timer_flush_for_the_cli(caplog, capsys) -> None:
+    data_path, journal_path = _new_temp_paths()
+    session = SalonSession(JsonSalonRepository(str(data_path)), str(journal_path), 0.01)
+
+    try:
+        with mock.patch.object(SalonDataManager, "save", side_effect=OSError("disk full")):
+            session.start()
+            session.service.hire_master("Kate", 28, MastersSpecialization.COSMETICS)
+            for _ in range(500):
+                if "Salon session flush failed" in caplog.text:
+                    break
+                time.sleep(0.01)
+            assert "Salon session flush failed" in caplog.text
+
+            with mock.patch("builtins.input", side_effect=["0"]):
+                with pytest.raises(SystemExit) as exit_info:
+                    SalonCLI(session.service, session).run()
+        assert exit_info.value.code == 1
+        output = capsys.readouterr().out
+        assert "Autosave failed: disk full" in output
+        assert "Could not save: disk full" in output
+        assert journal_path.exists()
+
+        with SalonSession(JsonSalonRepository(str(data_path)), str(journal_path), 0) as recovered:
+            assert [master.get_name() for master in recovered.service.list_staff()] == ["Kate"]
+        stored = JsonSalonRepository(str(data_path)).load()
+        assert [master.get_name() for master in stored.get_staff()] == ["Kate"]
+    finally:
+        _cleanup(data_path, journal_path)
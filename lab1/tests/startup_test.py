@@ -0,0 +1,74 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+LAB_DIR = Path(__file__).resolve().parent.parent
+
+
+def _imported_modules(statement: str, prefixes: tuple[str, ...]) -> set[str]:
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=LAB_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name for name in json.loads(completed.stdout) if name.startswith(prefixes)}
+
+
+def test_importing_main_loads_only_what_argument_parsing_needs() -> None:
+    assert _imported_modules("import src.main", ("salon_core", "src")) == {
+        "salon_core",
+        "salon_core.utils",
+        "salon_core.utils.serializers",
+        "src",
+        "src.interface",
+        "src.interface.script_help",
+        "src.main",
+    }
+
+
+def test_service_imports_entities_only_for_mutations() -> None:
+    statement = (
+        "import src\n"
+        "from salon_core.application.service import SalonAppService\n"
+        "from salon_core.application.repositories.batch_repository import "
+        "BatchSalonRepository"
+    )
+    assert _imported_modules(statement, ("salon_core.entities",)) == set()
+
+
+@pytest.mark.parametrize("mode_args", [[], ["--session"]])
+def test_launch_to_exit_never_loads_the_salon_model(mode_args: list[str]) -> None:
+    temp_dir = LAB_DIR / "tests" / ".tmp"
+    temp_dir.mkdir(exist_ok=True)
+    data_path = temp_dir / f"startup_{uuid4().hex}.json"
+    data_path.write_text('{"name": "Startup Salon", "staff": []}', encoding="utf-8")
+
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "src.main", "--data", str(data_path)]
+            + mode_args,
+            cwd=LAB_DIR,
+            input="0\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    finally:
+        data_path.unlink()
+        data_path.with_suffix(".journal").unlink(missing_ok=True)
+
+    assert "Welcome to 'Startup Salon'" in completed.stdout
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "src.interface.cli" in imported
+    assert {name for name in imported if name.startswith("salon_core.entities")} == set()
@@ -29,6 +29,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "salon_web.middleware.ServerTimingMiddleware",
+    "salon_web.middleware.SalonSnapshotMiddleware",
 ]
 
 ROOT_URLCONF = "salon_site.urls"
@@ -68,4 +70,35 @@ USE_TZ = True
 STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Rendered table fragments, keyed by SalonAppService section versions.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "salon-fragments",
+        "OPTIONS": {"MAX_ENTRIES": 500},
+    },
+}
+
+# "json" shares SALON_DATA_PATH with the CLI, "orm" keeps the salon in DATABASES,
+# "replica" serves read-only from snapshots shipped to SALON_REPLICA_DIR.
+SALON_STORAGE = "json"
 SALON_DATA_PATH = (BASE_DIR.parent / "lab1" / "src" / "salon_save.json").resolve()
+# How "json" storage writes the file: "json", "json-compact", "orjson" (if
+# installed) or "json-gzip". Files in any of these formats are read.
+SALON_DATA_FORMAT = "json"
+# With "json" storage every save is also shipped here when set. Replicas
+# look for new snapshots at most every SALON_REPLICA_MAX_STALENESS seconds.
+SALON_REPLICA_DIR = None
+SALON_REPLICA_MAX_STALENESS = 5.0
+
+# Live dashboard stream: reconnect delay and how long one stream may hold a worker.
+# Every open dashboard holds a worker for that long; the browser then reconnects
+# with Last-Event-ID, which frees the worker for other requests in between.
+SALON_LIVE_RETRY_MS = 3000
+SALON_LIVE_KEEPALIVE_SECONDS = 15
+SALON_LIVE_STREAM_SECONDS = 30
+
+# Background jobs (exports, imports): pool size and where results are kept;
+# None keeps results in a fresh temporary directory.
+SALON_JOB_WORKERS = 2
+SALON_JOB_RESULTS_DIR = None
@@ -0,0 +1,319 @@
+import base64
+import binascii
+from itertools import islice
+from typing import Callable, Iterable
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import FileResponse, Http404, JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_GET, require_POST
+
+from salon_core.application.errors import AppServiceError
+from salon_core.application.export import booking_to_row
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.inventory.inventory_item import InventoryItem
+from salon_core.entities.management.booking import Booking
+from salon_core.entities.management.master import Master
+from salon_core.entities.services.service import Service
+from salon_core.utils.booking_status import BookingStatus
+from salon_web import models
+from salon_web.app_service import (
+    get_app_service,
+    get_dashboard_counters,
+    get_request_service,
+)
+from salon_web.jobs import DONE, export_task, get_job_runner, import_bookings_task
+from salon_web.orm_repository import from_db_time
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+COMPACT_JSON = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+class ApiRequestError(Exception):
+    def __init__(self, msg: str) -> None:
+        super().__init__(msg)
+        self.msg: str = msg
+
+
+def _json(payload: dict, status: int = 200) -> JsonResponse:
+    return JsonResponse(payload, status=status, json_dumps_params=COMPACT_JSON)
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        offset = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ApiRequestError("Invalid cursor")
+    if offset < 0:
+        raise ApiRequestError("Invalid cursor")
+    return offset
+
+
+def _page_size(request) -> int:
+    raw_limit = request.GET.get("limit")
+    if raw_limit is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw_limit)
+    except ValueError:
+        raise ApiRequestError("Limit must be an integer")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ApiRequestError(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit
+
+
+def _selected_fields(request, available: tuple[str, ...]) -> tuple[str, ...]:
+    raw_fields = request.GET.get("fields")
+    if not raw_fields:
+        return available
+    fields = tuple(field.strip() for field in raw_fields.split(",") if field.strip())
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise ApiRequestError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def _paginate(
+    request,
+    items: Iterable[tuple[int, object]],
+    to_row: Callable[[int, object], dict],
+    available_fields: tuple[str, ...],
+) -> dict:
+    """
+    Serializes only the requested page of (id, item) pairs. The cursor is
+    the opaque position of the next pair; later items are never converted.
+    """
+    limit = _page_size(request)
+    fields = _selected_fields(request, available_fields)
+    cursor = request.GET.get("cursor")
+    offset = _decode_cursor(cursor) if cursor else 0
+
+    if isinstance(items, QuerySet):
+        # The database applies offset and limit; rows are keyed by position.
+        page = [(row.position, row) for row in items[offset:offset + limit + 1]]
+    else:
+        page = list(islice(items, offset, offset + limit + 1))
+    has_more = len(page) > limit
+    results = []
+    for index, item in page[:limit]:
+        row = to_row(index, item)
+        results.append({field: row[field] for field in fields})
+    return {
+        "results": results,
+        "next": _encode_cursor(offset + limit) if has_more else None,
+    }
+
+
+def api_endpoint(view):
+    def wrapper(request, *args, **kwargs):
+        try:
+            return _json(view(request, *args, **kwargs))
+        except ApiRequestError as error:
+            return _json({"error": error.msg}, status=400)
+        except AppServiceError as error:
+            return _json({"error": error.message}, status=400)
+
+    wrapper.__name__ = view.__name__
+    wrapper.__doc__ = view.__doc__
+    return require_GET(wrapper)
+
+
+STAFF_FIELDS = ("id", "name", "age", "specialization")
+INVENTORY_FIELDS = ("id", "type", "name", "description", "amount", "price")
+SERVICE_FIELDS = ("id", "type", "name", "price", "resources", "eligible_master_ids")
+BOOKING_FIELDS = (
+    "id",
+    "client_name",
+    "client_age",
+    "master_name",
+    "master_specialization",
+    "service_name",
+    "price",
+    "start",
+    "end",
+    "status",
+)
+
+
+def _staff_row(index: int, master: Master) -> dict:
+    return {
+        "id": index,
+        "name": master.get_name(),
+        "age": master.get_age(),
+        "specialization": master.get_specialization().value,
+    }
+
+
+def _inventory_row(index: int, item: InventoryItem) -> dict:
+    is_cosmetics = isinstance(item, Cosmetics)
+    return {
+        "id": index,
+        "type": "Cosmetics" if is_cosmetics else "Equipment",
+        "name": item.get_name(),
+        "description": item.get_description(),
+        "amount": item.get_amount(),
+        "price": item.get_price() if is_cosmetics else None,
+    }
+
+
+def _booking_row(index: int, booking: Booking) -> dict:
+    return {"id": index, **booking_to_row(booking)}
+
+
+def _orm_booking_row(position: int, row: models.Booking) -> dict:
+    start, end = from_db_time(row.start), from_db_time(row.end)
+    return {
+        "id": position,
+        "client_name": row.client_name,
+        "client_age": row.client_age,
+        "master_name": row.master.name,
+        "master_specialization": row.master.specialization,
+        "service_name": row.service.name,
+        "price": row.service.price,
+        "start": start.isoformat() if start else None,
+        "end": end.isoformat() if end else None,
+        "status": row.status,
+    }
+
+
+def _status_filter(request) -> set[BookingStatus] | None:
+    raw_statuses = request.GET.getlist("status")
+    if not raw_statuses:
+        return None
+    known = {status.value.lower(): status for status in BookingStatus}
+    wanted = set()
+    for raw_status in raw_statuses:
+        status = known.get(raw_status.strip().lower())
+        if status is None:
+            raise ApiRequestError(f"Unknown status: {raw_status}")
+        wanted.add(status)
+    return wanted
+
+
+@api_endpoint
+def staff_api(request) -> dict:
+    staff = get_request_service(request).list_staff()
+    return _paginate(request, enumerate(staff), _staff_row, STAFF_FIELDS)
+
+
+@api_endpoint
+def inventory_api(request) -> dict:
+    inventory = get_request_service(request).list_inventory()
+    return _paginate(request, enumerate(inventory), _inventory_row, INVENTORY_FIELDS)
+
+
+@api_endpoint
+def services_api(request) -> dict:
+    app_service = get_request_service(request)
+    services = app_service.list_services()
+    eligible = app_service.get_eligible_staff_indexes()
+
+    def service_row(index: int, service: Service) -> dict:
+        return {
+            "id": index,
+            "type": type(service).__name__,
+            "name": service.get_name(),
+            "price": service.get_price(),
+            "resources": [item.get_name() for item in service.get_equipment()],
+            "eligible_master_ids": eligible.get(index, []),
+        }
+
+    return _paginate(request, enumerate(services), service_row, SERVICE_FIELDS)
+
+
+@api_endpoint
+def bookings_api(request) -> dict:
+    """Bookings keep their position as id; ?status= filters by status."""
+    wanted = _status_filter(request)
+    if settings.SALON_STORAGE == "orm":
+        queryset = models.Booking.objects.select_related("master", "service")
+        if wanted is not None:
+            queryset = queryset.filter(status__in=[status.value for status in wanted])
+        return _paginate(request, queryset, _orm_booking_row, BOOKING_FIELDS)
+
+    bookings = get_request_service(request).list_bookings()
+    pairs = (
+        (index, booking)
+        for index, booking in enumerate(bookings)
+        if wanted is None or booking.get_status() in wanted
+    )
+    return _paginate(request, pairs, _booking_row, BOOKING_FIELDS)
+
+
+@api_endpoint
+def dashboard_api(request) -> dict:
+    return get_dashboard_counters().get(get_request_service(request))
+
+
+def _job_payload(job) -> dict:
+    payload = job.to_dict()
+    payload["status_url"] = reverse("api_job", args=[job.id])
+    if job.status == DONE:
+        payload["result_url"] = reverse("api_job_result", args=[job.id])
+    return payload
+
+
+@require_POST
+def submit_job_api(request):
+    """
+    Starts a background job and answers 202 with its id. Kinds: "export"
+    (format, status like the finance export) and "import_bookings"
+    (an uploaded CSV/JSONL file in the export format).
+    """
+    kind = request.POST.get("kind")
+    try:
+        if kind == "export":
+            export_format = request.POST.get("format", "csv").strip().lower()
+            # The salon is read now, so the job exports this moment's data.
+            lines = get_request_service(request).export_bookings(
+                export_format,
+                request.POST.getlist("status") or None,
+            )
+            task = export_task(lines, export_format)
+        elif kind == "import_bookings":
+            upload = request.FILES.get("file")
+            if upload is None:
+                raise ApiRequestError("Upload the bookings file as 'file'")
+            import_format = request.POST.get("format") or upload.name.rsplit(".", 1)[-1]
+            task = import_bookings_task(
+                get_app_service(),
+                upload.read(),
+                import_format.strip().lower(),
+            )
+        else:
+            raise ApiRequestError(f"Unknown job kind: {kind}")
+    except ApiRequestError as error:
+        return _json({"error": error.msg}, status=400)
+    except AppServiceError as error:
+        return _json({"error": error.message}, status=400)
+
+    job = get_job_runner().submit(kind, task)
+    return _json(_job_payload(job), status=202)
+
+
+@api_endpoint
+def job_status_api(request, job_id: str) -> dict:
+    job = get_job_runner().get(job_id)
+    if job is None:
+        raise Http404
+    return _job_payload(job)
+
+
+@require_GET
+def job_result_view(request, job_id: str):
+    job = get_job_runner().get(job_id)
+    if job is None or job.status != DONE:
+        raise Http404
+    return FileResponse(
+        open(job.result_path, "rb"),
+        as_attachment=True,
+        filename=job.filename,
+        content_type=job.content_type,
+    )
@@ -0,0 +1,136 @@
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from salon_core.application.change_feed import SalonChangeFeed
+from salon_core.application.read_models import DashboardCounters
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.application.repositories.cached_repository import CachedSalonRepository
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_core.application.repositories.notifying_repository import (
+    NotifyingSalonRepository,
+)
+from salon_core.application.repositories.replica_repository import (
+    ReplicaSalonRepository,
+)
+from salon_core.application.service import SalonAppService
+from salon_web.orm_repository import OrmSalonRepository
+
+
+class SalonServiceRegistry:
+    """
+    Process-wide holder of the salon service, its cached repository, the
+    change feed fed by its saves and the read models fed by its domain
+    events. All of them are rebuilt only when one of the SALON_STORAGE,
+    SALON_DATA_PATH, SALON_DATA_FORMAT and SALON_REPLICA_* settings changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._storage_key: tuple | None = None
+        self._service: SalonAppService | None = None
+        self._change_feed: SalonChangeFeed | None = None
+        self._dashboard_counters: DashboardCounters | None = None
+
+    def _ensure_current(self) -> None:
+        storage_key = (
+            settings.SALON_STORAGE,
+            str(settings.SALON_DATA_PATH),
+            settings.SALON_DATA_FORMAT,
+            settings.SALON_REPLICA_DIR,
+            settings.SALON_REPLICA_MAX_STALENESS,
+        )
+        if self._service is None or self._storage_key != storage_key:
+            self._change_feed = SalonChangeFeed()
+            self._service = build_app_service(
+                build_repository(*storage_key),
+                self._change_feed,
+            )
+            self._dashboard_counters = DashboardCounters(self._service)
+            self._storage_key = storage_key
+
+    def get_service(self) -> SalonAppService:
+        with self._lock:
+            self._ensure_current()
+            return self._service
+
+    def get_change_feed(self) -> SalonChangeFeed:
+        with self._lock:
+            self._ensure_current()
+            return self._change_feed
+
+    def get_dashboard_counters(self) -> DashboardCounters:
+        with self._lock:
+            self._ensure_current()
+            return self._dashboard_counters
+
+    def reset(self) -> None:
+        with self._lock:
+            self._service = None
+            self._change_feed = None
+            self._dashboard_counters = None
+            self._storage_key = None
+
+
+def build_repository(
+    storage: str,
+    data_path: str,
+    data_format: str = "json",
+    replica_dir: str | None = None,
+    replica_max_staleness: float = 5.0,
+) -> SalonRepository:
+    if storage == "orm":
+        return OrmSalonRepository(default_salon_name="BEST SALON")
+    if storage == "json":
+        try:
+            return JsonSalonRepository(
+                file_path=data_path,
+                default_salon_name="BEST SALON",
+                data_format=data_format,
+                replica_dir=str(replica_dir) if replica_dir is not None else None,
+            )
+        except ValueError as error:
+            raise ImproperlyConfigured(f"SALON_DATA_FORMAT: {error}") from error
+    if storage == "replica":
+        if replica_dir is None:
+            raise ImproperlyConfigured('SALON_STORAGE="replica" needs SALON_REPLICA_DIR')
+        return ReplicaSalonRepository(
+            str(replica_dir),
+            max_staleness=replica_max_staleness,
+            default_salon_name="BEST SALON",
+        )
+    raise ImproperlyConfigured(f"Unknown SALON_STORAGE: {storage}")
+
+
+def build_app_service(
+    repository: SalonRepository,
+    change_feed: SalonChangeFeed | None = None,
+) -> SalonAppService:
+    repository = CachedSalonRepository(repository)
+    if change_feed is not None:
+        repository = NotifyingSalonRepository(repository)
+        repository.add_listener(change_feed.publish)
+    return SalonAppService(repository)
+
+
+registry = SalonServiceRegistry()
+
+
+def get_app_service() -> SalonAppService:
+    return registry.get_service()
+
+
+def get_change_feed() -> SalonChangeFeed:
+    return registry.get_change_feed()
+
+
+def get_dashboard_counters() -> DashboardCounters:
+    return registry.get_dashboard_counters()
+
+
+def get_request_service(request) -> SalonAppService:
+    app_service = getattr(request, "salon_service", None)
+    if app_service is None:
+        app_service = get_app_service()
+    return app_service
@@ -122,17 +122,24 @@ class CreateBookingForm(forms.Form):
     client_age = forms.IntegerField(min_value=0, max_value=120)
     master_index = forms.ChoiceField(choices=())
     service_index = forms.ChoiceField(choices=())
+    start_time = forms.DateTimeField(
+        required=False,
+        widget=forms.DateTimeInput(attrs={"type": "datetime-local"}),
+    )
+    duration_minutes = forms.IntegerField(required=False, min_value=1, initial=60)
 
     def __init__(
         self,
         *args,
         staff: list[Master] | None = None,
         services: list[Service] | None = None,
+        eligible: dict[int, list[int]] | None = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         staff = staff or []
         services = services or []
+        self.eligible = eligible
         self.fields["master_index"].choices = [
             (str(i), f"{master.get_name()} ({master.get_specialization().value})")
             for i, master in enumerate(staff)
@@ -140,8 +147,26 @@ class CreateBookingForm(forms.Form):
         self.fields["service_index"].choices = [
             (str(i), f"{service.get_name()} ({service.get_price()} BYN)")
             for i, service in enumerate(services)
+            if eligible is None or eligible.get(i)
         ]
 
+    def clean(self):
+        cleaned_data = super().clean()
+        master_index = cleaned_data.get("master_index")
+        service_index = cleaned_data.get("service_index")
+        if (
+            self.eligible is not None
+            and master_index is not None
+            and service_index is not None
+            and int(master_index) not in self.eligible.get(int(service_index), [])
+        ):
+            raise forms.ValidationError("Selected master can't perform this service.")
+
+        start_time = cleaned_data.get("start_time")
+        if start_time is not None and not cleaned_data.get("duration_minutes"):
+            raise forms.ValidationError("Duration is required for a timed booking.")
+        return cleaned_data
+
 
 class BookingActionForm(forms.Form):
     booking_index = forms.ChoiceField(choices=())
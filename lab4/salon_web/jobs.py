@@ -0,0 +1,181 @@
+import csv
+import io
+import json
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable
+from uuid import uuid4
+
+from django.conf import settings
+
+from salon_core.application.errors import AppServiceError
+from salon_core.application.service import SalonAppService
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# A task writes its result into the file and returns (content type, file name).
+JobTask = Callable[[BinaryIO], tuple[str, str]]
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    status: str
+    created_at: datetime
+    finished_at: datetime | None = None
+    error: str | None = None
+    result_path: Path | None = None
+    content_type: str | None = None
+    filename: str | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+class JobRunner:
+    """
+    Runs slow salon tasks on a thread pool inside the Django process.
+    Results are written to files, so a finished job costs no memory; only
+    the newest `history` finished jobs are kept.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        results_dir: str | None = None,
+        history: int = 100,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="salon-job",
+        )
+        self._results_dir = Path(results_dir or tempfile.mkdtemp(prefix="salon-jobs-"))
+        self._results_dir.mkdir(parents=True, exist_ok=True)
+        self._history = history
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._futures: dict[str, Future] = {}
+
+    def submit(self, kind: str, task: JobTask) -> Job:
+        job = Job(uuid4().hex, kind, QUEUED, datetime.now(timezone.utc))
+        with self._lock:
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._executor.submit(self._run, job, task)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, task: JobTask) -> None:
+        with self._lock:
+            job.status = RUNNING
+        result_path = self._results_dir / job.id
+        try:
+            with open(result_path, "wb") as result_file:
+                content_type, filename = task(result_file)
+        except Exception as error:
+            result_path.unlink(missing_ok=True)
+            with self._lock:
+                job.status = FAILED
+                job.error = error.message if isinstance(error, AppServiceError) else str(error)
+                job.finished_at = datetime.now(timezone.utc)
+        else:
+            with self._lock:
+                job.status = DONE
+                job.result_path = result_path
+                job.content_type = content_type
+                job.filename = filename
+                job.finished_at = datetime.now(timezone.utc)
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            finished = [job for job in self._jobs.values() if job.finished_at is not None]
+            for job in finished[: max(0, len(finished) - self._history)]:
+                del self._jobs[job.id]
+                self._futures.pop(job.id, None)
+                if job.result_path is not None:
+                    job.result_path.unlink(missing_ok=True)
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Job | None:
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout)
+        return self.get(job_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+_runner_lock = threading.Lock()
+_runner: JobRunner | None = None
+
+
+def get_job_runner() -> JobRunner:
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner(
+                max_workers=settings.SALON_JOB_WORKERS,
+                results_dir=settings.SALON_JOB_RESULTS_DIR,
+            )
+        return _runner
+
+
+def export_task(lines: Iterable[str], export_format: str) -> JobTask:
+    def task(result_file: BinaryIO) -> tuple[str, str]:
+        for line in lines:
+            result_file.write(line.encode("utf-8"))
+        content_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+        return content_type, f"bookings.{export_format}"
+
+    return task
+
+
+def _parse_import_rows(content: bytes, import_format: str) -> list[dict]:
+    text = content.decode("utf-8-sig")
+    if import_format == "csv":
+        return list(csv.DictReader(io.StringIO(text)))
+    if import_format == "jsonl":
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    raise ValueError(f"Unsupported import format: {import_format}")
+
+
+def import_bookings_task(
+    app_service: SalonAppService,
+    content: bytes,
+    import_format: str,
+) -> JobTask:
+    """
+    Imports the rows of a booking export through one service mutation,
+    so the import costs a single load and save and every row is matched
+    to a master and service by name on the same salon. Rows keep their
+    status; failing rows are reported instead of stopping the import.
+    """
+
+    def task(result_file: BinaryIO) -> tuple[str, str]:
+        rows = _parse_import_rows(content, import_format)
+        created, errors = app_service.import_bookings(rows)
+
+        report = {"created": created, "errors": errors}
+        result_file.write(json.dumps(report, ensure_ascii=False).encode("utf-8"))
+        return "application/json", "import-report.json"
+
+    return task
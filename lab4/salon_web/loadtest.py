@@ -0,0 +1,292 @@
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar
+from typing import Callable
+
+DEFAULT_MIX = {
+    "dashboard": 4,
+    "staff": 2,
+    "inventory": 1,
+    "services": 1,
+    "bookings": 2,
+    "api_bookings": 2,
+    "create_booking": 1,
+}
+
+READ_PATHS = {
+    "dashboard": "/",
+    "staff": "/staff/",
+    "inventory": "/inventory/",
+    "services": "/services/",
+    "bookings": "/bookings/",
+    "finance": "/finance/",
+    "api_dashboard": "/api/dashboard/",
+    "api_bookings": "/api/bookings/?limit=50",
+}
+WRITE_ACTIONS = ("create_booking",)
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class ViewStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def percentile(self, percentile: int) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(0, -(-percentile * len(ordered) // 100) - 1)
+        return ordered[rank]
+
+
+@dataclass
+class LoadTestReport:
+    views: dict[str, ViewStats]
+    elapsed: float
+
+    def total_requests(self) -> int:
+        return sum(len(stats.latencies) for stats in self.views.values())
+
+    def throughput(self) -> float:
+        return self.total_requests() / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        views = {}
+        for name, stats in sorted(self.views.items()):
+            count = len(stats.latencies)
+            views[name] = {
+                "requests": count,
+                "errors": stats.errors,
+                "error_rate": stats.errors / count if count else 0.0,
+                **{
+                    f"p{percentile}_ms": _to_ms(stats.percentile(percentile))
+                    for percentile in LATENCY_PERCENTILES
+                },
+            }
+        return {
+            "requests": self.total_requests(),
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.throughput(), 1),
+            "views": views,
+        }
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+def parse_mix(raw_mix: str) -> dict[str, int]:
+    """Parses "dashboard=4,create_booking=1" into view weights."""
+    known = set(READ_PATHS) | set(WRITE_ACTIONS)
+    mix = {}
+    for part in raw_mix.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in known:
+            raise ValueError(f"Unknown view in mix: {name}")
+        try:
+            mix[name] = int(weight) if weight else 1
+        except ValueError:
+            raise ValueError(f"Weight of {name} must be an integer")
+        if mix[name] < 0:
+            raise ValueError(f"Weight of {name} cannot be negative")
+    if not any(mix.values()):
+        raise ValueError("Mix needs at least one view with positive weight")
+    return mix
+
+
+class LoadTestClient(ABC):
+    """One worker's HTTP session; get and post return the status code."""
+
+    @abstractmethod
+    def get(self, path: str) -> int:
+        pass
+
+    @abstractmethod
+    def post(self, path: str, data: dict) -> int:
+        pass
+
+    @abstractmethod
+    def get_json(self, path: str) -> dict:
+        pass
+
+
+class DjangoTestClient(LoadTestClient):
+    """In-process client; CSRF checks are off as in the test suite."""
+
+    def __init__(self) -> None:
+        from django.test import Client
+
+        self._client = Client()
+
+    def get(self, path: str) -> int:
+        return self._client.get(path).status_code
+
+    def post(self, path: str, data: dict) -> int:
+        return self._client.post(path, data).status_code
+
+    def get_json(self, path: str) -> dict:
+        return self._client.get(path).json()
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpLoadTestClient(LoadTestClient):
+    """Client for a running site; keeps cookies and sends the CSRF token."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._cookies = CookieJar()
+        self._opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self._cookies),
+            _NoRedirect(),
+        )
+
+    def _open(self, request: urllib.request.Request) -> tuple[int, bytes]:
+        try:
+            with self._opener.open(request, timeout=self._timeout) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.read()
+
+    def _csrf_token(self) -> str:
+        for cookie in self._cookies:
+            if cookie.name == "csrftoken":
+                return cookie.value
+        # Form pages hand out the token cookie.
+        self.get("/bookings/")
+        for cookie in self._cookies:
+            if cookie.name == "csrftoken":
+                return cookie.value
+        return ""
+
+    def get(self, path: str) -> int:
+        return self._open(urllib.request.Request(self._base_url + path))[0]
+
+    def post(self, path: str, data: dict) -> int:
+        token = self._csrf_token()
+        body = urllib.parse.urlencode({**data, "csrfmiddlewaretoken": token})
+        request = urllib.request.Request(
+            self._base_url + path,
+            data=body.encode(),
+            headers={"X-CSRFToken": token, "Referer": self._base_url + path},
+        )
+        return self._open(request)[0]
+
+    def get_json(self, path: str) -> dict:
+        status, body = self._open(urllib.request.Request(self._base_url + path))
+        if status != 200:
+            raise RuntimeError(f"GET {path} answered {status}")
+        return json.loads(body)
+
+
+def _eligible_pairs(client: LoadTestClient) -> list[tuple[int, int]]:
+    payload = client.get_json("/api/services/?fields=id,eligible_master_ids&limit=500")
+    return [
+        (master_id, service["id"])
+        for service in payload["results"]
+        for master_id in service["eligible_master_ids"]
+    ]
+
+
+def run_load_test(
+    make_client: Callable[[], LoadTestClient],
+    mix: dict[str, int],
+    requests: int,
+    workers: int,
+    seed: int | None = None,
+) -> LoadTestReport:
+    """
+    Sends `requests` requests picked by weight from the mix through
+    `workers` concurrent clients. A booking POST counts as an error
+    unless it redirects, so rejected concurrent writes show up too.
+    """
+    if requests <= 0 or workers <= 0:
+        raise ValueError("Requests and workers must be positive")
+
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    booking_pairs: list[tuple[int, int]] = []
+    if "create_booking" in names:
+        booking_pairs = _eligible_pairs(make_client())
+        if not booking_pairs:
+            raise ValueError("No master can perform any service, nothing to book")
+
+    stats = {name: ViewStats() for name in names}
+    stats_lock = threading.Lock()
+    counter = iter(range(requests))
+    counter_lock = threading.Lock()
+
+    def worker(worker_index: int) -> None:
+        client = make_client()
+        rng = random.Random(None if seed is None else seed + worker_index)
+        while True:
+            with counter_lock:
+                if next(counter, None) is None:
+                    return
+            name = rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                if name == "create_booking":
+                    master_index, service_index = rng.choice(booking_pairs)
+                    status = client.post(
+                        "/bookings/",
+                        {
+                            "action": "create",
+                            "client_name": f"Load Client {rng.randrange(10**6)}",
+                            "client_age": rng.randint(18, 80),
+                            "master_index": master_index,
+                            "service_index": service_index,
+                        },
+                    )
+                    failed = status != 302
+                else:
+                    failed = client.get(READ_PATHS[name]) >= 400
+            except OSError:
+                failed = True
+            latency = time.perf_counter() - started
+            with stats_lock:
+                stats[name].latencies.append(latency)
+                stats[name].errors += failed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(worker, index) for index in range(workers)]:
+            future.result()
+    return LoadTestReport(stats, time.perf_counter() - started)
+
+
+def format_report(report: LoadTestReport) -> str:
+    data = report.to_dict()
+    header = f"{'view':<16}{'requests':>10}{'errors':>8}{'err%':>8}"
+    header += "".join(f"{f'p{p} ms':>10}" for p in LATENCY_PERCENTILES)
+    lines = [header]
+    for name, view in data["views"].items():
+        line = (
+            f"{name:<16}{view['requests']:>10}{view['errors']:>8}"
+            f"{view['error_rate'] * 100:>7.1f}%"
+        )
+        for percentile in LATENCY_PERCENTILES:
+            value = view[f"p{percentile}_ms"]
+            line += f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+        lines.append(line)
+    lines.append(
+        f"{data['requests']} requests in {data['elapsed_s']:.2f}s, "
+        f"{data['throughput_rps']:.1f} req/s"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from salon_core.application.repositories.json_repository import JsonSalonRepository
+from salon_web.app_service import registry
+from salon_web.orm_repository import OrmSalonRepository
+
+
+class Command(BaseCommand):
+    help = "Copies the salon from a JSON save file into the database (SALON_STORAGE=orm)."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "path",
+            nargs="?",
+            help="JSON save file, SALON_DATA_PATH by default.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = Path(options["path"] or settings.SALON_DATA_PATH)
+        if not path.exists():
+            raise CommandError(f"File {path} doesn't exist")
+
+        salon = JsonSalonRepository(str(path)).load()
+        OrmSalonRepository().save(salon)
+        registry.reset()
+        self.stdout.write(
+            f"Imported {salon.get_name()}: {len(salon.get_staff())} masters, "
+            f"{len(salon.get_inventory())} items, {len(salon.get_services())} services, "
+            f"{len(salon.get_all_bookings())} bookings."
+        )
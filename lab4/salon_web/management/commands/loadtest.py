@@ -0,0 +1,87 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from salon_web.app_service import registry
+from salon_web.loadtest import (
+    DEFAULT_MIX,
+    DjangoTestClient,
+    HttpLoadTestClient,
+    format_report,
+    parse_mix,
+    run_load_test,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Drives the salon site with concurrent workers and reports throughput "
+        "and p50/p95/p99 latency per view."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--url",
+            help="Base URL of a running site. Without it requests go through "
+            "the Django test client against a copy of SALON_DATA_PATH.",
+        )
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument(
+            "--mix",
+            default=",".join(f"{name}={weight}" for name, weight in DEFAULT_MIX.items()),
+            help="Comma-separated view=weight pairs.",
+        )
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    def handle(self, *args, **options) -> None:
+        try:
+            mix = parse_mix(options["mix"])
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        def run(make_client):
+            return run_load_test(
+                make_client,
+                mix,
+                options["requests"],
+                options["workers"],
+                options["seed"],
+            )
+
+        try:
+            if options["url"]:
+                base_url = options["url"]
+                report = run(lambda: HttpLoadTestClient(base_url))
+            else:
+                report = self._run_in_process(run)
+        except (ValueError, RuntimeError, OSError) as error:
+            raise CommandError(str(error))
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report.to_dict(), indent=2))
+        else:
+            self.stdout.write(format_report(report))
+
+    @staticmethod
+    def _run_in_process(run):
+        # Bookings created by the load must not end up in the real save file.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir) / "salon_load.json"
+            source_path = Path(settings.SALON_DATA_PATH)
+            if source_path.exists():
+                shutil.copyfile(source_path, data_path)
+            with override_settings(
+                SALON_DATA_PATH=data_path,
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ):
+                try:
+                    return run(DjangoTestClient)
+                finally:
+                    registry.reset()
@@ -0,0 +1,37 @@
+from salon_core.application.timing import recording
+from salon_web.app_service import get_app_service
+from salon_web.profiling import server_timing_header, timing_stats
+
+
+class SalonSnapshotMiddleware:
+    """Gives every request one salon snapshot shared by all its reads."""
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with get_app_service().snapshot() as app_service:
+            request.salon_service = app_service
+            return self.get_response(request)
+
+
+class ServerTimingMiddleware:
+    """
+    Times the whole request plus the SalonAppService and render phases
+    recorded inside it, sends them as a Server-Timing header and adds
+    them to the per-view stats.
+    """
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with recording() as recorder:
+            with recorder.measure("view"):
+                response = self.get_response(request)
+
+        response["Server-Timing"] = server_timing_header(recorder.durations)
+        match = request.resolver_match
+        if match is not None:
+            timing_stats.record(match.view_name, recorder.durations)
+        return response
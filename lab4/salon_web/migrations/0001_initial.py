@@ -0,0 +1,104 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventoryItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('kind', models.CharField(choices=[('Cosmetics', 'Cosmetics'), ('Equipment', 'Equipment')], max_length=20)),
+                ('name', models.CharField(db_index=True, max_length=100)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('amount', models.PositiveIntegerField()),
+                ('price', models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SalonState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('balance', models.FloatField(default=0.0)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Service',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('kind', models.CharField(choices=[('HairService', 'HairService'), ('CosmeticProcedure', 'CosmeticProcedure')], max_length=30)),
+                ('name', models.CharField(db_index=True, max_length=100)),
+                ('price', models.FloatField()),
+                ('offered', models.BooleanField(default=True)),
+            ],
+            options={
+                'ordering': ['position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Master',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('name', models.CharField(max_length=100)),
+                ('age', models.PositiveSmallIntegerField()),
+                ('specialization', models.CharField(choices=[('Cosmetics master', 'Cosmetics master'), ('Hair cutting master', 'Hair cutting master'), ('Hair styling master', 'Hair styling master')], max_length=50)),
+                ('employed', models.BooleanField(default=True)),
+            ],
+            options={
+                'ordering': ['position'],
+                'indexes': [models.Index(fields=['employed', 'specialization'], name='salon_web_m_employe_cb2f6a_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ServiceResource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='salon_web.inventoryitem')),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='salon_web.service')),
+            ],
+            options={
+                'ordering': ['service', 'position'],
+            },
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='resources',
+            field=models.ManyToManyField(through='salon_web.ServiceResource', to='salon_web.inventoryitem'),
+        ),
+        migrations.CreateModel(
+            name='Booking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(unique=True)),
+                ('client_name', models.CharField(max_length=100)),
+                ('client_age', models.PositiveSmallIntegerField()),
+                ('status', models.CharField(choices=[('Done', 'Done'), ('Confirmed', 'Confirmed'), ('Cancelled', 'Cancelled')], db_index=True, max_length=20)),
+                ('start', models.DateTimeField(blank=True, null=True)),
+                ('end', models.DateTimeField(blank=True, null=True)),
+                ('master', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='bookings', to='salon_web.master')),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='bookings', to='salon_web.service')),
+            ],
+            options={
+                'ordering': ['position'],
+                'indexes': [models.Index(fields=['master', 'start'], name='salon_web_b_master__291d96_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,94 @@
+from django.db import models
+
+from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.masters_specialization import MastersSpecialization
+
+
+class SalonState(models.Model):
+    """Single row with the salon name, balance and a save counter."""
+
+    name = models.CharField(max_length=100)
+    balance = models.FloatField(default=0.0)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class Master(models.Model):
+    position = models.PositiveIntegerField()
+    name = models.CharField(max_length=100)
+    age = models.PositiveSmallIntegerField()
+    specialization = models.CharField(
+        max_length=50,
+        choices=[(spec.value, spec.value) for spec in MastersSpecialization],
+    )
+    # Fired masters stay so their bookings keep a master.
+    employed = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ["position"]
+        indexes = [models.Index(fields=["employed", "specialization"])]
+
+
+class InventoryItem(models.Model):
+    COSMETICS = "Cosmetics"
+    EQUIPMENT = "Equipment"
+
+    position = models.PositiveIntegerField()
+    kind = models.CharField(
+        max_length=20,
+        choices=[(COSMETICS, COSMETICS), (EQUIPMENT, EQUIPMENT)],
+    )
+    name = models.CharField(max_length=100, db_index=True)
+    description = models.CharField(max_length=255, blank=True)
+    amount = models.PositiveIntegerField()
+    price = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["position"]
+
+
+class Service(models.Model):
+    HAIR = "HairService"
+    COSMETIC = "CosmeticProcedure"
+
+    position = models.PositiveIntegerField()
+    kind = models.CharField(
+        max_length=30,
+        choices=[(HAIR, HAIR), (COSMETIC, COSMETIC)],
+    )
+    name = models.CharField(max_length=100, db_index=True)
+    price = models.FloatField()
+    resources = models.ManyToManyField(InventoryItem, through="ServiceResource")
+    # Removed services stay so their bookings keep a service.
+    offered = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ["position"]
+
+
+class ServiceResource(models.Model):
+    service = models.ForeignKey(Service, on_delete=models.CASCADE)
+    item = models.ForeignKey(InventoryItem, on_delete=models.CASCADE)
+    position = models.PositiveSmallIntegerField()
+
+    class Meta:
+        ordering = ["service", "position"]
+
+
+class Booking(models.Model):
+    position = models.PositiveIntegerField(unique=True)
+    client_name = models.CharField(max_length=100)
+    client_age = models.PositiveSmallIntegerField()
+    master = models.ForeignKey(Master, on_delete=models.PROTECT, related_name="bookings")
+    service = models.ForeignKey(Service, on_delete=models.PROTECT, related_name="bookings")
+    status = models.CharField(
+        max_length=20,
+        choices=[(status.value, status.value) for status in BookingStatus],
+        db_index=True,
+    )
+    start = models.DateTimeField(null=True, blank=True)
+    end = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["position"]
+        indexes = [models.Index(fields=["master", "start"])]
@@ -0,0 +1,223 @@
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import F, Prefetch
+from django.utils import timezone
+
+from salon_core.application.repositories.base import SalonRepository
+from salon_core.entities.inventory.cosmetics import Cosmetics
+from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_core.entities.inventory.inventory_item import InventoryItem
+from salon_core.entities.management.booking import Booking
+from salon_core.entities.management.master import Master
+from salon_core.entities.salon import Salon
+from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
+from salon_core.entities.services.hair_service import HairService
+from salon_core.entities.services.service import Service
+from salon_web import models
+
+STATE_ID = 1
+
+
+def to_db_time(moment: datetime | None) -> datetime | None:
+    if moment is None or timezone.is_aware(moment):
+        return moment
+    return timezone.make_aware(moment)
+
+
+def from_db_time(moment: datetime | None) -> datetime | None:
+    return timezone.make_naive(moment) if moment is not None else None
+
+
+class OrmSalonRepository(SalonRepository):
+    """
+    Keeps the salon in the Django database. A save replaces all rows in
+    one transaction and bumps SalonState.version, which serves as the
+    data version for caches and ETags.
+    """
+
+    def __init__(self, default_salon_name: str = "New Salon") -> None:
+        self._default_salon_name = default_salon_name
+
+    def load(self) -> Salon:
+        state = models.SalonState.objects.filter(pk=STATE_ID).first()
+        if state is None:
+            return Salon(self._default_salon_name)
+
+        salon = Salon(state.name)
+        salon.get_reception().set_balance(state.balance)
+
+        masters: dict[int, Master] = {}
+        for row in models.Master.objects.all():
+            master = Master.from_dict(
+                {"name": row.name, "age": row.age, "spec": row.specialization}
+            )
+            masters[row.pk] = master
+            if row.employed:
+                salon.hire_staff(master)
+
+        items: dict[int, InventoryItem] = {}
+        for row in models.InventoryItem.objects.all():
+            data = {"name": row.name, "desc": row.description, "amount": row.amount}
+            if row.kind == models.InventoryItem.COSMETICS:
+                item = Cosmetics.from_dict({**data, "price": row.price})
+            else:
+                item = HairdressingEquipment.from_dict(data)
+            items[row.pk] = item
+            salon.add_to_inventory(item)
+
+        services: dict[int, Service] = {}
+        links = Prefetch(
+            "serviceresource_set",
+            queryset=models.ServiceResource.objects.order_by("position"),
+        )
+        for row in models.Service.objects.prefetch_related(links):
+            resources = [items[link.item_id] for link in row.serviceresource_set.all()]
+            data = {"name": row.name, "price": row.price}
+            if row.kind == models.Service.HAIR:
+                service = HairService.from_dict(data, resources)
+            else:
+                service = CosmeticProcedure.from_dict(data, resources)
+            services[row.pk] = service
+            if row.offered:
+                salon.add_service(service)
+
+        for row in models.Booking.objects.all():
+            start, end = from_db_time(row.start), from_db_time(row.end)
+            data = {
+                "client": {"name": row.client_name, "age": row.client_age},
+                "status": row.status,
+                "start": start.isoformat() if start else None,
+                "end": end.isoformat() if end else None,
+            }
+            salon.get_reception().add_booking(
+                Booking.from_dict(data, masters[row.master_id], services[row.service_id])
+            )
+        return salon
+
+    def load_name(self) -> str:
+        name = (
+            models.SalonState.objects.filter(pk=STATE_ID)
+            .values_list("name", flat=True)
+            .first()
+        )
+        return name if name is not None else self._default_salon_name
+
+    @transaction.atomic
+    def save(self, salon: Salon) -> None:
+        state, _ = models.SalonState.objects.select_for_update().get_or_create(
+            pk=STATE_ID,
+            defaults={"name": salon.get_name()},
+        )
+        state.name = salon.get_name()
+        state.balance = salon.check_balance()
+        state.version = F("version") + 1
+        state.save()
+
+        models.Booking.objects.all().delete()
+        models.ServiceResource.objects.all().delete()
+        models.Service.objects.all().delete()
+        models.InventoryItem.objects.all().delete()
+        models.Master.objects.all().delete()
+
+        bookings = salon.get_all_bookings()
+        staff = salon.get_staff()
+        employed = {id(master) for master in staff}
+        masters_by_id = {id(master): master for master in staff}
+        for booking in bookings:
+            masters_by_id.setdefault(id(booking.get_master()), booking.get_master())
+        all_masters = list(masters_by_id.values())
+        master_rows = models.Master.objects.bulk_create(
+            models.Master(
+                position=position,
+                name=master.get_name(),
+                age=master.get_age(),
+                specialization=master.get_specialization().value,
+                employed=id(master) in employed,
+            )
+            for position, master in enumerate(all_masters)
+        )
+        master_ids = {
+            id(master): row.pk for master, row in zip(all_masters, master_rows)
+        }
+
+        inventory = salon.get_inventory()
+        item_rows = models.InventoryItem.objects.bulk_create(
+            models.InventoryItem(
+                position=position,
+                kind=(
+                    models.InventoryItem.COSMETICS
+                    if isinstance(item, Cosmetics)
+                    else models.InventoryItem.EQUIPMENT
+                ),
+                name=item.get_name(),
+                description=item.get_description(),
+                amount=item.get_amount(),
+                price=item.get_price() if isinstance(item, Cosmetics) else None,
+            )
+            for position, item in enumerate(inventory)
+        )
+        item_ids = {id(item): row.pk for item, row in zip(inventory, item_rows)}
+
+        offered = salon.get_services()
+        offered_ids = {id(service) for service in offered}
+        services_by_id = {id(service): service for service in offered}
+        for booking in bookings:
+            services_by_id.setdefault(id(booking.get_service()), booking.get_service())
+        all_services = list(services_by_id.values())
+        service_rows = models.Service.objects.bulk_create(
+            models.Service(
+                position=position,
+                kind=(
+                    models.Service.HAIR
+                    if isinstance(service, HairService)
+                    else models.Service.COSMETIC
+                ),
+                name=service.get_name(),
+                price=service.get_price(),
+                offered=id(service) in offered_ids,
+            )
+            for position, service in enumerate(all_services)
+        )
+        service_ids = {
+            id(service): row.pk for service, row in zip(all_services, service_rows)
+        }
+        models.ServiceResource.objects.bulk_create(
+            models.ServiceResource(
+                service_id=service_ids[id(service)],
+                item_id=item_ids[id(resource)],
+                position=position,
+            )
+            for service in all_services
+            for position, resource in enumerate(service.get_equipment())
+            if id(resource) in item_ids
+        )
+
+        models.Booking.objects.bulk_create(
+            models.Booking(
+                position=position,
+                client_name=booking.get_client().get_name(),
+                client_age=booking.get_client().get_age(),
+                master_id=master_ids[id(booking.get_master())],
+                service_id=service_ids[id(booking.get_service())],
+                status=booking.get_status().value,
+                start=to_db_time(booking.get_start()),
+                end=to_db_time(booking.get_end()),
+            )
+            for position, booking in enumerate(bookings)
+        )
+
+    def get_version(self) -> str | None:
+        version = (
+            models.SalonState.objects.filter(pk=STATE_ID)
+            .values_list("version", flat=True)
+            .first()
+        )
+        return f"orm-{version:x}" if version is not None else None
+
+    def get_last_modified(self) -> datetime | None:
+        return (
+            models.SalonState.objects.filter(pk=STATE_ID)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
@@ -0,0 +1,73 @@
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+TIMING_PHASES = ("view", "service", "load", "action", "save", "render")
+SAMPLES_PER_METRIC = 500
+
+
+@dataclass
+class MetricStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    recent: deque = field(default_factory=lambda: deque(maxlen=SAMPLES_PER_METRIC))
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.recent)
+        p95 = ordered[max(0, -(-95 * len(ordered) // 100) - 1)] if ordered else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p95_ms": p95 * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class TimingStats:
+    """
+    In-process aggregate of request phase timings per view.
+    p95 is taken over the last SAMPLES_PER_METRIC requests of a view.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._views: dict[str, dict[str, MetricStats]] = {}
+
+    def record(self, view_name: str, durations: dict[str, float]) -> None:
+        with self._lock:
+            metrics = self._views.setdefault(view_name, {})
+            for phase, seconds in durations.items():
+                metrics.setdefault(phase, MetricStats()).add(seconds)
+
+    def summary(self) -> dict[str, dict[str, dict]]:
+        with self._lock:
+            return {
+                view_name: {
+                    phase: metrics[phase].summary()
+                    for phase in TIMING_PHASES
+                    if phase in metrics
+                }
+                for view_name, metrics in sorted(self._views.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._views.clear()
+
+
+timing_stats = TimingStats()
+
+
+def server_timing_header(durations: dict[str, float]) -> str:
+    return ", ".join(
+        f"{phase};dur={durations[phase] * 1000:.2f}"
+        for phase in TIMING_PHASES
+        if phase in durations
+    )
@@ -1,18 +1,34 @@
+import json
+from datetime import datetime
+from io import StringIO
 from pathlib import Path
+from unittest import mock
 from uuid import uuid4
 
-from django.test import Client, TestCase, override_settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.test import Client as HttpClient
 from django.urls import reverse
 
+from salon_core.application.change_feed import SalonChangeFeed
 from salon_core.application.repositories.json_repository import JsonSalonRepository
 from salon_core.application.service import SalonAppService
 from salon_core.entities.inventory.cosmetics import Cosmetics
 from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_core.entities.management.client import Client
 from salon_core.entities.management.master import Master
 from salon_core.entities.salon import Salon
 from salon_core.entities.services.cosmetic_procedure import CosmeticProcedure
 from salon_core.entities.services.hair_service import HairService
 from salon_core.utils.booking_status import BookingStatus
+from salon_core.utils.data_manager import SalonDataManager
+from salon_web import models
+from salon_web.app_service import get_app_service, registry
+from salon_web.jobs import get_job_runner
+from salon_web.orm_repository import OrmSalonRepository
+from salon_web.profiling import timing_stats
 from salon_core.utils.masters_specialization import MastersSpecialization
 
 
@@ -26,7 +42,7 @@ class SalonWebViewsTestCase(TestCase):
         self._settings_override.enable()
 
         self._seed_data()
-        self.client = Client()
+        self.client = HttpClient()
 
     def tearDown(self) -> None:
         self._settings_override.disable()
@@ -226,3 +242,562 @@ class SalonWebViewsTestCase(TestCase):
         statuses = {booking.get_status() for booking in history}
         assert BookingStatus.DONE in statuses
         assert BookingStatus.CANCELLED in statuses
+
+    def test_bookings_page_searches_client_names(self) -> None:
+        for client_name in ("Anna Smith", "John Smithson", "Mary Jones"):
+            self.client.post(
+                reverse("bookings"),
+                {
+                    "action": "create",
+                    "client_name": client_name,
+                    "client_age": 20,
+                    "master_index": "0",
+                    "service_index": "0",
+                },
+            )
+
+        response = self.client.get(reverse("bookings"), {"q": "smi"})
+        assert response.status_code == 200
+        assert [
+            booking.get_client().get_name() for booking in response.context["search_results"]
+        ] == ["Anna Smith", "John Smithson"]
+
+        all_response = self.client.get(reverse("bookings"))
+        assert all_response.context["search_results"] is None
+
+    def test_finance_export_streams_filtered_history(self) -> None:
+        self.client.post(
+            reverse("bookings"),
+            {
+                "action": "create",
+                "client_name": "Client One",
+                "client_age": 20,
+                "master_index": "1",
+                "service_index": "1",
+            },
+        )
+        self.client.post(reverse("bookings"), {"action": "cancel", "booking_index": "0"})
+
+        response = self.client.get(
+            reverse("finance_export"),
+            {"format": "csv", "status": ["Done", "Cancelled"]},
+        )
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].startswith("client_name")
+        assert lines[1].startswith("Client One")
+        assert lines[1].endswith("Cancelled")
+
+        invalid_response = self.client.get(reverse("finance_export"), {"format": "xml"})
+        assert invalid_response.status_code == 302
+
+    def test_timed_booking_rejects_double_booking(self) -> None:
+        booking_data = {
+            "action": "create",
+            "client_name": "Client One",
+            "client_age": 20,
+            "master_index": "0",
+            "service_index": "0",
+            "start_time": "2026-03-02T10:00",
+            "duration_minutes": 60,
+        }
+        first_response = self.client.post(reverse("bookings"), booking_data)
+        assert first_response.status_code == 302
+
+        booking_data["client_name"] = "Client Two"
+        booking_data["start_time"] = "2026-03-02T10:30"
+        second_response = self.client.post(reverse("bookings"), booking_data)
+        assert second_response.status_code == 200
+
+        bookings = self._app_service().list_bookings()
+        assert len(bookings) == 1
+        assert bookings[0].get_start().hour == 10
+
+    def test_booking_form_rejects_ineligible_master(self) -> None:
+        response = self.client.get(reverse("bookings"))
+        assert response.context["eligible"] == {"0": [0], "1": [1]}
+
+        invalid_response = self.client.post(
+            reverse("bookings"),
+            {
+                "action": "create",
+                "client_name": "Client One",
+                "client_age": 20,
+                "master_index": "1",
+                "service_index": "0",
+            },
+        )
+        assert invalid_response.status_code == 200
+        assert invalid_response.context["create_form"].errors
+        assert self._app_service().list_bookings() == []
+
+    def test_each_page_parses_salon_file_once(self) -> None:
+        original_load = SalonDataManager.load
+        for name in ["dashboard", "staff", "inventory", "services", "bookings", "finance"]:
+            # Once on a cold cache, then not at all while the file is unchanged.
+            registry.reset()
+            for expected_loads in (1, 0):
+                with mock.patch.object(
+                    SalonDataManager,
+                    "load",
+                    autospec=True,
+                    side_effect=original_load,
+                ) as load_mock:
+                    response = self.client.get(reverse(name))
+                assert response.status_code == 200
+                assert load_mock.call_count == expected_loads, name
+
+    def test_service_registry_reuses_cached_salon_between_requests(self) -> None:
+        assert get_app_service() is get_app_service()
+
+        self.client.get(reverse("dashboard"))
+        with mock.patch.object(
+            SalonDataManager,
+            "load",
+            autospec=True,
+            side_effect=SalonDataManager.load,
+        ) as load_mock:
+            self.client.get(reverse("staff"))
+            self.client.get(reverse("bookings"))
+        assert load_mock.call_count == 0
+
+        self._app_service().hire_master("Outside", 30, "Cosmetics master")
+        with mock.patch.object(
+            SalonDataManager,
+            "load",
+            autospec=True,
+            side_effect=SalonDataManager.load,
+        ) as load_mock:
+            response = self.client.get(reverse("staff"))
+        assert load_mock.call_count == 1
+        assert len(response.context["staff"]) == 3
+
+    @override_settings(SALON_LIVE_STREAM_SECONDS=5, SALON_LIVE_KEEPALIVE_SECONDS=1)
+    def test_dashboard_events_push_only_changes(self) -> None:
+        response = self.client.get(reverse("dashboard_events"))
+        assert response["Content-Type"] == "text/event-stream"
+        stream = iter(response.streaming_content)
+
+        assert next(stream).startswith(b"retry:")
+        snapshot = next(stream).decode()
+        assert snapshot.startswith("id: 0\nevent: snapshot\n")
+        assert '"staff_count":2' in snapshot
+
+        self.client.post(
+            reverse("bookings"),
+            {
+                "action": "create",
+                "client_name": "John",
+                "client_age": 30,
+                "master_index": 0,
+                "service_index": 0,
+            },
+        )
+        change = next(stream).decode()
+        assert change.startswith("id: 1\nevent: change\n")
+        data = json.loads(change.split("data: ", 1)[1])
+        assert data["stats"] == {"bookings_total": 1, "bookings_confirmed": 1}
+        assert [row["client_name"] for row in data["new_bookings"]] == ["John"]
+        response.close()
+
+    def test_dashboard_events_recount_sees_writes_after_the_stream_opened(self) -> None:
+        response = self.client.get(reverse("dashboard_events"))
+        stream = iter(response.streaming_content)
+        next(stream)
+        assert '"staff_count":2' in next(stream).decode()
+
+        self._app_service().hire_master("Outside", 30, "Cosmetics master")
+        # The feed lost its history, so the stream sends a fresh snapshot.
+        with mock.patch.object(SalonChangeFeed, "wait_for_events", return_value=None):
+            snapshot = next(stream).decode()
+        assert snapshot.startswith("id: 0\nevent: snapshot\n")
+        assert '"staff_count":3' in snapshot
+        response.close()
+
+    def test_dashboard_events_resync_unknown_event_id(self) -> None:
+        response = self.client.get(
+            reverse("dashboard_events"),
+            HTTP_LAST_EVENT_ID="42",
+        )
+        stream = iter(response.streaming_content)
+        next(stream)
+        assert b"event: snapshot" in next(stream)
+        response.close()
+
+    def test_table_fragments_render_once_per_section_version(self) -> None:
+        cache.clear()
+        self.client.get(reverse("staff"))
+        with mock.patch.object(Master, "get_age", autospec=True, return_value=1) as age_mock:
+            self.client.get(reverse("staff"))
+        assert age_mock.call_count == 0
+
+        self.client.post(reverse("inventory"), {"action": "sell", "name": "Serum", "quantity": 1})
+        with mock.patch.object(Master, "get_age", autospec=True, return_value=1) as age_mock:
+            self.client.get(reverse("staff"))
+        assert age_mock.call_count == 0
+
+        self.client.post(
+            reverse("staff"),
+            {"action": "hire", "name": "Nina", "age": 31, "specialization": "Cosmetics master"},
+        )
+        assert b"Nina" in self.client.get(reverse("staff")).content
+
+        self._app_service().hire_master("Outside", 30, "Cosmetics master")
+        assert b"Outside" in self.client.get(reverse("staff")).content
+
+    def test_loadtest_command_reports_views_without_touching_data(self) -> None:
+        original = self._data_path.read_bytes()
+        output = StringIO()
+        call_command(
+            "loadtest",
+            requests=30,
+            workers=3,
+            mix="dashboard=2,api_bookings=1,create_booking=1",
+            seed=7,
+            json=True,
+            stdout=output,
+        )
+        report = json.loads(output.getvalue())
+
+        assert report["requests"] == 30
+        assert set(report["views"]) == {"dashboard", "api_bookings", "create_booking"}
+        assert report["views"]["create_booking"]["errors"] == 0
+        assert report["views"]["dashboard"]["p99_ms"] >= report["views"]["dashboard"]["p50_ms"]
+        assert self._data_path.read_bytes() == original
+
+        with self.assertRaises(CommandError):
+            call_command("loadtest", mix="checkout=1", stdout=StringIO())
+
+    def test_server_timing_header_and_stats_page(self) -> None:
+        timing_stats.reset()
+        response = self.client.get(reverse("staff"))
+        phases = {
+            metric.split(";")[0].strip()
+            for metric in response["Server-Timing"].split(",")
+        }
+        assert {"view", "service", "load", "action", "render"} <= phases
+
+        response = self.client.post(
+            reverse("staff"),
+            {"action": "hire", "name": "Nina", "age": 31, "specialization": "Cosmetics master"},
+        )
+        assert "save;dur=" in response["Server-Timing"]
+
+        assert self.client.get(reverse("timing_stats")).status_code == 404
+        with override_settings(DEBUG=True):
+            response = self.client.get(reverse("timing_stats"))
+        assert response.status_code == 200
+        rows = {row["view"]: row["cells"] for row in response.context["rows"]}
+        assert rows["staff"][0]["count"] == 2
+
+    def test_background_export_job(self) -> None:
+        self._app_service().create_booking("Client One", 20, 0, 0)
+        response = self.client.post(reverse("api_jobs"), {"kind": "export", "format": "jsonl"})
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        get_job_runner().wait(job_id, timeout=10)
+        status = self.client.get(reverse("api_job", args=[job_id])).json()
+        assert status["status"] == "done"
+
+        result = self.client.get(status["result_url"])
+        assert result["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(result.streaming_content).splitlines()]
+        assert [row["client_name"] for row in rows] == ["Client One"]
+
+        assert self.client.get(reverse("api_job", args=["missing"])).status_code == 404
+        response = self.client.post(reverse("api_jobs"), {"kind": "export", "format": "xml"})
+        assert response.status_code == 400
+
+    def test_background_booking_import_reports_bad_rows(self) -> None:
+        upload = SimpleUploadedFile(
+            "bookings.csv",
+            (
+                "client_name,client_age,master_name,master_specialization,service_name,"
+                "start,end,status\n"
+                "Gleb,50,Alex,Hair cutting master,Haircut,"
+                "2026-03-02T10:00:00,2026-03-02T11:00:00,Cancelled\n"
+                "Anna,30,Alex,Hair cutting master,Haircut,"
+                "2026-03-02T10:00:00,2026-03-02T11:00:00,\n"
+                "Boris,40,Alex,Hair cutting master,Haircut,"
+                "2026-03-02T10:30:00,2026-03-02T11:30:00,Confirmed\n"
+                "Vera,22,Nobody,Cosmetics master,Facial,,,\n"
+                "Dina,35,Alex,Hair cutting master,Haircut,"
+                "2026-03-01T10:00:00,2026-03-01T11:00:00,Done\n"
+            ).encode(),
+        )
+        balance = self._app_service().get_balance()
+        with mock.patch.object(
+            SalonDataManager,
+            "save",
+            autospec=True,
+            side_effect=SalonDataManager.save,
+        ) as save:
+            response = self.client.post(
+                reverse("api_jobs"),
+                {"kind": "import_bookings", "file": upload},
+            )
+            job = get_job_runner().wait(response.json()["id"], timeout=10)
+        assert save.call_count == 1
+
+        report = json.loads(job.result_path.read_bytes())
+        assert report["created"] == 3
+        assert [error["line"] for error in report["errors"]] == [3, 4]
+        bookings = self._app_service().list_bookings()
+        assert [(b.get_client().get_name(), b.get_status()) for b in bookings] == [
+            ("Gleb", BookingStatus.CANCELLED),
+            ("Anna", BookingStatus.CONFIRMED),
+            ("Dina", BookingStatus.DONE),
+        ]
+        assert self._app_service().get_balance() == balance
+
+    def test_unchanged_pages_answer_not_modified(self) -> None:
+        # the first form page hands out the CSRF cookie the validators depend on
+        self.client.get(reverse("staff"))
+        for name in ["dashboard", "staff", "inventory", "services", "finance"]:
+            first_response = self.client.get(reverse(name))
+            assert first_response.status_code == 200
+            etag = first_response["ETag"]
+            assert "no-cache" in first_response["Cache-Control"]
+
+            with mock.patch.object(SalonDataManager, "load") as load_mock:
+                cached_response = self.client.get(
+                    reverse(name),
+                    HTTP_IF_NONE_MATCH=etag,
+                )
+            assert cached_response.status_code == 304, name
+            assert load_mock.call_count == 0
+
+        response = self.client.get(reverse("dashboard"))
+        etag = response["ETag"]
+        self.client.post(
+            reverse("inventory"),
+            {"action": "sell", "name": "Serum", "quantity": 1},
+        )
+        changed_response = self.client.get(reverse("dashboard"), HTTP_IF_NONE_MATCH=etag)
+        assert changed_response.status_code == 200
+
+        next_response = self.client.get(reverse("dashboard"), HTTP_IF_NONE_MATCH=etag)
+        assert next_response.status_code == 200
+        assert next_response["ETag"] != etag
+
+    def test_pending_message_disables_not_modified(self) -> None:
+        response = self.client.get(reverse("finance"))
+        etag = response["ETag"]
+
+        redirect_response = self.client.get(reverse("finance_export"), {"format": "xml"})
+        assert redirect_response.status_code == 302
+
+        response = self.client.get(reverse("finance"), HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert "Unsupported export format" in response.content.decode()
+
+
+class SalonApiTestCase(TestCase):
+    def setUp(self) -> None:
+        local_tmp_dir = Path(__file__).resolve().parent / ".tmp"
+        local_tmp_dir.mkdir(exist_ok=True)
+        self._data_path = local_tmp_dir / f"salon_api_test_{uuid4().hex}.json"
+
+        self._settings_override = override_settings(SALON_DATA_PATH=self._data_path)
+        self._settings_override.enable()
+
+        self._seed_data()
+        self.client = HttpClient()
+
+    def tearDown(self) -> None:
+        self._settings_override.disable()
+        if self._data_path.exists():
+            self._data_path.unlink()
+
+    def _seed_data(self) -> None:
+        salon = Salon("BEST SALON")
+        scissors = HairdressingEquipment("Scissors", "Steel", 5)
+        haircut = HairService("Haircut", 15.0, [scissors])
+        salon.add_to_inventory(scissors)
+        salon.add_service(haircut)
+
+        for i in range(5):
+            salon.hire_staff(Master(f"Master {i}", 30, MastersSpecialization.HAIR_CUTTING))
+        master = salon.get_staff()[0]
+        for i in range(7):
+            booking = salon.make_booking(Client(f"Client {i}", 20 + i), master, haircut)
+            if i % 2:
+                salon.cancel_booking(booking)
+
+        JsonSalonRepository(str(self._data_path)).save(salon)
+
+    def test_cursor_pagination_walks_collection(self) -> None:
+        names = []
+        params = {"limit": 2}
+        while True:
+            response = self.client.get(reverse("api_staff"), params)
+            assert response.status_code == 200
+            payload = response.json()
+            names.extend(row["name"] for row in payload["results"])
+            if payload["next"] is None:
+                break
+            params["cursor"] = payload["next"]
+
+        assert names == [f"Master {i}" for i in range(5)]
+
+    def test_field_selection_and_status_filter(self) -> None:
+        response = self.client.get(
+            reverse("api_bookings"),
+            {"status": "cancelled", "fields": "id,client_name"},
+        )
+        payload = response.json()
+
+        assert payload["results"] == [
+            {"id": 1, "client_name": "Client 1"},
+            {"id": 3, "client_name": "Client 3"},
+            {"id": 5, "client_name": "Client 5"},
+        ]
+        assert b", " not in response.content
+
+    def test_other_endpoints(self) -> None:
+        services = self.client.get(reverse("api_services")).json()["results"]
+        assert services[0]["eligible_master_ids"] == [0, 1, 2, 3, 4]
+
+        inventory = self.client.get(reverse("api_inventory")).json()["results"]
+        assert inventory == [
+            {
+                "id": 0,
+                "type": "Equipment",
+                "name": "Scissors",
+                "description": "Steel",
+                "amount": 5,
+                "price": None,
+            }
+        ]
+
+        dashboard = self.client.get(reverse("api_dashboard")).json()
+        assert dashboard["bookings_total"] == 7
+        assert dashboard["bookings_cancelled"] == 3
+
+    def test_invalid_parameters_return_bad_request(self) -> None:
+        for params in (
+            {"limit": "0"},
+            {"limit": "many"},
+            {"cursor": "!!"},
+            {"fields": "name,password"},
+            {"status": "Lost"},
+        ):
+            response = self.client.get(reverse("api_bookings"), params)
+            assert response.status_code == 400, params
+            assert "error" in response.json()
+
+        assert self.client.post(reverse("api_staff")).status_code == 405
+
+
+class SalonOrmStorageTestCase(TestCase):
+    def setUp(self) -> None:
+        self._settings_override = override_settings(SALON_STORAGE="orm")
+        self._settings_override.enable()
+        self.client = HttpClient()
+
+    def tearDown(self) -> None:
+        self._settings_override.disable()
+        registry.reset()
+
+    def _build_salon(self) -> Salon:
+        salon = Salon("ORM SALON")
+        serum = Cosmetics("Serum", 20.0, "Hydrating", 10)
+        scissors = HairdressingEquipment("Scissors", "Steel", 5)
+        salon.add_to_inventory(serum)
+        salon.add_to_inventory(scissors)
+        haircut = HairService("Haircut", 15.0, [scissors])
+        facial = CosmeticProcedure("Facial", 30.0, [serum])
+        salon.add_service(haircut)
+        salon.add_service(facial)
+        alex = Master("Alex", 28, MastersSpecialization.HAIR_CUTTING)
+        liza = Master("Liza", 26, MastersSpecialization.COSMETICS)
+        salon.hire_staff(alex)
+        salon.hire_staff(liza)
+
+        salon.make_booking(
+            Client("Anna", 30),
+            alex,
+            haircut,
+            datetime(2026, 3, 2, 10, 0),
+            datetime(2026, 3, 2, 11, 0),
+        )
+        cancelled = salon.make_booking(Client("Boris", 40), liza, facial)
+        salon.cancel_booking(cancelled)
+        salon.fire_staff(liza)
+        salon.remove_service(facial)
+        return salon
+
+    def test_orm_repository_round_trip(self) -> None:
+        repository = OrmSalonRepository()
+        assert repository.get_version() is None
+
+        salon = self._build_salon()
+        repository.save(salon)
+        first_version = repository.get_version()
+        loaded = repository.load()
+
+        assert loaded.get_name() == "ORM SALON"
+        assert [m.to_dict() for m in loaded.get_staff()] == [
+            m.to_dict() for m in salon.get_staff()
+        ]
+        assert [s.to_dict() for s in loaded.get_services()] == [
+            s.to_dict() for s in salon.get_services()
+        ]
+        assert [b.to_dict() for b in loaded.get_all_bookings()] == [
+            b.to_dict() for b in salon.get_all_bookings()
+        ]
+        assert loaded.get_all_bookings()[0].get_master() is loaded.get_staff()[0]
+
+        repository.save(loaded)
+        assert repository.get_version() != first_version
+        assert models.Master.objects.filter(employed=False).count() == 1
+
+    def test_pages_and_api_use_database_storage(self) -> None:
+        OrmSalonRepository().save(self._build_salon())
+
+        response = self.client.post(
+            reverse("bookings"),
+            {
+                "action": "create",
+                "client_name": "Vera",
+                "client_age": 22,
+                "master_index": "0",
+                "service_index": "0",
+            },
+        )
+        assert response.status_code == 302
+        assert models.Booking.objects.count() == 3
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("api_bookings"),
+                {"status": "confirmed", "limit": 1},
+            )
+        payload = response.json()
+        assert payload["results"][0]["client_name"] == "Anna"
+        assert payload["results"][0]["start"] == "2026-03-02T10:00:00"
+
+        response = self.client.get(
+            reverse("api_bookings"),
+            {"status": "confirmed", "cursor": payload["next"]},
+        )
+        assert [row["id"] for row in response.json()["results"]] == [2]
+
+    def test_import_salon_json_command(self) -> None:
+        local_tmp_dir = Path(__file__).resolve().parent / ".tmp"
+        local_tmp_dir.mkdir(exist_ok=True)
+        data_path = local_tmp_dir / f"salon_import_{uuid4().hex}.json"
+        JsonSalonRepository(str(data_path)).save(self._build_salon())
+
+        try:
+            output = StringIO()
+            call_command("import_salon_json", str(data_path), stdout=output)
+        finally:
+            data_path.unlink()
+
+        assert "1 masters" in output.getvalue()
+        assert get_app_service().get_salon_name() == "ORM SALON"
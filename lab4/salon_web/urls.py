@@ -1,6 +1,6 @@
 ﻿from django.urls import path
 
-from salon_web import views
+from salon_web import api, views
 
 urlpatterns = [
     path("", views.dashboard_view, name="dashboard"),
@@ -9,4 +9,15 @@ urlpatterns = [
     path("services/", views.services_view, name="services"),
     path("bookings/", views.bookings_view, name="bookings"),
     path("finance/", views.finance_view, name="finance"),
+    path("finance/export/", views.finance_export_view, name="finance_export"),
+    path("stats/timing/", views.timing_stats_view, name="timing_stats"),
+    path("events/dashboard/", views.dashboard_events_view, name="dashboard_events"),
+    path("api/dashboard/", api.dashboard_api, name="api_dashboard"),
+    path("api/staff/", api.staff_api, name="api_staff"),
+    path("api/inventory/", api.inventory_api, name="api_inventory"),
+    path("api/services/", api.services_api, name="api_services"),
+    path("api/bookings/", api.bookings_api, name="api_bookings"),
+    path("api/jobs/", api.submit_job_api, name="api_jobs"),
+    path("api/jobs/<str:job_id>/", api.job_status_api, name="api_job"),
+    path("api/jobs/<str:job_id>/result/", api.job_result_view, name="api_job_result"),
 ]
@@ -1,12 +1,27 @@
-﻿from django.conf import settings
+﻿import hashlib
+import json
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import redirect, render
+from django.utils import timezone
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
 
 from salon_core.application.errors import AppServiceError
-from salon_core.application.repositories.json_repository import JsonSalonRepository
-from salon_core.application.service import SalonAppService
+from salon_core.application.timing import timed
 from salon_core.entities.inventory.cosmetics import Cosmetics
 from salon_core.entities.inventory.hairdressing_equipment import HairdressingEquipment
+from salon_web.app_service import (
+    get_app_service,
+    get_change_feed,
+    get_dashboard_counters,
+    get_request_service,
+)
 from salon_web.forms import (
     AddServiceForm,
     BookingActionForm,
@@ -18,24 +33,138 @@ from salon_web.forms import (
     RestockItemForm,
     SellProductForm,
 )
+from salon_web.profiling import TIMING_PHASES, timing_stats
 
+BOOKINGS_PER_PAGE = 50
+BOOKING_SEARCH_LIMIT = 50
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+
+def _can_revalidate(request) -> bool:
+    # A pending flash message must be rendered, so never answer 304 then.
+    return len(messages.get_messages(request)) == 0
+
+
+def _salon_etag(request, *args, **kwargs) -> str | None:
+    if not _can_revalidate(request):
+        return None
+    version = get_app_service().get_data_version()
+    if version is None:
+        return None
+    # Cached pages embed a CSRF token, so tie them to the CSRF cookie too.
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, "")
+    csrf_digest = hashlib.sha1(csrf_cookie.encode()).hexdigest()[:8]
+    return f"{version}-{csrf_digest}"
+
+
+def _salon_last_modified(request, *args, **kwargs) -> datetime | None:
+    if not _can_revalidate(request) or settings.CSRF_COOKIE_NAME not in request.COOKIES:
+        return None
+    return get_app_service().get_last_modified()
 
-def _get_app_service() -> SalonAppService:
-    repository = JsonSalonRepository(
-        file_path=str(settings.SALON_DATA_PATH),
-        default_salon_name="BEST SALON",
-    )
-    return SalonAppService(repository)
 
+def _render(request, template_name: str, context: dict):
+    with timed("render"):
+        return render(request, template_name, context)
 
+
+def _section_versions(app_service, *sections: str) -> dict[str, str]:
+    return {section: app_service.get_section_version(section) for section in sections}
+
+
+def salon_page(view):
+    """Answers unchanged GETs with 304 before the view loads any data."""
+    conditional_view = condition(
+        etag_func=_salon_etag,
+        last_modified_func=_salon_last_modified,
+    )(view)
+    return cache_control(private=True, no_cache=True)(conditional_view)
+
+
+def _booking_time_range(cleaned_data: dict) -> tuple[datetime | None, datetime | None]:
+    start = cleaned_data.get("start_time")
+    if start is None:
+        return None, None
+    if timezone.is_aware(start):
+        start = timezone.make_naive(start)
+    return start, start + timedelta(minutes=cleaned_data["duration_minutes"])
+
+
+@salon_page
 def dashboard_view(request):
-    app_service = _get_app_service()
-    context = {"stats": app_service.get_dashboard_stats()}
-    return render(request, "salon_web/dashboard.html", context)
+    app_service = get_request_service(request)
+    context = {"stats": get_dashboard_counters().get(app_service)}
+    return _render(request, "salon_web/dashboard.html", context)
+
+
+def _sse_message(event: str, seq: int, payload: dict) -> str:
+    data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return f"id: {seq}\nevent: {event}\ndata: {data}\n\n"
+
 
+def _last_event_id(request) -> int | None:
+    raw_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        return int(raw_id) if raw_id is not None else None
+    except ValueError:
+        return None
 
+
+@require_GET
+def dashboard_events_view(request):
+    """
+    Server-sent events with dashboard changes. Every commit is diffed once
+    by the change feed; this stream only waits for finished events. The
+    stream ends after SALON_LIVE_STREAM_SECONDS and the browser reconnects
+    with Last-Event-ID, so no worker is held forever.
+    """
+    change_feed = get_change_feed()
+    # Not the request snapshot: the stream outlives it, and a snapshot
+    # recounted mid-stream must see the salon as it is now.
+    app_service = get_app_service()
+    last_seq = _last_event_id(request)
+
+    def stream():
+        seq = last_seq
+        yield f"retry: {settings.SALON_LIVE_RETRY_MS}\n\n"
+        deadline = time.monotonic() + settings.SALON_LIVE_STREAM_SECONDS
+        while True:
+            events = None if seq is None else change_feed.wait_for_events(
+                seq,
+                timeout=min(
+                    settings.SALON_LIVE_KEEPALIVE_SECONDS,
+                    max(deadline - time.monotonic(), 0),
+                ),
+            )
+            if events is None:
+                seq, stats = change_feed.snapshot(app_service)
+                yield _sse_message("snapshot", seq, {"stats": stats})
+            elif events:
+                for event in events:
+                    yield _sse_message(
+                        "change",
+                        event.seq,
+                        {"stats": event.stats, "new_bookings": event.new_bookings},
+                    )
+                seq = events[-1].seq
+            else:
+                yield ": keepalive\n\n"
+            if time.monotonic() >= deadline:
+                return
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@salon_page
 def staff_view(request):
-    app_service = _get_app_service()
+    app_service = get_request_service(request)
     staff = app_service.list_staff()
 
     hire_form = HireMasterForm()
@@ -65,32 +194,37 @@ def staff_view(request):
 
     context = {
         "staff": staff,
+        "section_versions": _section_versions(app_service, "staff"),
         "hire_form": hire_form,
         "fire_form": fire_form,
     }
-    return render(request, "salon_web/staff.html", context)
+    return _render(request, "salon_web/staff.html", context)
 
 
+@salon_page
 def inventory_view(request):
-    app_service = _get_app_service()
-    inventory = app_service.list_inventory()
-    inventory_rows = []
-    for item in inventory:
-        if isinstance(item, Cosmetics):
-            item_type = "Cosmetics"
-            price = item.get_price()
-        else:
-            item_type = "Equipment"
-            price = None
-        inventory_rows.append(
-            {
-                "name": item.get_name(),
-                "description": item.get_description(),
-                "amount": item.get_amount(),
-                "type": item_type,
-                "price": price,
-            }
-        )
+    app_service = get_request_service(request)
+
+    def inventory_rows() -> list[dict]:
+        # Called by the template only when the table fragment isn't cached.
+        rows = []
+        for item in app_service.list_inventory():
+            if isinstance(item, Cosmetics):
+                item_type = "Cosmetics"
+                price = item.get_price()
+            else:
+                item_type = "Equipment"
+                price = None
+            rows.append(
+                {
+                    "name": item.get_name(),
+                    "description": item.get_description(),
+                    "amount": item.get_amount(),
+                    "type": item_type,
+                    "price": price,
+                }
+            )
+        return rows
 
     sell_form = SellProductForm()
     restock_form = RestockItemForm()
@@ -136,16 +270,18 @@ def inventory_view(request):
 
     context = {
         "inventory_rows": inventory_rows,
+        "section_versions": _section_versions(app_service, "inventory"),
         "balance": app_service.get_balance(),
         "sell_form": sell_form,
         "restock_form": restock_form,
         "create_form": create_form,
     }
-    return render(request, "salon_web/inventory.html", context)
+    return _render(request, "salon_web/inventory.html", context)
 
 
+@salon_page
 def services_view(request):
-    app_service = _get_app_service()
+    app_service = get_request_service(request)
 
     services = app_service.list_services()
     inventory = app_service.list_inventory()
@@ -196,23 +332,26 @@ def services_view(request):
 
     context = {
         "services": services,
+        "section_versions": _section_versions(app_service, "services"),
         "equipment": equipment,
         "cosmetics": cosmetics,
         "add_form": add_form,
         "remove_form": remove_form,
     }
-    return render(request, "salon_web/services.html", context)
+    return _render(request, "salon_web/services.html", context)
 
 
 def bookings_view(request):
-    app_service = _get_app_service()
+    app_service = get_request_service(request)
 
     staff = app_service.list_staff()
     services = app_service.list_services()
+    eligible = app_service.get_eligible_staff_indexes()
     all_bookings = app_service.list_bookings()
     confirmed_bookings = app_service.list_confirmed_bookings()
+    query = request.GET.get("q", "").strip()
 
-    create_form = CreateBookingForm(staff=staff, services=services)
+    create_form = CreateBookingForm(staff=staff, services=services, eligible=eligible)
     execute_form = BookingActionForm(bookings=confirmed_bookings)
     cancel_form = BookingActionForm(bookings=confirmed_bookings)
 
@@ -220,13 +359,21 @@ def bookings_view(request):
         action = request.POST.get("action")
         try:
             if action == "create":
-                create_form = CreateBookingForm(request.POST, staff=staff, services=services)
+                create_form = CreateBookingForm(
+                    request.POST,
+                    staff=staff,
+                    services=services,
+                    eligible=eligible,
+                )
                 if create_form.is_valid():
+                    start, end = _booking_time_range(create_form.cleaned_data)
                     app_service.create_booking(
                         client_name=create_form.cleaned_data["client_name"],
                         client_age=create_form.cleaned_data["client_age"],
                         master_index=int(create_form.cleaned_data["master_index"]),
                         service_index=int(create_form.cleaned_data["service_index"]),
+                        start=start,
+                        end=end,
                     )
                     messages.success(request, "Booking has been created.")
                     return redirect("bookings")
@@ -246,19 +393,65 @@ def bookings_view(request):
             messages.error(request, str(error))
 
     context = {
-        "all_bookings": all_bookings,
+        "eligible": {str(index): masters for index, masters in eligible.items()},
+        "bookings_page": Paginator(all_bookings, BOOKINGS_PER_PAGE).get_page(
+            request.GET.get("page")
+        ),
+        "query": query,
+        "search_results": (
+            app_service.search_bookings(query, BOOKING_SEARCH_LIMIT) if query else None
+        ),
+        "section_versions": _section_versions(app_service, "bookings"),
         "confirmed_bookings": confirmed_bookings,
         "create_form": create_form,
         "execute_form": execute_form,
         "cancel_form": cancel_form,
     }
-    return render(request, "salon_web/bookings.html", context)
+    return _render(request, "salon_web/bookings.html", context)
 
 
+@salon_page
 def finance_view(request):
-    app_service = _get_app_service()
+    app_service = get_request_service(request)
     context = {
         "balance": app_service.get_balance(),
-        "history": app_service.get_booking_history(),
+        "history": app_service.get_booking_history,
+        "section_versions": _section_versions(app_service, "bookings"),
     }
-    return render(request, "salon_web/finance.html", context)
+    return _render(request, "salon_web/finance.html", context)
+
+
+def finance_export_view(request):
+    app_service = get_request_service(request)
+    export_format = request.GET.get("format", "csv").strip().lower()
+    statuses = request.GET.getlist("status") or None
+
+    try:
+        lines = app_service.export_bookings(export_format, statuses)
+    except AppServiceError as error:
+        messages.error(request, str(error))
+        return redirect("finance")
+
+    response = StreamingHttpResponse(
+        lines,
+        content_type=EXPORT_CONTENT_TYPES[export_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="bookings.{export_format}"'
+    )
+    return response
+
+
+def timing_stats_view(request):
+    """Per-view phase timings collected by ServerTimingMiddleware."""
+    if not (settings.DEBUG or request.user.is_staff):
+        raise Http404
+    if request.method == "POST":
+        timing_stats.reset()
+        return redirect("timing_stats")
+    rows = [
+        {"view": view_name, "cells": [phases.get(phase) for phase in TIMING_PHASES]}
+        for view_name, phases in timing_stats.summary().items()
+    ]
+    context = {"phases": TIMING_PHASES, "rows": rows}
+    return _render(request, "salon_web/timing_stats.html", context)